@@ -0,0 +1,182 @@
+"""End-to-end benchmark of the app's data pipeline on synthetic catalogs.
+
+    python benchmark.py --rows 1000 100000 1000000 --seed 0 --output bench.jsonl
+
+Each stage is timed on its own, in the order the app runs them, on a catalog
+from synthetic.generate_catalog:
+
+    construction     raw records -> normalized, Name-indexed frame (catalog.load_catalog)
+    derived columns  CPU/GPU taxonomy columns (catalog.add_derived_columns)
+    dedup            canonical IDs of near-duplicate listings (dedup.canonical_ids)
+    compaction       categorical/downcast storage (catalog.compact_catalog)
+    filter index     per-catalog bitmaps and presorted ranges (filter_index.FilterIndex)
+    filter mask      one sidebar selection (query.select_positions)
+    search index     inverted word and trigram indexes (search.TextIndex)
+    text search      one search-box query within the filtered rows
+    score matrix     normalized custom-score features (scoring.SpecScorer)
+    custom score     user-weighted score of the filtered rows (one matrix-vector product)
+    value score      Price / Spec Score over the filtered rows
+    sorting          default table order of the filtered rows (table.SortIndex)
+    pareto frontier  5-D skyline of the filtered rows (skyline.skyline)
+    top picks        10 best-value matches by partial selection (ranking.top_picks)
+    plot payload     the chart the app would draw, serialized to JSON
+    csv export       the filtered rows as CSV bytes (export.export_bytes)
+
+Timings are the best of --repeat runs. Peak memory is measured in a separate
+traced run with tracemalloc, so tracing overhead does not leak into timings;
+it covers NumPy and Python allocations but not Arrow's own memory pool.
+"""
+import argparse
+import json
+import sys
+import time
+import tracemalloc
+
+from catalog import add_derived_columns, compact_catalog, load_catalog
+from charts import SCATTER_POINT_LIMIT, VALUE_COL, density_figure, scatter_figure
+from dedup import CANONICAL_ID_COL, canonical_ids
+from export import export_bytes
+from filter_index import FilterIndex
+from query import FilterSpec, select_positions
+from ranking import top_picks
+from scoring import DEFAULT_SCORE_WEIGHTS, SpecScorer
+from search import TextIndex
+from skyline import SKYLINE_DIMENSIONS, skyline
+from synthetic import generate_catalog
+from table import DEFAULT_SORT, SORT_OPTIONS, SortIndex
+
+DEFAULT_ROWS = [1_000, 10_000, 100_000, 1_000_000]
+
+# A typical sidebar selection: mid-range budget, 16 GB+, dedicated GPU
+BENCH_SPEC = FilterSpec(
+    min_price=50_000, max_price=150_000, min_score=60,
+    min_ram=16, gpu_types=("Dedicated",), min_vram=4,
+)
+# A typical search-box query, with a typo
+BENCH_QUERY = "nvidai rtx 4060"
+
+
+def measure(func, *args, repeat=1, trace_memory=True):
+    """Runs `func(*args)` and returns (result, best seconds, peak traced bytes or None)."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(*args)
+        best = min(best, time.perf_counter() - start)
+
+    peak = None
+    if trace_memory:
+        tracemalloc.start()
+        try:
+            func(*args)
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+    return result, best, peak
+
+
+def _value_score(frame):
+    frame = frame.copy()
+    frame[VALUE_COL] = frame["Price (Rs)"] / frame["Spec Score"]
+    return frame
+
+
+def _plot_payload(frame):
+    figure = scatter_figure(frame) if len(frame) <= SCATTER_POINT_LIMIT else density_figure(frame)
+    return figure.to_json()
+
+
+def run_benchmark(n_rows, seed=0, repeat=1, trace_memory=True):
+    """Yields one result dict per stage for a synthetic catalog of `n_rows` listings."""
+    raw = generate_catalog(n_rows, seed)
+    sort_keys = SORT_OPTIONS[DEFAULT_SORT]
+
+    def stage(name, func, *args, rows=n_rows):
+        result, seconds, peak = measure(func, *args, repeat=repeat, trace_memory=trace_memory)
+        report = {
+            "rows": n_rows,
+            "stage": name,
+            "stage_rows": rows,
+            "seconds": round(seconds, 6),
+            "rows_per_second": round(rows / seconds) if seconds > 0 else None,
+            "peak_mb": None if peak is None else round(peak / 1e6, 2),
+        }
+        return result, report
+
+    frame, report = stage("construction", load_catalog, raw)
+    yield report
+    del raw
+    frame, report = stage("derived columns", add_derived_columns, frame)
+    yield report
+    frame[CANONICAL_ID_COL], report = stage("dedup", canonical_ids, frame)
+    yield report
+    catalog, report = stage("compaction", compact_catalog, frame)
+    yield report
+    del frame
+
+    index, report = stage("filter index", FilterIndex, catalog)
+    yield report
+    positions, report = stage("filter mask", select_positions, index, BENCH_SPEC)
+    yield report
+    search_index, report = stage("search index", TextIndex, catalog)
+    yield report
+    _, report = stage("text search", search_index.search, BENCH_QUERY, positions, rows=len(positions))
+    yield report
+    del search_index
+
+    matched = len(positions)
+    scorer, report = stage("score matrix", SpecScorer, catalog)
+    yield report
+    _, report = stage("custom score", scorer.scores, DEFAULT_SCORE_WEIGHTS, positions, rows=matched)
+    yield report
+    del scorer
+    filtered, report = stage("value score", _value_score, catalog.iloc[positions], rows=matched)
+    yield report
+    # A fresh SortIndex each run, so the catalog-wide rank is part of the cost
+    _, report = stage("sorting", lambda: SortIndex(catalog).sort(positions, sort_keys), rows=matched)
+    yield report
+    _, report = stage("top picks", top_picks, filtered, 10, rows=matched)
+    yield report
+    _, report = stage("pareto frontier", skyline, filtered, list(SKYLINE_DIMENSIONS), rows=matched)
+    yield report
+    if matched:
+        _, report = stage("plot payload", _plot_payload, filtered, rows=matched)
+        yield report
+    _, report = stage("csv export", export_bytes, filtered, "csv", rows=matched)
+    yield report
+
+
+def format_report(report):
+    throughput = f"{report['rows_per_second']:>14,}" if report["rows_per_second"] else f"{'-':>14}"
+    peak = f"{report['peak_mb']:>10,.1f}" if report["peak_mb"] is not None else f"{'-':>10}"
+    return (
+        f"{report['rows']:>11,}  {report['stage']:<16} {report['stage_rows']:>11,} "
+        f"{report['seconds'] * 1000:>11,.1f} {throughput} {peak}"
+    )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the catalog pipeline on synthetic data.")
+    parser.add_argument("--rows", type=int, nargs="+", default=DEFAULT_ROWS, help="catalog sizes to benchmark")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=1, help="timed runs per stage (best is reported)")
+    parser.add_argument("--no-memory", action="store_true", help="skip the tracemalloc peak-memory runs")
+    parser.add_argument("--output", help="also write results as JSON Lines to this file")
+    args = parser.parse_args(argv)
+
+    out = open(args.output, "w", encoding="utf-8") if args.output else None
+    print(f"{'catalog':>11}  {'stage':<16} {'stage rows':>11} {'ms':>11} {'rows/s':>14} {'peak MB':>10}")
+    try:
+        for n_rows in args.rows:
+            for report in run_benchmark(n_rows, args.seed, args.repeat, trace_memory=not args.no_memory):
+                print(format_report(report), flush=True)
+                if out is not None:
+                    out.write(json.dumps(report) + "\n")
+    finally:
+        if out is not None:
+            out.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,307 @@
+"""Catalog loading: reads laptop listings from a source and builds the indexed frame."""
+import hashlib
+import json
+import os
+
+import numpy as np
+import pandas as pd
+
+from dedup import CANONICAL_ID_COL, canonical_ids, clean_names
+from laptop_data import LAPTOP_DATA_INR
+from pricing import parse_prices
+from taxonomy import parse_cpu, parse_gpu
+from tracing import NULL_TRACER
+
+# -----------------------------------------------------------
+# Schema
+# -----------------------------------------------------------
+# Source field -> display column used throughout the app
+DEFAULT_FIELD_MAP = {
+    "name": "Name",
+    "brand": "Brand",
+    "os": "OS",
+    "utility": "Utility",
+    "cpu_full": "CPU Full Model",
+    "ram_gb": "RAM (GB)",
+    "storage_gb": "Storage (GB)",
+    "screen_size_in": "Screen (in)",
+    "spec_score": "Spec Score",
+    "price_inr": "Price (Rs)",
+    "gpu_type": "GPU Type",
+    "gpu_vram_gb": "GPU VRAM (GB)",
+}
+
+# Column order for display (Name becomes the index)
+DISPLAY_COLUMNS = [
+    "Name", "Brand", "OS", "Utility", "Price (Rs)", "Spec Score",
+    "CPU Full Model", "RAM (GB)", "Storage (GB)", "GPU Type",
+    "GPU VRAM (GB)", "Screen (in)",
+]
+
+INT_COLUMNS = ["Price (Rs)", "Spec Score", "RAM (GB)", "Storage (GB)", "GPU VRAM (GB)"]
+FLOAT_COLUMNS = ["Screen (in)"]
+
+# Rows missing any of these cannot be placed on the price/performance chart
+REQUIRED_COLUMNS = ["Name", "Price (Rs)", "Spec Score"]
+
+DEFAULT_CHUNKSIZE = 100_000
+
+FORMATS = {
+    ".csv": "csv",
+    ".jsonl": "jsonl",
+    ".ndjson": "jsonl",
+    ".parquet": "parquet",
+    ".pq": "parquet",
+}
+
+
+def detect_format(path):
+    """Infers the feed format from a file extension."""
+    ext = os.path.splitext(str(path))[1].lower()
+    if ext not in FORMATS:
+        raise ValueError(f"Unsupported catalog format '{ext}' for {path}; expected one of {sorted(FORMATS)}")
+    return FORMATS[ext]
+
+
+# -----------------------------------------------------------
+# Chunk readers
+# -----------------------------------------------------------
+# Each reader yields (raw_chunk, total_rows) where total_rows is None when unknown.
+
+def _read_records(records, chunksize):
+    total = len(records)
+    for start in range(0, total, chunksize):
+        yield pd.DataFrame(records[start:start + chunksize]), total
+
+
+def _read_csv(path, chunksize, source_fields):
+    with pd.read_csv(path, chunksize=chunksize, usecols=lambda c: c in source_fields) as reader:
+        for chunk in reader:
+            yield chunk, None
+
+
+def _read_jsonl(path, chunksize, source_fields):
+    with pd.read_json(path, lines=True, chunksize=chunksize, dtype=False) as reader:
+        for chunk in reader:
+            yield chunk[[c for c in chunk.columns if c in source_fields]], None
+
+
+def _read_parquet(path, chunksize, source_fields):
+    try:
+        import pyarrow.parquet as pq
+    except ImportError as exc:
+        raise ImportError("Reading Parquet catalogs requires pyarrow (pip install pyarrow)") from exc
+
+    parquet_file = pq.ParquetFile(path)
+    columns = [c for c in parquet_file.schema_arrow.names if c in source_fields]
+    total = parquet_file.metadata.num_rows
+    for batch in parquet_file.iter_batches(batch_size=chunksize, columns=columns):
+        yield batch.to_pandas(), total
+
+
+READERS = {
+    "csv": _read_csv,
+    "jsonl": _read_jsonl,
+    "parquet": _read_parquet,
+}
+
+
+# -----------------------------------------------------------
+# Normalisation
+# -----------------------------------------------------------
+
+def normalize_chunk(chunk, field_map):
+    """Renames source fields to display columns, coerces types and drops unusable rows."""
+    chunk = chunk.rename(columns=field_map)
+    missing = [c for c in DISPLAY_COLUMNS if c not in chunk.columns]
+    if missing:
+        raise KeyError(f"Catalog source is missing columns: {missing}")
+    chunk = chunk[DISPLAY_COLUMNS]
+    # Vendor pages leave invisible characters (e.g. U+200E) and odd spacing in names
+    chunk = chunk.assign(Name=clean_names(chunk["Name"]).to_numpy())
+
+    numeric = {c: pd.to_numeric(chunk[c], errors="coerce") for c in INT_COLUMNS + FLOAT_COLUMNS}
+    # Vendor feeds ship prices as "₹1.25 Lakh", "65,990", ...; unparseable rows are dropped below
+    numeric["Price (Rs)"] = parse_prices(chunk["Price (Rs)"]).values
+    chunk = chunk.assign(**numeric).dropna(subset=REQUIRED_COLUMNS)
+    # Missing optional specs are treated as "none" (e.g. no dedicated VRAM)
+    chunk = chunk.fillna({c: 0 for c in INT_COLUMNS + FLOAT_COLUMNS})
+    return chunk.astype({**{c: "int64" for c in INT_COLUMNS}, **{c: "float64" for c in FLOAT_COLUMNS}})
+
+
+def iter_raw_chunks(source=None, fmt=None, chunksize=DEFAULT_CHUNKSIZE, field_map=None):
+    """Yields (raw_chunk, total_rows) pairs from a catalog source, before normalization.
+
+    Accepts the same sources as iter_catalog_chunks; only the mapped fields
+    (or already-named display columns) are read from disk.
+    """
+    mapping = {**DEFAULT_FIELD_MAP, **(field_map or {})}
+    if source is None:
+        source = LAPTOP_DATA_INR
+
+    if isinstance(source, (list, tuple, pd.DataFrame)):
+        return _read_records(source, chunksize)
+    reader = READERS[fmt or detect_format(source)]
+    return reader(source, chunksize, set(mapping) | set(DISPLAY_COLUMNS))
+
+
+def iter_catalog_chunks(source=None, fmt=None, chunksize=DEFAULT_CHUNKSIZE, field_map=None):
+    """Yields (normalized_chunk, total_rows) pairs from a catalog source.
+
+    `source` is a list of record dicts (default: the built-in LAPTOP_DATA_INR), a
+    DataFrame of raw records, or a path to a CSV, JSON Lines or Parquet file. `field_map` maps source field names
+    onto display columns and is merged over DEFAULT_FIELD_MAP.
+    """
+    mapping = {**DEFAULT_FIELD_MAP, **(field_map or {})}
+    for raw, total in iter_raw_chunks(source, fmt, chunksize, field_map):
+        yield normalize_chunk(raw, mapping), total
+
+
+def load_catalog(source=None, fmt=None, chunksize=DEFAULT_CHUNKSIZE, field_map=None, progress=None):
+    """Loads a catalog source chunk by chunk into the Name-indexed display frame.
+
+    Only the mapped columns of one raw chunk are held at a time, so peak memory is
+    the normalized output plus a single chunk. `progress(rows_loaded, total_rows)`
+    is called after every chunk; total_rows is None for CSV/JSONL feeds.
+    """
+    chunks = []
+    rows_loaded = 0
+    for chunk, total in iter_catalog_chunks(source, fmt, chunksize, field_map):
+        chunks.append(chunk)
+        rows_loaded += len(chunk)
+        if progress is not None:
+            progress(rows_loaded, total)
+
+    if chunks:
+        frame = pd.concat(chunks, ignore_index=True)
+    else:
+        frame = pd.DataFrame(columns=DISPLAY_COLUMNS)
+    return frame.set_index('Name')
+
+
+# -----------------------------------------------------------
+# Catalog construction
+# -----------------------------------------------------------
+
+def add_derived_columns(frame):
+    """Adds the parsed CPU/GPU columns used by the sidebar filters."""
+    cpu = parse_cpu(frame['CPU Full Model'])
+    gpu = parse_gpu(frame['GPU Type'])
+    frame['CPU Brand'] = cpu['CPU Vendor'].array
+    for parsed in (cpu, gpu):
+        for name in parsed.columns:
+            frame[name] = parsed[name].array
+    frame['GPU Dedicated'] = pd.Categorical(
+        np.where(frame['GPU VRAM (GB)'].to_numpy() > 0, 'Dedicated', 'Integrated'),
+        categories=['Dedicated', 'Integrated'],
+    )
+    return frame
+
+
+# -----------------------------------------------------------
+# Compaction
+# -----------------------------------------------------------
+# String columns whose distinct/total ratio is at or below this become categoricals
+CATEGORY_RATIO = 0.5
+
+
+def _compact_values(values, category_ratio):
+    if values.dtype.kind in "iu":
+        return pd.to_numeric(values, downcast="integer")
+    if values.dtype.kind == "f":
+        return pd.to_numeric(values, downcast="float")
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        return values.cat.remove_unused_categories()
+    if len(values) and values.nunique(dropna=False) <= category_ratio * len(values):
+        return values.astype("category")
+    return values
+
+
+def compact_catalog(frame, category_ratio=CATEGORY_RATIO):
+    """Returns a copy of the catalog with compact column dtypes.
+
+    Low-cardinality string columns (Brand, OS, Utility, GPU Type, ...) become
+    categoricals, integer specs are downcast to the smallest integer type that
+    holds their range (e.g. RAM to int8, Price to int32) and Screen to float32.
+    The Name index follows the same string rule.
+    """
+    columns = {name: _compact_values(frame[name], category_ratio) for name in frame.columns}
+    index = frame.index
+    if not isinstance(index.dtype, pd.CategoricalDtype) and index.nunique() <= category_ratio * len(index):
+        index = pd.CategoricalIndex(index, name=index.name)
+    return pd.DataFrame(columns, index=index)
+
+
+def memory_report(before, after):
+    """Returns bytes per column (and index) before and after compaction."""
+    report = pd.DataFrame({
+        "bytes_before": before.memory_usage(deep=True),
+        "bytes_after": after.memory_usage(deep=True),
+    })
+    report.loc["Total"] = report.sum()
+    report["ratio"] = report["bytes_before"] / report["bytes_after"]
+    report.index.name = "Column"
+    return report
+
+
+def build_catalog(source=None, fmt=None, chunksize=DEFAULT_CHUNKSIZE, field_map=None, progress=None, compact=True,
+                  tracer=NULL_TRACER):
+    """Loads a source and adds the derived columns: the full catalog-construction stage.
+
+    Near-duplicate listings share a value in the CANONICAL_ID_COL column (see dedup).
+    """
+    with tracer.stage("catalog load"):
+        frame = load_catalog(source, fmt, chunksize, field_map, progress)
+    with tracer.stage("derived columns", rows=len(frame)):
+        frame = add_derived_columns(frame)
+    with tracer.stage("dedup", rows=len(frame)):
+        frame[CANONICAL_ID_COL] = canonical_ids(frame)
+    if not compact:
+        return frame
+    with tracer.stage("catalog compaction", rows=len(frame)):
+        return compact_catalog(frame)
+
+
+def catalog_cache_key(source=None, content_hash=False):
+    """Returns a key that changes whenever the catalog source changes.
+
+    File sources are keyed on (path, mtime, size), or on a SHA-256 of the file
+    contents when `content_hash` is set (useful when feeds are re-synced with
+    preserved timestamps). Record lists (such as the built-in data) are keyed
+    on a SHA-256 of their contents, so every process derives the same key.
+    """
+    if source is None:
+        source = LAPTOP_DATA_INR
+    if isinstance(source, (list, tuple)):
+        records = json.dumps(list(source), sort_keys=True, default=str).encode("utf-8")
+        return ("records", hashlib.sha256(records).hexdigest())
+
+    path = os.path.abspath(source)
+    if content_hash:
+        digest = hashlib.sha256()
+        with open(path, "rb") as fh:
+            for block in iter(lambda: fh.read(1 << 20), b""):
+                digest.update(block)
+        return ("sha256", path, digest.hexdigest())
+    stat = os.stat(path)
+    return ("mtime", path, stat.st_mtime_ns, stat.st_size)
+
+
+def freeze_frame(frame):
+    """Returns a copy of a frame whose numeric column buffers are read-only.
+
+    In-place writes into the shared catalog (e.g. `df.loc[name, 'Price (Rs)'] = ...`)
+    then raise instead of silently leaking into every other session. String
+    columns are Arrow-backed and already immutable. Filtering still works as
+    usual and produces ordinary writable frames.
+    """
+    columns = {}
+    for name in frame.columns:
+        values = frame[name]
+        if values.dtype.kind in "biuf":
+            values = values.to_numpy(copy=True)
+            values.flags.writeable = False
+        else:
+            values = values.array
+        columns[name] = values
+    return pd.DataFrame(columns, index=frame.index, copy=False)
@@ -0,0 +1,141 @@
+"""Price vs. performance chart builders: exact WebGL points for small results, binned density for large ones."""
+import numpy as np
+import plotly.express as px
+import plotly.graph_objects as go
+
+VALUE_COL = "Value Score (Lower is better)"
+
+# Above this many rows the chart switches from one marker per laptop to bins
+SCATTER_POINT_LIMIT = 20_000
+DEFAULT_PRICE_BINS = 80
+DEFAULT_SCORE_BINS = 50
+
+
+def scatter_figure(frame, title="Price vs. Spec Score: Visualizing Value", score_col="Spec Score"):
+    """One WebGL marker per laptop, colored by value score and sized by RAM.
+
+    `score_col` is the performance axis (e.g. a custom score instead of Spec Score).
+    """
+    fig = px.scatter(
+        frame.reset_index(),
+        x="Price (Rs)",
+        y=score_col,
+        color=VALUE_COL,
+        size="RAM (GB)",
+        color_continuous_scale=px.colors.sequential.Viridis_r, # Reverse Viridis so lower value is better (darker)
+        hover_name="Name",
+        hover_data={
+            "Price (Rs)": ':,.0f',
+            "Spec Score": True,
+            **({score_col: ':.1f'} if score_col != "Spec Score" else {}),
+            "RAM (GB)": True,
+            "Storage (GB)": True,
+            "GPU VRAM (GB)": True,
+            "CPU Full Model": True,
+            VALUE_COL: ':.0f'
+        },
+        render_mode="webgl",
+        template="plotly_white",
+        title=title
+    )
+    fig.update_layout(
+        height=600,
+        xaxis_title="Price (INR)",
+        yaxis_title=f"{score_col} (Performance)",
+        coloraxis_colorbar_title="Value Score"
+    )
+    return fig
+
+
+def bin_price_score(price, score, value, price_bins=DEFAULT_PRICE_BINS, score_bins=DEFAULT_SCORE_BINS):
+    """Aggregates points onto a price x spec-score grid.
+
+    Returns a dict with the bin edges and, per (score, price) cell, the number of
+    laptops and the mean and best (minimum) value score; empty cells are NaN.
+    Laptops without a value score (NaN) are counted but not averaged.
+    """
+    price = np.asarray(price, dtype=float)
+    score = np.asarray(score, dtype=float)
+    value = np.asarray(value, dtype=float)
+
+    price_edges = np.linspace(price.min(), price.max() or 1.0, price_bins + 1)
+    score_edges = np.linspace(score.min(), score.max() or 1.0, score_bins + 1)
+    # Right-most edge is inclusive, like np.histogram2d
+    px_idx = np.clip(np.searchsorted(price_edges, price, side="right") - 1, 0, price_bins - 1)
+    sy_idx = np.clip(np.searchsorted(score_edges, score, side="right") - 1, 0, score_bins - 1)
+    cell = sy_idx * price_bins + px_idx
+
+    n_cells = price_bins * score_bins
+    count = np.bincount(cell, minlength=n_cells).astype(float)
+    rated = ~np.isnan(value)
+    rated_count = np.bincount(cell[rated], minlength=n_cells)
+    total = np.bincount(cell[rated], weights=value[rated], minlength=n_cells)
+    best = np.full(n_cells, np.inf)
+    np.minimum.at(best, cell[rated], value[rated])
+
+    empty = count == 0
+    count[empty] = np.nan
+    unrated = rated_count == 0
+    mean = total / np.where(unrated, 1, rated_count)
+    mean[unrated] = np.nan
+    best[unrated] = np.nan
+    shape = (score_bins, price_bins)
+    return {
+        "price_edges": price_edges,
+        "score_edges": score_edges,
+        "count": count.reshape(shape),
+        "mean_value": mean.reshape(shape),
+        "best_value": best.reshape(shape),
+    }
+
+
+def density_figure(frame, price_bins=DEFAULT_PRICE_BINS, score_bins=DEFAULT_SCORE_BINS,
+                   title="Price vs. Spec Score: Value Density", score_col="Spec Score"):
+    """Binned heatmap of price x spec score (or `score_col`) colored by mean value score per cell."""
+    bins = bin_price_score(frame["Price (Rs)"], frame[score_col], frame[VALUE_COL], price_bins, score_bins)
+    price_mid = (bins["price_edges"][:-1] + bins["price_edges"][1:]) / 2
+    score_mid = (bins["score_edges"][:-1] + bins["score_edges"][1:]) / 2
+
+    fig = go.Figure(go.Heatmap(
+        x=price_mid,
+        y=score_mid,
+        z=bins["mean_value"],
+        customdata=np.dstack([bins["count"], bins["best_value"]]),
+        colorscale="Viridis_r",
+        colorbar_title="Mean Value Score",
+        hoverongaps=False,
+        hovertemplate=(
+            f"Price ≈ ₹%{{x:,.0f}}<br>{score_col} ≈ %{{y:.0f}}<br>"
+            "Laptops: %{customdata[0]:,.0f}<br>"
+            "Mean value: %{z:,.0f}<br>Best value: %{customdata[1]:,.0f}<extra></extra>"
+        ),
+    ))
+    fig.update_layout(
+        height=600,
+        template="plotly_white",
+        title=title,
+        xaxis_title="Price (INR)",
+        yaxis_title=f"{score_col} (Performance)",
+    )
+    return fig
+
+
+def add_frontier(fig, frontier, connect=False, score_col="Spec Score"):
+    """Overlays Pareto-frontier laptops on a price/score figure.
+
+    `connect` draws the frontier as a price-ordered staircase line, which only
+    makes sense when it was computed over price and the score axis alone.
+    """
+    frontier = frontier.sort_values("Price (Rs)")
+    fig.add_trace(go.Scattergl(
+        x=frontier["Price (Rs)"],
+        y=frontier[score_col],
+        mode="lines+markers" if connect else "markers",
+        line_shape="hv",
+        name="Pareto frontier",
+        text=frontier.index,
+        marker=dict(symbol="star", size=12, color="#e4572e", line=dict(width=1, color="white")),
+        hovertemplate=f"<b>%{{text}}</b><br>Price: ₹%{{x:,.0f}}<br>{score_col}: %{{y}}<extra>Pareto frontier</extra>",
+    ))
+    fig.update_layout(legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1))
+    return fig
@@ -0,0 +1,279 @@
+"""Duplicate and near-duplicate listing detection.
+
+    python dedup.py feed.parquet --output suggestions.csv
+
+Names are cleaned (invisible characters such as U+200E, odd whitespace) and
+reduced to a match key. Listings are then blocked by brand and CPU, and only
+neighbours within a block are compared (sorted-neighbourhood), so the work is
+O(n * window) rather than all pairs. Pairs are scored by the Jaccard similarity
+of their character trigrams, computed on fixed-size bit sketches with popcount.
+Pairs above the merge threshold are joined into clusters that share one
+canonical ID; pairs above the suggestion threshold are reported for review.
+"""
+import argparse
+import sys
+
+import numpy as np
+import pandas as pd
+
+from filter_index import row_popcounts
+
+# Zero-width, bidi-control and soft-hyphen characters that sneak in from vendor pages
+INVISIBLE_CHARS = "[\u00ad\u200b-\u200f\u202a-\u202e\u2060-\u2064\ufeff]"
+# CPU words that vary between feeds without changing the part ("12th Gen Intel Core i5" vs "Core i5")
+CPU_NOISE = r"\b(?:\d+(?:st|nd|rd|th) gen|intel|amd|core|processor|series \d)\b"
+
+SKETCH_BITS = 512
+MAX_KEY_LENGTH = 64
+WINDOW = 8
+MERGE_THRESHOLD = 0.9
+SUGGEST_THRESHOLD = 0.6
+CANONICAL_ID_COL = "Canonical ID"
+
+
+def _nfkc(names):
+    names = pd.Series(names, dtype="str")
+    # NFKC is a per-string Python call; plain-ASCII names (nearly all of them) never change under it
+    exotic = ~names.str.isascii().fillna(True)
+    if exotic.any():
+        names = names.copy()
+        names[exotic] = names[exotic].str.normalize("NFKC")
+    return names
+
+
+def clean_names(names):
+    """Display-safe names: NFKC-normalized, invisible characters removed, whitespace collapsed."""
+    return (
+        _nfkc(names).str.replace(INVISIBLE_CHARS, "", regex=True)
+        .str.replace(r"\s+", " ", regex=True)
+        .str.strip()
+    )
+
+
+def match_keys(names, brands):
+    """Case- and punctuation-insensitive name keys with a leading brand name dropped."""
+    # Invisible characters and whitespace runs fall under the punctuation rule
+    keys = _nfkc(names).str.casefold().str.replace(r"[^\w]+", " ", regex=True).str.strip()
+    brands = pd.Series(brands, dtype="category").reset_index(drop=True)
+    keys = keys.reset_index(drop=True)
+    for code, brand in enumerate(brands.cat.categories):
+        prefix = str(brand).casefold() + " "
+        prefixed = (brands.cat.codes.to_numpy() == code) & keys.str.startswith(prefix).to_numpy(dtype=bool)
+        if prefixed.any():
+            keys[prefixed] = keys[prefixed].str.slice(len(prefix))
+    return keys
+
+
+def cpu_keys(cpus):
+    """CPU strings reduced to the part name, e.g. "12th Gen Intel Core i5 12450H" -> "i5 12450h"."""
+    return (
+        clean_names(cpus).str.casefold()
+        .str.replace(CPU_NOISE, " ", regex=True)
+        .str.replace(r"\s+", " ", regex=True)
+        .str.strip()
+    )
+
+
+def _category_codes(values, transform=None):
+    """Integer codes per row, optionally after mapping each distinct value through `transform`."""
+    values = pd.Series(values).astype("category")
+    categories = pd.Series(values.cat.categories)
+    if transform is not None:
+        categories = transform(categories)
+    category_codes = pd.factorize(categories)[0]
+    return category_codes[values.cat.codes.to_numpy()], category_codes.max(initial=-1) + 1
+
+
+def trigram_sketches(keys, bits=SKETCH_BITS, chunksize=100_000):
+    """(n, bits/8) uint8 bitsets of the hashed character trigrams of each key."""
+    keys = list(keys)
+    sketches = np.zeros((len(keys), bits // 8), dtype=np.uint8)
+    for start in range(0, len(keys), chunksize):
+        padded = [f" {key[:MAX_KEY_LENGTH]} " for key in keys[start:start + chunksize]]
+        width = max(map(len, padded), default=3)
+        codes = np.array(padded, dtype=f"<U{width}").view(np.uint32).reshape(len(padded), width).astype(np.uint64)
+        a, b, c = codes[:, :-2], codes[:, 1:-1], codes[:, 2:]
+        hashed = ((a * 1_000_003) ^ (b * 10_007) ^ c) % bits
+        rows, cols = np.nonzero(c)  # trigrams that end inside the string
+        flags = np.zeros((len(padded), bits), dtype=bool)
+        flags[rows, hashed[rows, cols].astype(np.int64)] = True
+        sketches[start:start + len(padded)] = np.packbits(flags, axis=1)
+    return sketches
+
+
+def sketch_similarity(sketches, left, right):
+    """Estimated trigram Jaccard similarity for each (left[k], right[k]) pair."""
+    words = sketches.view(np.uint64)
+    a, b = words[left], words[right]
+    both = row_popcounts(a & b)
+    either = row_popcounts(a | b)
+    return np.where(either > 0, both / np.maximum(either, 1), 1.0)
+
+
+def connected_components(n, left, right):
+    """Component label (smallest member) per node, by vectorized hooking and pointer jumping."""
+    parent = np.arange(n)
+    while len(left):
+        hooks = np.minimum(parent[left], parent[right])
+        np.minimum.at(parent, parent[left], hooks)
+        np.minimum.at(parent, parent[right], hooks)
+        while True:
+            grandparent = parent[parent]
+            if np.array_equal(grandparent, parent):
+                break
+            parent = grandparent
+        if np.array_equal(parent[left], parent[right]):
+            break
+    return parent
+
+
+def _scored_pairs(frame, window, threshold):
+    """Sorted-neighbourhood key pairs scoring at least `threshold`.
+
+    Returns (first_row, row_keys, left, right, scores): pairs are
+    positions into the distinct (brand, CPU, key) combinations, `row_keys`
+    maps each row to its combination and `first_row` each combination to its
+    first row.
+    """
+    n_rows = len(frame)
+    brand_codes, n_brands = _category_codes(frame["Brand"])
+    cpu_codes, n_cpus = _category_codes(frame["CPU Full Model"], cpu_keys)
+    block_of_row = brand_codes.astype(np.int64) * max(n_cpus, 1) + cpu_codes
+    # Sorted factorization, so key codes double as the sort order of the keys
+    names = frame.index.to_numpy(dtype=object) if n_rows else []
+    key_codes, keys = pd.factorize(match_keys(names, frame["Brand"].to_numpy(dtype=object)), sort=True)
+
+    # Identical (brand, CPU, key) rows are exact duplicates; only distinct keys are compared
+    row_keys, unique_pairs = pd.factorize(block_of_row * max(len(keys), 1) + key_codes)
+    block, key_rank = np.divmod(np.asarray(unique_pairs, dtype=np.int64), max(len(keys), 1))
+    first_row = np.empty(len(unique_pairs), dtype=np.int64)
+    first_row[row_keys[::-1]] = np.arange(n_rows)[::-1]
+    sketches = trigram_sketches(np.asarray(keys, dtype=object)[key_rank])
+
+    # Sorted neighbourhood: within each block compare every key to its next `window` keys
+    order = np.lexsort((key_rank, block))
+    left_parts, right_parts, score_parts = [], [], []
+    for offset in range(1, window + 1):
+        left, right = order[:-offset], order[offset:]
+        same_block = block[left] == block[right]
+        left, right = left[same_block], right[same_block]
+        scores = sketch_similarity(sketches, left, right)
+        keep = scores >= threshold
+        left_parts.append(left[keep])
+        right_parts.append(right[keep])
+        score_parts.append(scores[keep])
+    left = np.concatenate(left_parts)
+    right = np.concatenate(right_parts)
+    scores = np.concatenate(score_parts)
+    return first_row, row_keys, left, right, scores
+
+
+def _cluster_ids(row_keys, n_keys, left, right):
+    labels = connected_components(n_keys, left, right)
+    return pd.factorize(labels[row_keys])[0].astype(np.int32)
+
+
+def canonical_ids(frame, window=WINDOW, merge_threshold=MERGE_THRESHOLD):
+    """One int32 cluster ID per row of a Name-indexed catalog, numbered in order of first appearance."""
+    first_row, row_keys, left, right, _ = _scored_pairs(frame, window, merge_threshold)
+    return _cluster_ids(row_keys, len(first_row), left, right)
+
+
+def find_duplicates(frame, window=WINDOW, merge_threshold=MERGE_THRESHOLD, suggest_threshold=SUGGEST_THRESHOLD):
+    """Clusters duplicate listings of a Name-indexed catalog and lists merge suggestions.
+
+    Returns (canonical_ids, suggestions): the IDs as from canonical_ids(), and
+    a frame of candidate pairs scoring at least `suggest_threshold`, flagged
+    `merged` when they reached `merge_threshold`.
+    """
+    first_row, row_keys, left, right, scores = _scored_pairs(
+        frame, window, min(suggest_threshold, merge_threshold)
+    )
+    merged = scores >= merge_threshold
+    ids = _cluster_ids(row_keys, len(first_row), left[merged], right[merged])
+
+    # Report each pair by one representative listing per key, best first. Taking
+    # from the string and categorical columns directly avoids Python objects.
+    ranked = np.argsort(-scores, kind="stable")
+    ranked = ranked[scores[ranked] >= suggest_threshold]
+    left_rows, right_rows = first_row[left[ranked]], first_row[right[ranked]]
+    names = clean_names(frame.index.to_numpy(dtype=object) if len(frame) else [])
+    suggestions = pd.DataFrame({
+        "Name": names.take(left_rows).reset_index(drop=True),
+        "Duplicate Of": names.take(right_rows).reset_index(drop=True),
+        "Brand": frame["Brand"].take(left_rows).reset_index(drop=True),
+        "CPU": frame["CPU Full Model"].take(left_rows).reset_index(drop=True),
+        "Similarity": scores[ranked].round(3),
+        "merged": merged[ranked],
+    })
+    return ids, suggestions
+
+
+def extend_canonical_ids(frame, new_rows, window=WINDOW, merge_threshold=MERGE_THRESHOLD):
+    """Canonical IDs after rows were added or replaced at positions `new_rows`.
+
+    Only the brand/CPU blocks the new rows fall into are re-scored, and other
+    rows keep their IDs. A new row takes the smallest ID in its cluster: that
+    of the listings it merges with, or its own previous ID (replaced rows
+    carry it in CANONICAL_ID_COL; added rows hold -1). Rows left without one
+    get fresh IDs after the current maximum.
+    """
+    ids = frame[CANONICAL_ID_COL].to_numpy(dtype=np.int64, copy=True)
+    is_new = np.zeros(len(frame), dtype=bool)
+    is_new[new_rows] = True
+    if not is_new.any():
+        return ids
+    brand_codes, _ = _category_codes(frame["Brand"])
+    cpu_codes, n_cpus = _category_codes(frame["CPU Full Model"], cpu_keys)
+    block = brand_codes.astype(np.int64) * max(n_cpus, 1) + cpu_codes
+    candidates = np.flatnonzero(np.isin(block, block[is_new]))
+    local_ids = canonical_ids(frame.iloc[candidates], window, merge_threshold)
+
+    known = ids[candidates] >= 0
+    unassigned = np.iinfo(np.int64).max
+    cluster_ids = np.full(local_ids.max() + 1, unassigned)
+    np.minimum.at(cluster_ids, local_ids[known], ids[candidates[known]])
+    fresh = cluster_ids == unassigned
+    cluster_ids[fresh] = ids.max(initial=-1) + 1 + np.arange(fresh.sum())
+    added = is_new[candidates]
+    ids[candidates[added]] = cluster_ids[local_ids[added]]
+    return ids
+
+
+def distinct_positions(frame, positions, price_col="Price (Rs)"):
+    """The cheapest row per canonical ID among `positions`, in their original order."""
+    positions = np.asarray(positions)
+    ids = frame[CANONICAL_ID_COL].to_numpy()[positions]
+    prices = frame[price_col].to_numpy()[positions]
+    order = np.lexsort((np.arange(len(positions)), prices, ids))
+    first = np.ones(len(order), dtype=bool)
+    first[1:] = ids[order[1:]] != ids[order[:-1]]
+    return positions[np.sort(order[first])]
+
+
+def main(argv=None):
+    from catalog import load_catalog
+
+    parser = argparse.ArgumentParser(description="Report duplicate and near-duplicate laptop listings.")
+    parser.add_argument("catalog", nargs="?", help="CSV / JSON Lines / Parquet feed (default: built-in sample data)")
+    parser.add_argument("--output", help="CSV file for merge suggestions (default: stdout)")
+    parser.add_argument("--merge-threshold", type=float, default=MERGE_THRESHOLD)
+    parser.add_argument("--suggest-threshold", type=float, default=SUGGEST_THRESHOLD)
+    parser.add_argument("--window", type=int, default=WINDOW, help="neighbours compared per listing within a block")
+    args = parser.parse_args(argv)
+
+    catalog = load_catalog(args.catalog)
+    ids, suggestions = find_duplicates(
+        catalog, args.window, args.merge_threshold, args.suggest_threshold
+    )
+    print(
+        f"{len(catalog):,} listings -> {ids.max() + 1 if len(catalog) else 0:,} canonical products; "
+        f"{len(suggestions):,} suggested pairs",
+        file=sys.stderr,
+    )
+    suggestions.to_csv(args.output or sys.stdout, index=False)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
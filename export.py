@@ -0,0 +1,119 @@
+"""Export of filtered results as chunked CSV (optionally gzip), Parquet or Arrow IPC.
+
+Chunking bounds the serializer's temporaries (one chunk of rows is converted
+at a time); it is not a streamed download. export_bytes still returns the whole
+payload, since Streamlit's download button and the ExportCache both hold it as
+bytes, so an export needs about the payload size plus one chunk in memory.
+"""
+import io
+import threading
+import zlib
+from collections import OrderedDict
+
+DEFAULT_CHUNKSIZE = 50_000
+
+# Label -> (format, file extension, MIME type)
+EXPORT_FORMATS = {
+    "CSV": ("csv", "csv", "text/csv"),
+    "CSV (gzip)": ("csv.gz", "csv.gz", "application/gzip"),
+    "Parquet": ("parquet", "parquet", "application/vnd.apache.parquet"),
+    "Arrow IPC": ("arrow", "arrow", "application/vnd.apache.arrow.file"),
+}
+
+
+def iter_csv(frame, chunksize=DEFAULT_CHUNKSIZE, compress=False):
+    """Yields the frame as CSV bytes, one chunk of rows at a time (gzip-framed if `compress`)."""
+    gzip = zlib.compressobj(6, zlib.DEFLATED, 16 + zlib.MAX_WBITS) if compress else None
+    for start in range(0, max(len(frame), 1), chunksize):
+        text = frame.iloc[start:start + chunksize].to_csv(header=(start == 0))
+        data = text.encode('utf-8')
+        if gzip is not None:
+            data = gzip.compress(data)
+        if data:
+            yield data
+    if gzip is not None:
+        yield gzip.flush()
+
+
+def _arrow_batches(frame, chunksize):
+    try:
+        import pyarrow as pa
+    except ImportError as exc:
+        raise ImportError("Parquet and Arrow exports require pyarrow (pip install pyarrow)") from exc
+
+    schema = pa.Schema.from_pandas(frame.iloc[:0], preserve_index=True)
+    batches = (
+        pa.RecordBatch.from_pandas(frame.iloc[start:start + chunksize], schema=schema, preserve_index=True)
+        for start in range(0, len(frame), chunksize)
+    )
+    return pa, schema, batches
+
+
+def write_parquet(frame, sink, chunksize=DEFAULT_CHUNKSIZE):
+    """Writes the frame to a Parquet file, one row group per chunk."""
+    pa, schema, batches = _arrow_batches(frame, chunksize)
+    import pyarrow.parquet as pq
+
+    with pq.ParquetWriter(sink, schema) as writer:
+        for batch in batches:
+            writer.write_batch(batch)
+
+
+def write_arrow_ipc(frame, sink, chunksize=DEFAULT_CHUNKSIZE):
+    """Writes the frame in the Arrow IPC file format, one record batch per chunk."""
+    pa, schema, batches = _arrow_batches(frame, chunksize)
+    with pa.ipc.new_file(sink, schema) as writer:
+        for batch in batches:
+            writer.write_batch(batch)
+
+
+def export_bytes(frame, fmt="csv", chunksize=DEFAULT_CHUNKSIZE):
+    """Serializes a frame to bytes in one of the EXPORT_FORMATS formats (the full payload, in memory)."""
+    sink = io.BytesIO()
+    if fmt in ("csv", "csv.gz"):
+        # Written into one buffer as they come, rather than joined from a list of every chunk
+        for data in iter_csv(frame, chunksize, compress=(fmt == "csv.gz")):
+            sink.write(data)
+    elif fmt == "parquet":
+        write_parquet(frame, sink, chunksize)
+    elif fmt == "arrow":
+        write_arrow_ipc(frame, sink, chunksize)
+    else:
+        raise ValueError(f"Unknown export format '{fmt}'")
+    return sink.getvalue()
+
+
+class ExportCache:
+    """Process-wide LRU of export payloads, bounded by entry count and total bytes.
+
+    Keys are the (normalized) filter spec plus the format rather than a hash of
+    the frame, so repeated downloads of the same result are served from memory
+    without hashing millions of rows, and old payloads are evicted instead of
+    living for the lifetime of the process.
+    """
+
+    def __init__(self, max_entries=16, max_bytes=256 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get_or_create(self, key, build):
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                return self._entries[key]
+
+        payload = build()
+        with self._lock:
+            if key not in self._entries and len(payload) <= self.max_bytes:
+                self._entries[key] = payload
+                self._bytes += len(payload)
+                while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                    _, evicted = self._entries.popitem(last=False)
+                    self._bytes -= len(evicted)
+        return payload
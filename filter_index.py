@@ -0,0 +1,290 @@
+"""Prebuilt filter index for the sidebar predicates.
+
+Categorical columns keep one packed bitmap per value (1 bit per row), so an
+`isin` over a few brands is an OR of a handful of bitmaps and combining
+predicates is a bytewise AND over n/8 bytes. Range columns keep the row
+positions sorted by value, so a `lo <= x <= hi` predicate is two binary
+searches. A query is driven by its most selective predicate and the remaining
+predicates are checked only on those candidate rows.
+
+The per-value bitmaps of a column are rows of one matrix, so facet counts (how
+many rows each value would match under every other predicate) are a single
+broadcast AND against the other predicates' bitmap plus a row-wise popcount.
+"""
+import weakref
+
+import numpy as np
+import pandas as pd
+
+from tracing import NULL_TRACER
+
+CATEGORICAL_COLUMNS = ["Brand", "Utility", "CPU Brand", "GPU Dedicated"]
+RANGE_COLUMNS = ["Price (Rs)", "Spec Score", "RAM (GB)", "Storage (GB)", "GPU VRAM (GB)", "Screen (in)"]
+
+
+def _pack(mask):
+    return np.packbits(mask)
+
+
+def popcount(bitmap):
+    """Number of set bits in a packed bitmap."""
+    if hasattr(np, "bitwise_count"):  # numpy >= 2.0
+        return int(np.bitwise_count(bitmap).sum(dtype=np.int64))
+    return int(np.unpackbits(bitmap).sum(dtype=np.int64))
+
+
+def row_popcounts(bitmaps):
+    """Number of set bits in each row of a 2-D array of packed bitmaps (any unsigned integer dtype)."""
+    if hasattr(np, "bitwise_count"):
+        return np.bitwise_count(bitmaps).sum(axis=1, dtype=np.int64)
+    return np.unpackbits(np.ascontiguousarray(bitmaps).view(np.uint8), axis=1).sum(axis=1, dtype=np.int64)
+
+
+def _bits_at(bitmap, positions):
+    """Tests the bits of a packed bitmap at the given row positions."""
+    return ((bitmap[positions >> 3] >> (7 - (positions & 7))) & 1).astype(bool)
+
+
+class FilterIndex:
+    """Per-value bitmaps and sorted positions built once over a catalog frame."""
+
+    def __init__(self, frame, categorical_columns=CATEGORICAL_COLUMNS, range_columns=RANGE_COLUMNS):
+        self.n_rows = len(frame)
+        self.bitmaps = {}
+        self.value_bitmaps = {}  # column -> (values, one bitmap row per value)
+        for name in categorical_columns:
+            codes, uniques = pd.factorize(frame[name])
+            matrix = np.empty((len(uniques), (self.n_rows + 7) // 8), dtype=np.uint8)
+            for code in range(len(uniques)):
+                matrix[code] = _pack(codes == code)
+            self.value_bitmaps[name] = (list(uniques), matrix)
+            self.bitmaps[name] = dict(zip(uniques, matrix))
+        self._value_counts = {}
+
+        self.values = {}
+        self.order = {}
+        self.sorted_values = {}
+        for name in range_columns:
+            values = frame[name].to_numpy()
+            order = np.argsort(values, kind="stable")
+            self.values[name] = values
+            self.order[name] = order
+            self.sorted_values[name] = values[order]
+
+    # -- building blocks ------------------------------------------------
+
+    def empty_bitmap(self):
+        return np.zeros((self.n_rows + 7) // 8, dtype=np.uint8)
+
+    def bitmap(self, column, values):
+        """OR of the bitmaps for `values` in a categorical column (an `isin`)."""
+        result = self.empty_bitmap()
+        for value in values:
+            bitmap = self.bitmaps[column].get(value)
+            if bitmap is not None:
+                result |= bitmap
+        return result
+
+    def range_bounds(self, column, lo=None, hi=None, inclusive="both"):
+        """Returns the [start, stop) slice of the sorted positions matching a range.
+
+        `inclusive` follows Series.between: "both" keeps lo <= x <= hi and
+        "left" keeps lo <= x < hi.
+        """
+        sorted_values = self.sorted_values[column]
+        start = 0 if lo is None else np.searchsorted(sorted_values, lo, side="left")
+        if hi is None:
+            stop = len(sorted_values)
+        else:
+            stop = np.searchsorted(sorted_values, hi, side="right" if inclusive == "both" else "left")
+        return int(start), int(max(stop, start))
+
+    def isin_bitmap(self, column, accepted):
+        """Bitmap of one `isin` predicate, or None when it accepts every row."""
+        accepted = set(accepted)
+        if accepted.issuperset(self.bitmaps[column]):
+            return None
+        return self.bitmap(column, accepted)
+
+    def range_bitmap(self, column, lo=None, hi=None, inclusive="both"):
+        """Bitmap of one range predicate, or None when it accepts every row."""
+        start, stop = self.range_bounds(column, lo, hi, inclusive)
+        if start == 0 and stop == self.n_rows:
+            return None
+        mask = np.zeros(self.n_rows, dtype=bool)
+        mask[self.order[column][start:stop]] = True
+        return _pack(mask)
+
+    def positions_bitmap(self, positions):
+        """Bitmap with the bits of the given row positions set."""
+        mask = np.zeros(self.n_rows, dtype=bool)
+        mask[positions] = True
+        return _pack(mask)
+
+    def positions(self, bitmap):
+        """Row positions of the set bits of a bitmap (all rows for None)."""
+        if bitmap is None:
+            return np.arange(self.n_rows)
+        return np.flatnonzero(np.unpackbits(bitmap, count=self.n_rows))
+
+    def _in_range(self, column, positions, lo, hi, inclusive):
+        values = self.values[column][positions]
+        keep = np.ones(len(positions), dtype=bool)
+        if lo is not None:
+            keep &= values >= lo
+        if hi is not None:
+            keep &= (values <= hi) if inclusive == "both" else (values < hi)
+        return keep
+
+    def predicate_bitmaps(self, isin=None, ranges=None):
+        """Bitmap (or None for "every row") of each predicate, keyed by column."""
+        bitmaps = {column: self.isin_bitmap(column, accepted) for column, accepted in (isin or {}).items()}
+        for column, bounds in (ranges or {}).items():
+            lo, hi, inclusive = (tuple(bounds) + ("both",))[:3]
+            bitmaps[column] = self.range_bitmap(column, lo, hi, inclusive)
+        return bitmaps
+
+    # -- queries --------------------------------------------------------
+
+    def select(self, isin=None, ranges=None):
+        """Returns the sorted row positions matching every predicate.
+
+        `isin` maps categorical columns to the accepted values; `ranges` maps range
+        columns to (lo, hi) or (lo, hi, inclusive) with None for an open bound.
+        Predicates that accept every row (all values selected, bounds outside the
+        data) are skipped entirely.
+        """
+        bitmap = None
+        for column, accepted in (isin or {}).items():
+            column_bitmap = self.isin_bitmap(column, accepted)
+            if column_bitmap is not None:
+                bitmap = column_bitmap if bitmap is None else bitmap & column_bitmap
+
+        active = []
+        for column, bounds in (ranges or {}).items():
+            lo, hi, inclusive = (tuple(bounds) + ("both",))[:3]
+            start, stop = self.range_bounds(column, lo, hi, inclusive)
+            if start == 0 and stop == self.n_rows:
+                continue
+            active.append((stop - start, column, lo, hi, inclusive, start, stop))
+        active.sort(key=lambda item: item[0])
+
+        if bitmap is None and not active:
+            return np.arange(self.n_rows)
+
+        # Drive the query from whichever predicate yields the fewest candidates
+        if active and (bitmap is None or active[0][0] < popcount(bitmap)):
+            _, column, _, _, _, start, stop = active.pop(0)
+            positions = np.sort(self.order[column][start:stop])
+            if bitmap is not None:
+                positions = positions[_bits_at(bitmap, positions)]
+        else:
+            positions = self.positions(bitmap)
+
+        for _, column, lo, hi, inclusive, _, _ in active:
+            if not len(positions):
+                break
+            positions = positions[self._in_range(column, positions, lo, hi, inclusive)]
+        return positions
+
+    def facet_counts(self, columns, bitmaps, value_bitmaps=None):
+        """Per-value match counts of categorical `columns`, each under every other predicate.
+
+        `bitmaps` maps predicate columns to their bitmaps (see predicate_bitmaps)
+        and may hold further row restrictions under other names; a column's own
+        predicate is left out of its counts, so every value shows how many rows
+        selecting it would match. `value_bitmaps` optionally maps a column to
+        {value: bitmap} for predicates that only apply once that value is
+        selected; each narrows its value's count alone. Returns {column: {value: count}}.
+        """
+        shared = None  # AND of the predicates that are not facets
+        for column, bitmap in bitmaps.items():
+            if bitmap is not None and column not in columns:
+                shared = bitmap.copy() if shared is None else np.bitwise_and(shared, bitmap, out=shared)
+
+        counts = {}
+        for column in columns:
+            base = shared
+            for other in columns:
+                bitmap = bitmaps.get(other)
+                if other != column and bitmap is not None:
+                    base = bitmap if base is None else base & bitmap
+            values, matrix = self.value_bitmaps[column]
+            if base is None:
+                if column not in self._value_counts:
+                    self._value_counts[column] = row_popcounts(matrix)
+                column_counts = self._value_counts[column]
+            else:
+                column_counts = row_popcounts(matrix & base)
+            counts[column] = {value: int(count) for value, count in zip(values, column_counts)}
+            for value, bitmap in (value_bitmaps or {}).get(column, {}).items():
+                if bitmap is not None and value in counts[column]:
+                    restricted = matrix[values.index(value)] & bitmap
+                    counts[column][value] = popcount(restricted if base is None else restricted & base)
+        return counts
+
+
+class PredicateCache:
+    """Per-session cache of predicate bitmaps keyed by the widget value that produced them.
+
+    Kept in st.session_state: when a single slider moves, only that predicate's
+    bitmap is rebuilt and the rest are reused, so an interaction costs one column
+    scan plus a bytewise AND of the cached bitmaps.
+    """
+
+    def __init__(self):
+        self._index_ref = None
+        self.entries = {}  # predicate name -> (key, bitmap or None)
+        self.hits = 0
+        self.misses = 0
+
+    def _is_cached(self, name, key):
+        cached = self.entries.get(name)
+        return cached is not None and cached[0] == key
+
+    def _bitmap(self, name, key, build):
+        if self._is_cached(name, key):
+            self.hits += 1
+            return self.entries[name][1]
+        self.misses += 1
+        bitmap = build()
+        self.entries[name] = (key, bitmap)
+        return bitmap
+
+    def bitmaps(self, index, isin=None, ranges=None, tracer=NULL_TRACER):
+        """Same result as FilterIndex.predicate_bitmaps, rebuilding only the predicates that changed.
+
+        Each predicate is traced as its own stage, flagged `cached` when its bitmap was reused.
+        """
+        if self._index_ref is None or self._index_ref() is not index:
+            # New catalog version: every cached bitmap refers to the old rows
+            self._index_ref = weakref.ref(index)
+            self.entries = {}
+
+        isin = isin or {}
+        ranges = ranges or {}
+        bitmaps = {}
+        for column, accepted in isin.items():
+            key = ("isin", frozenset(accepted))
+            with tracer.stage(f"filter: {column}", cached=self._is_cached(column, key)):
+                bitmaps[column] = self._bitmap(column, key, lambda: index.isin_bitmap(column, accepted))
+        for column, bounds in ranges.items():
+            lo, hi, inclusive = (tuple(bounds) + ("both",))[:3]
+            key = ("range", lo, hi, inclusive)
+            with tracer.stage(f"filter: {column}", cached=self._is_cached(column, key)):
+                bitmaps[column] = self._bitmap(column, key, lambda: index.range_bitmap(column, lo, hi, inclusive))
+
+        # Predicates that were switched off (e.g. the GPU type filter) drop out
+        for name in set(self.entries) - set(isin) - set(ranges):
+            del self.entries[name]
+        return bitmaps
+
+    def select(self, index, isin=None, ranges=None, tracer=NULL_TRACER):
+        """Same predicates and result as FilterIndex.select, recomputing only what changed."""
+        bitmaps = self.bitmaps(index, isin, ranges, tracer)
+        with tracer.stage("filter: combine"):
+            combined = None
+            for bitmap in bitmaps.values():
+                if bitmap is not None:
+                    combined = bitmap.copy() if combined is None else np.bitwise_and(combined, bitmap, out=combined)
+            return index.positions(combined)
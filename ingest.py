@@ -0,0 +1,235 @@
+"""Parallel ingestion of several retailer feeds into one catalog.
+
+    python ingest.py amazon.csv flipkart.parquet croma.jsonl --workers 4 --output merged.parquet
+
+Each worker process reads its feed chunk by chunk and turns every chunk into
+catalog rows: prices are parsed like lakh_to_inr, the CPU/GPU columns are
+derived, and rows without a name, a parseable price or a spec score are
+counted and dropped. Chunks come back through a bounded queue, so a worker
+never holds more than one chunk of its feed and only a few batches are in
+flight at a time.
+
+The parent puts the batches in (feed, chunk) order, so the merged catalog does
+not depend on which worker finished first. A name listed by more than one
+feed is then resolved by a conflict policy:
+
+    cheapest  the feed with the lowest price for the name wins (ties: the earlier feed)
+    priority  the earlier feed in the list wins
+
+All of a feed's rows for a name are kept or dropped together; duplicates within
+one feed are left to the dedup stage like any other catalog.
+"""
+import argparse
+import json
+import multiprocessing
+import os
+import queue
+import sys
+
+import numpy as np
+import pandas as pd
+
+from catalog import (
+    DEFAULT_CHUNKSIZE, DEFAULT_FIELD_MAP, DISPLAY_COLUMNS, add_derived_columns, catalog_cache_key, compact_catalog,
+    iter_raw_chunks, normalize_chunk,
+)
+from dedup import CANONICAL_ID_COL, canonical_ids
+from tracing import NULL_TRACER
+
+POLICIES = ["cheapest", "priority"]
+# Batches waiting in the result queue, per worker
+QUEUE_BATCHES = 4
+
+
+def feeds_cache_key(feeds, content_hash=False):
+    """A key that changes whenever any of the feeds changes (see catalog.catalog_cache_key)."""
+    return ("feeds",) + tuple(catalog_cache_key(feed, content_hash) for feed in feeds)
+
+
+def _feed_batches(source, field_map, chunksize, stats):
+    """Yields one feed's normalized rows with derived columns, chunk by chunk; fills `stats`."""
+    mapping = {**DEFAULT_FIELD_MAP, **(field_map or {})}
+    for raw, _ in iter_raw_chunks(source, None, chunksize, field_map):
+        batch = normalize_chunk(raw, mapping)
+        stats["rows_read"] += len(raw)
+        stats["rows_invalid"] += len(raw) - len(batch)
+        yield add_derived_columns(batch.reset_index(drop=True))
+
+
+def _new_stats():
+    return {"rows_read": 0, "rows_invalid": 0}
+
+
+def _worker(tasks, results, feeds, field_maps, chunksize):
+    """Worker process loop: ingests feeds by number until it receives None."""
+    for feed_no in iter(tasks.get, None):
+        stats = _new_stats()
+        try:
+            for batch_no, batch in enumerate(_feed_batches(feeds[feed_no], field_maps[feed_no], chunksize, stats)):
+                results.put(("batch", feed_no, batch_no, batch))
+        except Exception as exc:
+            results.put(("error", feed_no, f"{type(exc).__name__}: {exc}", None))
+        else:
+            results.put(("done", feed_no, stats, None))
+
+
+def _serial_messages(feeds, field_maps, chunksize):
+    for feed_no, feed in enumerate(feeds):
+        stats = _new_stats()
+        for batch_no, batch in enumerate(_feed_batches(feed, field_maps[feed_no], chunksize, stats)):
+            yield "batch", feed_no, batch_no, batch
+        yield "done", feed_no, stats, None
+
+
+def _parallel_messages(feeds, field_maps, chunksize, workers):
+    # "spawn" keeps workers independent of the parent's threads (e.g. a Streamlit server)
+    ctx = multiprocessing.get_context("spawn")
+    tasks = ctx.Queue()
+    results = ctx.Queue(maxsize=QUEUE_BATCHES * workers)
+    for feed_no in range(len(feeds)):
+        tasks.put(feed_no)
+    for _ in range(workers):
+        tasks.put(None)
+    processes = [
+        ctx.Process(target=_worker, args=(tasks, results, feeds, field_maps, chunksize), daemon=True)
+        for _ in range(workers)
+    ]
+    for process in processes:
+        process.start()
+    try:
+        pending = len(feeds)
+        while pending:
+            try:
+                message = results.get(timeout=1.0)
+            except queue.Empty:
+                if not any(process.is_alive() for process in processes):
+                    try:
+                        message = results.get(timeout=1.0)
+                    except queue.Empty:
+                        raise RuntimeError("Ingestion workers exited before every feed was read") from None
+                else:
+                    continue
+            if message[0] != "batch":
+                pending -= 1
+            yield message
+    finally:
+        for process in processes:
+            if process.is_alive():
+                process.terminate()
+            process.join()
+
+
+def resolve_conflicts(feed, names, prices, policy="cheapest"):
+    """Mask of rows to keep when several feeds list the same name (see the module docstring)."""
+    if policy not in POLICIES:
+        raise ValueError(f"Unknown conflict policy '{policy}'; expected one of {POLICIES}")
+    codes = pd.factorize(names)[0]
+    if not len(codes):
+        return np.ones(0, dtype=bool)
+    if policy == "priority":
+        order = np.lexsort((feed, codes))
+    else:
+        order = np.lexsort((feed, prices, codes))
+    # The first row of each name in that order belongs to the winning feed
+    first = np.ones(len(order), dtype=bool)
+    first[1:] = codes[order[1:]] != codes[order[:-1]]
+    winner = np.empty(codes.max() + 1, dtype=feed.dtype)
+    winner[codes[order[first]]] = feed[order[first]]
+    return feed == winner[codes]
+
+
+def ingest_feeds(feeds, field_maps=None, workers=None, policy="cheapest", chunksize=DEFAULT_CHUNKSIZE, compact=True,
+                 progress=None, tracer=NULL_TRACER):
+    """Builds one catalog from several feeds, one worker process per feed at a time.
+
+    `field_maps` holds one field map (or None) per feed. `workers` defaults to
+    the number of CPUs (at most one per feed); 1 ingests in this process.
+    `progress(rows_loaded, None)` is called after every batch.
+
+    Returns (catalog, report): the Name-indexed catalog, with canonical IDs
+    like build_catalog, and one report row per feed.
+    """
+    if policy not in POLICIES:
+        raise ValueError(f"Unknown conflict policy '{policy}'; expected one of {POLICIES}")
+    feeds = [os.fspath(feed) for feed in feeds]
+    field_maps = list(field_maps) if field_maps is not None else [None] * len(feeds)
+    if len(field_maps) != len(feeds):
+        raise ValueError(f"Got {len(field_maps)} field maps for {len(feeds)} feeds")
+    workers = max(1, min(workers or os.cpu_count() or 1, len(feeds)))
+
+    batches, stats = {}, {}
+    rows_loaded = 0
+    with tracer.stage("feed ingestion", feeds=len(feeds), workers=workers):
+        if workers == 1:
+            messages = _serial_messages(feeds, field_maps, chunksize)
+        else:
+            messages = _parallel_messages(feeds, field_maps, chunksize, workers)
+        for kind, feed_no, payload, batch in messages:
+            if kind == "error":
+                raise ValueError(f"Feed {feeds[feed_no]}: {payload}")
+            if kind == "done":
+                stats[feed_no] = payload
+                continue
+            batches[feed_no, payload] = batch
+            rows_loaded += len(batch)
+            if progress is not None:
+                progress(rows_loaded, None)
+
+    with tracer.stage("feed merge", rows=rows_loaded):
+        keys = sorted(batches)
+        feed = np.repeat(
+            np.array([feed_no for feed_no, _ in keys], dtype=np.int32), [len(batches[key]) for key in keys]
+        )
+        if keys:
+            frame = pd.concat([batches.pop(key) for key in keys], ignore_index=True)
+        else:
+            frame = add_derived_columns(normalize_chunk(pd.DataFrame(columns=DISPLAY_COLUMNS), {}))
+        keep = resolve_conflicts(feed, frame["Name"], frame["Price (Rs)"].to_numpy(), policy)
+        frame = frame[keep].set_index("Name")
+
+    with tracer.stage("dedup", rows=len(frame)):
+        frame[CANONICAL_ID_COL] = canonical_ids(frame)
+    if compact:
+        with tracer.stage("catalog compaction", rows=len(frame)):
+            frame = compact_catalog(frame)
+
+    report = pd.DataFrame({
+        "Feed": feeds,
+        "Rows read": [stats[i]["rows_read"] for i in range(len(feeds))],
+        "Invalid rows": [stats[i]["rows_invalid"] for i in range(len(feeds))],
+        "Rows kept": np.bincount(feed[keep], minlength=len(feeds)),
+        "Lost to conflicts": np.bincount(feed[~keep], minlength=len(feeds)),
+    })
+    return frame, report
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Merge several laptop feeds into one catalog in parallel.")
+    parser.add_argument("feeds", nargs="+", help="CSV / JSON Lines / Parquet feeds, highest priority first")
+    parser.add_argument("--output", help="write the merged catalog (.parquet or .csv)")
+    parser.add_argument("--workers", type=int, help="worker processes (default: CPU count)")
+    parser.add_argument("--policy", choices=POLICIES, default="cheapest", help="how to resolve names listed by several feeds")
+    parser.add_argument("--field-map", help="JSON file mapping source field names to catalog columns, for every feed")
+    parser.add_argument("--chunksize", type=int, default=DEFAULT_CHUNKSIZE)
+    args = parser.parse_args(argv)
+
+    field_map = None
+    if args.field_map:
+        with open(args.field_map) as fh:
+            field_map = json.load(fh)
+    catalog, report = ingest_feeds(
+        args.feeds, [field_map] * len(args.feeds), args.workers, args.policy, args.chunksize
+    )
+    print(report.to_string(index=False), file=sys.stderr)
+    print(f"{len(catalog):,} listings in the merged catalog", file=sys.stderr)
+    if args.output:
+        out = catalog.reset_index()
+        if args.output.endswith((".parquet", ".pq")):
+            out.to_parquet(args.output, index=False)
+        else:
+            out.to_csv(args.output, index=False)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
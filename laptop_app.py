@@ -1,845 +1,176 @@
+import os
+from dataclasses import replace
+
 import streamlit as st
 import pandas as pd
-import plotly.express as px
 import numpy as np
 
+from catalog import build_catalog, catalog_cache_key
+from charts import SCATTER_POINT_LIMIT, VALUE_COL, add_frontier, density_figure, scatter_figure
+from dedup import distinct_positions
+from export import EXPORT_FORMATS, ExportCache, export_bytes
+from filter_index import FilterIndex, PredicateCache
+from ingest import feeds_cache_key, ingest_feeds
+from neighbors import DISTANCE_COL, SimilarityIndex, similar_laptops
+from price_history import PriceHistory, laptop_ids
+from pricing import parse_price
+from query import GPU_TYPES, FilterSpec, facet_counts, select_positions
+from ranking import DEFAULT_WEIGHTS, OBJECTIVES, PICK_SCORE_COL, VALUE_OBJECTIVE, column_bounds, top_picks
+from shared_catalog import CatalogView, SharedCatalogs
+from scoring import CUSTOM_SCORE_COL, DEFAULT_SCORE_WEIGHTS, SpecScorer
+from search import RELEVANCE_COL, TextIndex, restrict
+from skyline import SKYLINE_DIMENSIONS, skyline
+from snapshots import SnapshotStore
+from table import DEFAULT_SORT, PAGE_SIZES, SORT_OPTIONS, SortIndex, page_count, page_window, ranked
+from tracing import NULL_TRACER, Tracer
+
 # -----------------------------------------------------------
 # 0. Configuration and Helper Functions
 # -----------------------------------------------------------
 st.set_page_config(layout="wide", page_title="Advanced Laptop Data Analyzer")
 
-@st.cache_data
-def convert_df_to_csv(df):
-    """Converts a DataFrame to a CSV string for download."""
-    return df.to_csv().encode('utf-8')
-
 def lakh_to_inr(lakhs):
-    """Converts a value in Lakhs (Lakh) to Indian Rupees (INR)."""
+    """Converts a value in Lakhs (Lakh), Crore, K or plain rupees to Indian Rupees (INR)."""
     if isinstance(lakhs, str):
-        if 'Lakh' in lakhs:
-            value = float(lakhs.replace('₹', '').replace(' Lakh', '').replace(',', ''))
-            return int(value * 100000)
-        elif 'L' in lakhs:
-            value = float(lakhs.replace('₹', '').replace(' L', '').replace(',', ''))
-            return int(value * 100000)
-        elif 'Crore' in lakhs:
-            value = float(lakhs.replace('₹', '').replace(' Crore', '').replace(',', ''))
-            return int(value * 10000000)
-        elif ' Lakh' in lakhs:
-            value = float(lakhs.replace('₹', '').replace(' Lakh', '').replace(',', ''))
-            return int(value * 100000)
-        else:
-            return int(lakhs.replace('₹', '').replace(',', '').replace(' ', ''))
+        return parse_price(lakhs)
     return int(lakhs)
 
 # -----------------------------------------------------------
 # 1. Data Structure 
-# (Re-using the detailed data from the previous script)
+# (Built-in sample data by default, or an external feed via LAPTOP_CATALOG)
 # -----------------------------------------------------------
-# Sample laptop data using real INR prices and detailed specifications
-LAPTOP_DATA_INR = [
-    {
-        "name": "IdeaPad Slim 3", "brand": "Lenovo", "os": "Windows 11", "utility": "Everyday Use",
-        "cpu_full": "13th Gen Core i7 13620H", "ram_gb": 16, "storage_gb": 512, 
-        "screen_size_in": 15.28, "spec_score": 55, "price_inr": 65990,
-        "gpu_type": "Integrated Intel UHD Graphics", "gpu_vram_gb": 0,
-    },
-    {
-        "name": "Vivobook 14", "brand": "Asus", "os": "Windows 11", "utility": "Performance",
-        "cpu_full": "Intel Core Ultra 7 255H", "ram_gb": 16, "storage_gb": 512, 
-        "screen_size_in": 14.0, "spec_score": 68, "price_inr": 79990,
-        "gpu_type": "Intel Integrated Intel", "gpu_vram_gb": 0,
-    },
-    {
-        "name": "MateBook Fold", "brand": "Huawei", "os": "HarmonyOS 5", "utility": "Business",
-        "cpu_full": "Kirin X90", "ram_gb": 32, "storage_gb": 2048, 
-        "screen_size_in": 18.0, "spec_score": 61, "price_inr": 319930,
-        "gpu_type": "Integrated", "gpu_vram_gb": 0,
-    },
-    {
-        "name": "Nitro V 16", "brand": "Acer", "os": "Windows 11", "utility": "Gaming",
-        "cpu_full": "14th Gen Core i5 14450HX", "ram_gb": 16, "storage_gb": 512, 
-        "screen_size_in": 16.0, "spec_score": 68, "price_inr": 84990,
-        "gpu_type": "NVIDIA GeForce RTX 4050", "gpu_vram_gb": 6,
-    },
-    {
-        "name": "Aspire Lite AL15", "brand": "Acer", "os": "Windows 11", "utility": "Everyday Use",
-        "cpu_full": "12th Gen Core i5 12450H", "ram_gb": 16, "storage_gb": 512, 
-        "screen_size_in": 15.6, "spec_score": 56, "price_inr": 36541,
-        "gpu_type": "Intel UHD Graphics", "gpu_vram_gb": 0,
-    },
-    {
-        "name": "Victus 15", "brand": "HP", "os": "Windows 11", "utility": "Gaming",
-        "cpu_full": "AMD Ryzen 5 8645HS", "ram_gb": 16, "storage_gb": 512, 
-        "screen_size_in": 15.6, "spec_score": 72, "price_inr": 65990,
-        "gpu_type": "NVIDIA GeForce RTX 3050", "gpu_vram_gb": 6,
-    },
-    {
-        "name": "Thin A15 AI", "brand": "MSI", "os": "Windows 11", "utility": "Gaming",
-        "cpu_full": "AMD Ryzen 5 7535HS", "ram_gb": 16, "storage_gb": 512, 
-        "screen_size_in": 15.6, "spec_score": 70, "price_inr": 49990,
-        "gpu_type": "NVIDIA GeForce RTX 3050", "gpu_vram_gb": 4,
-    },
-    {
-        "name": "HP 15s-fq5327TU", "brand": "HP", "os": "Windows 11", "utility": "Everyday Use",
-        "cpu_full": "12th Gen Core i3 1215U", "ram_gb": 8, "storage_gb": 512, 
-        "screen_size_in": 15.6, "spec_score": 55, "price_inr": 37900,
-        "gpu_type": "Intel UHD Graphics", "gpu_vram_gb": 0,
-    },
-    {
-        "name": "Aspire 7 A715", "brand": "Acer", "os": "Windows 11", "utility": "Performance",
-        "cpu_full": "13th Gen Core i5 13420H", "ram_gb": 16, "storage_gb": 512, 
-        "screen_size_in": 15.6, "spec_score": 64, "price_inr": 52990,
-        "gpu_type": "NVIDIA GeForce RTX 3050", "gpu_vram_gb": 6,
-    },
-    {
-        "name": "HP ‎15-fd0467TU", "brand": "HP", "os": "Windows 11", "utility": "Everyday Use",
-        "cpu_full": "13th Gen Core i5 1334U", "ram_gb": 16, "storage_gb": 512, 
-        "screen_size_in": 15.6, "spec_score": 57, "price_inr": 49550,
-        "gpu_type": "Intel Iris Xe Graphics", "gpu_vram_gb": 0,
-    },
-    {
-        "name": "Expertbook P1 14", "brand": "Asus", "os": "Windows 11", "utility": "Business",
-        "cpu_full": "13th Gen Core i3 1315U", "ram_gb": 16, "storage_gb": 512, 
-        "screen_size_in": 14.0, "spec_score": 60, "price_inr": 41990,
-        "gpu_type": "Intel Integrated UHD", "gpu_vram_gb": 0,
-    },
-    {
-        "name": "MacBook Air 2025", "brand": "Apple", "os": "Mac OS", "utility": "Everyday Use",
-        "cpu_full": "Apple M4", "ram_gb": 16, "storage_gb": 256, 
-        "screen_size_in": 13.6, "spec_score": 45, "price_inr": 95990,
-        "gpu_type": "Apple 8 Core GPU", "gpu_vram_gb": 0,
-    },
-    {
-        "name": "Galaxy Book 4", "brand": "Samsung", "os": "Windows 11", "utility": "Everyday Use",
-        "cpu_full": "13th Gen Intel Core i3 1315U", "ram_gb": 8, "storage_gb": 512, 
-        "screen_size_in": 15.6, "spec_score": 54, "price_inr": 37999,
-        "gpu_type": "Intel Graphics", "gpu_vram_gb": 0,
-    },
-    {
-        "name": "MacBook Air 2022", "brand": "Apple", "os": "Mac OS", "utility": "Everyday Use",
-        "cpu_full": "Apple M2", "ram_gb": 16, "storage_gb": 256, 
-        "screen_size_in": 13.6, "spec_score": 42, "price_inr": 64990,
-        "gpu_type": "10-Core GPU", "gpu_vram_gb": 0,
-    },
-    {
-        "name": "Aspire 3 A324", "brand": "Acer", "os": "Windows 11", "utility": "Everyday Use",
-        "cpu_full": "12th Gen Core i3 1215U", "ram_gb": 8, "storage_gb": 512, 
-        "screen_size_in": 14.0, "spec_score": 51, "price_inr": 27990,
-        "gpu_type": "Intel Integrated UHD", "gpu_vram_gb": 0,
-    },
-    {
-        "name": "Latitude 3550", "brand": "Dell", "os": "Windows 11", "utility": "Business",
-        "cpu_full": "13th Gen Core i3 1315U", "ram_gb": 16, "storage_gb": 512, 
-        "screen_size_in": 15.6, "spec_score": 59, "price_inr": 37990,
-        "gpu_type": "Intel Integrated UHD Graphics", "gpu_vram_gb": 0,
-    },
-    {
-        "name": "Victus 15-fa2382TX", "brand": "HP", "os": "Windows 11", "utility": "Gaming",
-        "cpu_full": "14th Gen Core i5 14450HX", "ram_gb": 24, "storage_gb": 512, 
-        "screen_size_in": 15.6, "spec_score": 71, "price_inr": 84989,
-        "gpu_type": "NVIDIA GeForce RTX 4050", "gpu_vram_gb": 6,
-    },
-    {
-        "name": "LOQ 83JE00U7IN", "brand": "Lenovo", "os": "Windows 11", "utility": "Gaming",
-        "cpu_full": "14th Gen Core i7 14700HX", "ram_gb": 16, "storage_gb": 1024, # 1TB SSD
-        "screen_size_in": 15.6, "spec_score": 78, "price_inr": 112116,
-        "gpu_type": "NVIDIA GeForce RTX 5050", "gpu_vram_gb": 8,
-    },
-    {
-        "name": "TUF Gaming A15", "brand": "Asus", "os": "Windows 11", "utility": "Gaming",
-        "cpu_full": "AMD Ryzen 7 7435HS", "ram_gb": 16, "storage_gb": 1024, # 1TB SSD
-        "screen_size_in": 15.6, "spec_score": 71, "price_inr": 66990,
-        "gpu_type": "NVIDIA GeForce RTX 3050", "gpu_vram_gb": 4,
-    },
-    {
-        "name": "LOQ 15ARP9", "brand": "Lenovo", "os": "Windows 11", "utility": "Gaming",
-        "cpu_full": "AMD Ryzen 7 7435H", "ram_gb": 24, "storage_gb": 512, 
-        "screen_size_in": 15.6, "spec_score": 72, "price_inr": 93290,
-        "gpu_type": "NVIDIA GeForce RTX 4060", "gpu_vram_gb": 8,
-    },
-    {
-        "name": "Zenbook Pro Duo 16", "brand": "Asus", "os": "Windows 11 Pro", "utility": "Creative/Pro",
-        "cpu_full": "Intel Core Ultra 9 285H", "ram_gb": 32, "storage_gb": 2048, 
-        "screen_size_in": 16.0, "spec_score": 85, "price_inr": 235990,
-        "gpu_type": "NVIDIA GeForce RTX 5080", "gpu_vram_gb": 16,
-    },
-    {
-        "name": "Latitude 5400", "brand": "Dell", "os": "Windows 11 Pro", "utility": "Business",
-        "cpu_full": "14th Gen Core i5 1430U", "ram_gb": 8, "storage_gb": 256, 
-        "screen_size_in": 14.0, "spec_score": 58, "price_inr": 54990,
-        "gpu_type": "Intel Integrated Iris Xe", "gpu_vram_gb": 0,
-    },
-    {
-        "name": "OMEN 17", "brand": "HP", "os": "Windows 11", "utility": "Gaming",
-        "cpu_full": "14th Gen Core i9 14900HX", "ram_gb": 32, "storage_gb": 1024, 
-        "screen_size_in": 17.3, "spec_score": 92, "price_inr": 195000,
-        "gpu_type": "NVIDIA GeForce RTX 5090", "gpu_vram_gb": 16,
-    },
-    {
-        "name": "ThinkPad X1 Carbon", "brand": "Lenovo", "os": "Windows 11 Pro", "utility": "Business",
-        "cpu_full": "Intel Core Ultra 7 165U", "ram_gb": 16, "storage_gb": 512, 
-        "screen_size_in": 14.0, "spec_score": 62, "price_inr": 139990,
-        "gpu_type": "Integrated Intel Arc", "gpu_vram_gb": 0,
-    },
-    {
-        "name": "Chromebook Plus", "brand": "Acer", "os": "ChromeOS", "utility": "Everyday Use",
-        "cpu_full": "Intel Core i3 N305", "ram_gb": 8, "storage_gb": 256, 
-        "screen_size_in": 15.6, "spec_score": 40, "price_inr": 29990,
-        "gpu_type": "Integrated Intel UHD", "gpu_vram_gb": 0,
-    },
-    {
-        "name": "Blade 14", "brand": "Razer", "os": "Windows 11", "utility": "Gaming",
-        "cpu_full": "AMD Ryzen 9 8945HS", "ram_gb": 32, "storage_gb": 1024, 
-        "screen_size_in": 14.0, "spec_score": 80, "price_inr": 169000,
-        "gpu_type": "NVIDIA GeForce RTX 4070", "gpu_vram_gb": 8,
-    },
-    {
-        "name": "Surface Laptop 7", "brand": "Microsoft", "os": "Windows 11 Pro", "utility": "Business",
-        "cpu_full": "Snapdragon X Elite", "ram_gb": 16, "storage_gb": 512, 
-        "screen_size_in": 13.8, "spec_score": 65, "price_inr": 124999,
-        "gpu_type": "Qualcomm Adreno GPU", "gpu_vram_gb": 0,
-    },
-    {
-        "name": "Alienware m18 R3", "brand": "Dell", "os": "Windows 11", "utility": "Gaming",
-        "cpu_full": "Intel Core i9 15980HX", "ram_gb": 64, "storage_gb": 4096, # 4TB SSD
-        "screen_size_in": 18.0, "spec_score": 98, "price_inr": 419999,
-        "gpu_type": "NVIDIA GeForce RTX 5090", "gpu_vram_gb": 16,
-    },
-    {
-        "name": "Vivobook S15", "brand": "Asus", "os": "Windows 11", "utility": "Performance",
-        "cpu_full": "AMD Ryzen AI 9 HX 370", "ram_gb": 32, "storage_gb": 1024, 
-        "screen_size_in": 15.6, "spec_score": 75, "price_inr": 109990,
-        "gpu_type": "AMD Radeon 880M", "gpu_vram_gb": 0,
-    },
-    {
-        "name": "ProBook 450 G11", "brand": "HP", "os": "Windows 11 Pro", "utility": "Business",
-        "cpu_full": "Intel Core Ultra 5 125U", "ram_gb": 16, "storage_gb": 512, 
-        "screen_size_in": 15.6, "spec_score": 60, "price_inr": 89990,
-        "gpu_type": "Integrated Intel Arc", "gpu_vram_gb": 0,
-    },
-    {
-        "name": "ThinkBook 16", "brand": "Lenovo", "os": "Windows 11", "utility": "Everyday Use",
-        "cpu_full": "Intel Core 5 210H", "ram_gb": 16, "storage_gb": 512, 
-        "screen_size_in": 16.0, "spec_score": 52, "price_inr": 59990,
-        "gpu_type": "Integrated Intel Graphics", "gpu_vram_gb": 0,
-    },
-    {
-        "name": "Swift Go 14", "brand": "Acer", "os": "Windows 11", "utility": "Everyday Use",
-        "cpu_full": "AMD Ryzen 5 7535U", "ram_gb": 8, "storage_gb": 512, 
-        "screen_size_in": 14.0, "spec_score": 48, "price_inr": 45990,
-        "gpu_type": "AMD Radeon 660M", "gpu_vram_gb": 0,
-    },
-    {
-        "name": "Zephyrus G14 2025", "brand": "Asus", "os": "Windows 11", "utility": "Gaming",
-        "cpu_full": "AMD Ryzen AI 9 HX 370", "ram_gb": 32, "storage_gb": 2048,
-        "screen_size_in": 14.0, "spec_score": 88, "price_inr": 221990,
-        "gpu_type": "NVIDIA GeForce RTX 5070 Ti", "gpu_vram_gb": 12,
-    },
-    {
-        "name": "Omen 16-xd0015AX", "brand": "HP", "os": "Windows 11", "utility": "Gaming",
-        "cpu_full": "AMD Ryzen 7 7840HS", "ram_gb": 16, "storage_gb": 1024,
-        "screen_size_in": 16.1, "spec_score": 75, "price_inr": 95989,
-        "gpu_type": "NVIDIA GeForce RTX 4050", "gpu_vram_gb": 6,
-    },
-    {
-        "name": "Katana A17 AI B8VE-884IN", "brand": "MSI", "os": "Windows 11 Home", "utility": "Gaming",
-        "cpu_full": "AMD Ryzen 9 8945HS", "ram_gb": 16, "storage_gb": 1024,
-        "screen_size_in": 17.3, "spec_score": 75, "price_inr": 96990,
-        "gpu_type": "NVIDIA GeForce RTX 4050", "gpu_vram_gb": 6,
-    },
-    {
-        "name": "Victus 15-fb2117AX", "brand": "HP", "os": "Windows 11", "utility": "Gaming",
-        "cpu_full": "AMD Ryzen 7 8845HS", "ram_gb": 16, "storage_gb": 1024,
-        "screen_size_in": 15.6, "spec_score": 74, "price_inr": 90990,
-        "gpu_type": "NVIDIA GeForce RTX 4050", "gpu_vram_gb": 6,
-    },
-    {
-        "name": "Summit E14 Flip Evo", "brand": "MSI", "os": "Windows 11", "utility": "Business",
-        "cpu_full": "13th Gen Intel Core i7 1360P", "ram_gb": 16, "storage_gb": 1024,
-        "screen_size_in": 14.0, "spec_score": 74, "price_inr": 94990,
-        "gpu_type": "Intel Integrated Iris Xe", "gpu_vram_gb": 0,
-    },
-    {
-        "name": "TUF Gaming A15 FA507NUR", "brand": "Asus", "os": "Windows 11", "utility": "Gaming",
-        "cpu_full": "AMD Ryzen 7 7435HS", "ram_gb": 16, "storage_gb": 512,
-        "screen_size_in": 15.6, "spec_score": 73, "price_inr": 81990,
-        "gpu_type": "NVIDIA GeForce RTX 4050", "gpu_vram_gb": 6,
-    },
-    {
-        "name": "Katana 15 HX B14WEK", "brand": "MSI", "os": "Windows 11 Home", "utility": "Gaming",
-        "cpu_full": "14th Gen Intel Core i5 14450HX", "ram_gb": 16, "storage_gb": 512,
-        "screen_size_in": 15.6, "spec_score": 73, "price_inr": 92990,
-        "gpu_type": "NVIDIA GeForce RTX 5050", "gpu_vram_gb": 8,
-    },
-    {
-        "name": "Yoga 7 14ARP8", "brand": "Lenovo", "os": "Windows 11 Home", "utility": "Everyday Use",
-        "cpu_full": "AMD Ryzen 7 7735U", "ram_gb": 16, "storage_gb": 1024,
-        "screen_size_in": 14.0, "spec_score": 73, "price_inr": 84890,
-        "gpu_type": "Integrated AMD Radeon 680M Graphics", "gpu_vram_gb": 0,
-    },
-    {
-        "name": "Victus 15-fa1134TX", "brand": "HP", "os": "Windows 11 Home", "utility": "Gaming",
-        "cpu_full": "12th Gen Intel Core i7 12650H", "ram_gb": 16, "storage_gb": 512,
-        "screen_size_in": 15.6, "spec_score": 73, "price_inr": 79749,
-        "gpu_type": "NVIDIA GeForce RTX 4050", "gpu_vram_gb": 6,
-    },
-    {
-        "name": "Thin A15 AI B7VE-065IN", "brand": "MSI", "os": "Windows 11", "utility": "Gaming",
-        "cpu_full": "AMD Ryzen 7 7735HS", "ram_gb": 16, "storage_gb": 1024,
-        "screen_size_in": 15.6, "spec_score": 73, "price_inr": 93511,
-        "gpu_type": "NVIDIA GeForce RTX 4050", "gpu_vram_gb": 6,
-    },
-    {
-        "name": "ROG Zephyrus G15 GA503RM", "brand": "Asus", "os": "Windows 11", "utility": "Gaming",
-        "cpu_full": "AMD Ryzen 7 6800HS", "ram_gb": 16, "storage_gb": 1024,
-        "screen_size_in": 15.6, "spec_score": 73, "price_inr": 99800,
-        "gpu_type": "NVIDIA GeForce RTX 3060", "gpu_vram_gb": 6,
-    },
-    {
-        "name": "Victus 16-s0095AX", "brand": "HP", "os": "Windows 11", "utility": "Gaming",
-        "cpu_full": "AMD Ryzen 7 7840HS", "ram_gb": 16, "storage_gb": 512,
-        "screen_size_in": 16.1, "spec_score": 72, "price_inr": 82450,
-        "gpu_type": "NVIDIA GeForce RTX 3050", "gpu_vram_gb": 6,
-    },
-    {
-        "name": "Victus 15-fb3012AX (RTX 3050)", "brand": "HP", "os": "Windows 11", "utility": "Gaming",
-        "cpu_full": "AMD Ryzen 5 8645HS", "ram_gb": 16, "storage_gb": 512,
-        "screen_size_in": 15.6, "spec_score": 72, "price_inr": 65990,
-        "gpu_type": "NVIDIA GeForce RTX 3050", "gpu_vram_gb": 6,
-    },
-    {
-        "name": "LOQ 15ARP9 (RTX 4060)", "brand": "Lenovo", "os": "Windows 11", "utility": "Gaming",
-        "cpu_full": "AMD Ryzen 7 7435H", "ram_gb": 24, "storage_gb": 512,
-        "screen_size_in": 15.6, "spec_score": 72, "price_inr": 93290,
-        "gpu_type": "NVIDIA GeForce RTX 4060", "gpu_vram_gb": 8,
-    },
-    {
-        "name": "Victus 15-fb3009AX", "brand": "HP", "os": "Windows 11", "utility": "Gaming",
-        "cpu_full": "AMD Ryzen 5 8645HS", "ram_gb": 16, "storage_gb": 512,
-        "screen_size_in": 15.6, "spec_score": 72, "price_inr": 65399,
-        "gpu_type": "NVIDIA GeForce RTX 3050", "gpu_vram_gb": 6,
-    },
-    {
-        "name": "TUF Gaming F16 FX608JH", "brand": "Asus", "os": "Windows 11", "utility": "Gaming",
-        "cpu_full": "13th Gen Intel Core i5 13450HX", "ram_gb": 16, "storage_gb": 1024,
-        "screen_size_in": 16.0, "spec_score": 72, "price_inr": 99990,
-        "gpu_type": "NVIDIA GeForce RTX 5050", "gpu_vram_gb": 8,
-    },
-    {
-        "name": "Creator M16 A11UD", "brand": "MSI", "os": "Windows 10", "utility": "Creative/Pro",
-        "cpu_full": "11th Gen Intel Core i7 11800H", "ram_gb": 16, "storage_gb": 1024,
-        "screen_size_in": 16.0, "spec_score": 72, "price_inr": 74989,
-        "gpu_type": "NVIDIA GeForce RTX 3050 Ti", "gpu_vram_gb": 4,
-    },
-    {
-        "name": "Zenbook 14 OLED 2025", "brand": "Asus", "os": "Windows 11 Home", "utility": "Everyday Use",
-        "cpu_full": "Intel Core Ultra 5 225H", "ram_gb": 16, "storage_gb": 1024,
-        "screen_size_in": 14.0, "spec_score": 72, "price_inr": 92990,
-        "gpu_type": "Intel Integrated Arc", "gpu_vram_gb": 0,
-    },
-    {
-        "name": "VenturePro 15 AI A1UDXG", "brand": "MSI", "os": "Windows 11", "utility": "Performance",
-        "cpu_full": "Intel Core Ultra 5 125H", "ram_gb": 16, "storage_gb": 1024,
-        "screen_size_in": 15.6, "spec_score": 72, "price_inr": 95990,
-        "gpu_type": "NVIDIA GeForce RTX 3050", "gpu_vram_gb": 6,
-    },
-    {
-        "name": "TUF Gaming F15 FX577ZC (RTX 3050)", "brand": "Asus", "os": "Windows 11", "utility": "Gaming",
-        "cpu_full": "12th Gen Intel Core i7 12700H", "ram_gb": 16, "storage_gb": 1024,
-        "screen_size_in": 15.6, "spec_score": 72, "price_inr": 79990,
-        "gpu_type": "NVIDIA GeForce RTX 3050", "gpu_vram_gb": 4,
-    },
-    {
-        "name": "Nitro 16 AN16-41 (8GB RAM)", "brand": "Acer", "os": "Windows 11 Home", "utility": "Gaming",
-        "cpu_full": "AMD Ryzen 7 7840HS", "ram_gb": 8, "storage_gb": 512,
-        "screen_size_in": 16.0, "spec_score": 72, "price_inr": 98349,
-        "gpu_type": "NVIDIA GeForce RTX 4050", "gpu_vram_gb": 6,
-    },
-    {
-        "name": "Spectre x360 13-ef0053TU", "brand": "HP", "os": "Windows 11", "utility": "Everyday Use",
-        "cpu_full": "12th Gen Intel Core i7 1255U", "ram_gb": 16, "storage_gb": 512,
-        "screen_size_in": 13.5, "spec_score": 72, "price_inr": 91449,
-        "gpu_type": "Intel Iris X Graphics", "gpu_vram_gb": 0,
-    },
-    {
-        "name": "TUF Gaming A15 FA566NCR-HN075W (RTX 3050)", "brand": "Asus", "os": "Windows 11 Home", "utility": "Gaming",
-        "cpu_full": "AMD Ryzen 7 7435HS", "ram_gb": 16, "storage_gb": 1024,
-        "screen_size_in": 15.6, "spec_score": 71, "price_inr": 66990,
-        "gpu_type": "NVIDIA GeForce RTX 3050", "gpu_vram_gb": 4,
-    },
-    {
-        "name": "Victus 15-fa0187TX (RTX 3050)", "brand": "HP", "os": "Windows 11", "utility": "Gaming",
-        "cpu_full": "12th Gen Intel Core i7 12650H", "ram_gb": 16, "storage_gb": 1024,
-        "screen_size_in": 15.6, "spec_score": 71, "price_inr": 82999,
-        "gpu_type": "NVIDIA GeForce RTX 3050", "gpu_vram_gb": 4,
-    },
-    {
-        "name": "ThinkPad E14 Gen 6 (32GB RAM)", "brand": "Lenovo", "os": "Windows 11", "utility": "Business",
-        "cpu_full": "Intel Core Ultra 5 125U", "ram_gb": 32, "storage_gb": 512,
-        "screen_size_in": 14.0, "spec_score": 71, "price_inr": 98000,
-        "gpu_type": "Integrated Intel Graphics", "gpu_vram_gb": 0,
-    },
-    {
-        "name": "OmniBook X Flip 14", "brand": "HP", "os": "Windows 11", "utility": "Everyday Use",
-        "cpu_full": "Intel Core Ultra 5 226V", "ram_gb": 16, "storage_gb": 512,
-        "screen_size_in": 14.0, "spec_score": 71, "price_inr": 97197,
-        "gpu_type": "Intel Arc Graphics", "gpu_vram_gb": 0,
-    },
-    {
-        "name": "Thin 15 B12VE", "brand": "MSI", "os": "Windows 11", "utility": "Gaming",
-        "cpu_full": "12th Gen Intel Core i7 12650H", "ram_gb": 16, "storage_gb": 512,
-        "screen_size_in": 15.6, "spec_score": 71, "price_inr": 84990,
-        "gpu_type": "NVIDIA GeForce RTX 4050", "gpu_vram_gb": 6,
-    },
-    {
-        "name": "Thin A15 AI B7VE-066IN", "brand": "MSI", "os": "Windows 11", "utility": "Gaming",
-        "cpu_full": "AMD Ryzen 5 7535HS", "ram_gb": 16, "storage_gb": 512,
-        "screen_size_in": 15.6, "spec_score": 71, "price_inr": 75511,
-        "gpu_type": "NVIDIA GeForce RTX 4050", "gpu_vram_gb": 6,
-    },
-    {
-        "name": "Acer Nitro 5 AN515-58", "brand": "Acer", "os": "Windows 11", "utility": "Gaming",
-        "cpu_full": "12th Gen Intel Core i7 12700H", "ram_gb": 16, "storage_gb": 1024,
-        "screen_size_in": 15.6, "spec_score": 71, "price_inr": 95999,
-        "gpu_type": "NVIDIA GeForce RTX 3060", "gpu_vram_gb": 6,
-    },
-    {
-        "name": "Victus 16-e1060AX", "brand": "HP", "os": "Windows 11", "utility": "Gaming",
-        "cpu_full": "AMD Ryzen 7 6800H", "ram_gb": 16, "storage_gb": 512,
-        "screen_size_in": 16.1, "spec_score": 71, "price_inr": 76990,
-        "gpu_type": "NVIDIA GeForce RTX 3050 Ti", "gpu_vram_gb": 4,
-    },
-    {
-        "name": "Thin A15 AI B7UC-067IN", "brand": "MSI", "os": "Windows 11", "utility": "Gaming",
-        "cpu_full": "AMD Ryzen 5 7535HS", "ram_gb": 16, "storage_gb": 512,
-        "screen_size_in": 15.6, "spec_score": 70, "price_inr": 49990,
-        "gpu_type": "NVIDIA GeForce RTX 3050", "gpu_vram_gb": 4,
-    },
-    {
-        "name": "LOQ 15ARP9 (RTX 3050A)", "brand": "Lenovo", "os": "Windows 11", "utility": "Gaming",
-        "cpu_full": "AMD Ryzen 7 7435HS", "ram_gb": 24, "storage_gb": 512,
-        "screen_size_in": 15.6, "spec_score": 70, "price_inr": 71290,
-        "gpu_type": "NVIDIA GeForce RTX 3050 A", "gpu_vram_gb": 4,
-    },
-    {
-        "name": "Nitro V ANV15-41", "brand": "Acer", "os": "Windows 11", "utility": "Gaming",
-        "cpu_full": "AMD Ryzen 7 7735HS", "ram_gb": 16, "storage_gb": 512,
-        "screen_size_in": 15.6, "spec_score": 70, "price_inr": 71990,
-        "gpu_type": "NVIDIA GeForce RTX 4050", "gpu_vram_gb": 6,
-    },
-    {
-        "name": "LOQ 83JC00MVIN", "brand": "Lenovo", "os": "Windows 11", "utility": "Gaming",
-        "cpu_full": "AMD Ryzen 7 7435H", "ram_gb": 16, "storage_gb": 512,
-        "screen_size_in": 15.6, "spec_score": 70, "price_inr": 85290,
-        "gpu_type": "NVIDIA GeForce RTX 4050", "gpu_vram_gb": 6,
-    },
-    {
-        "name": "Victus 15-fb3004AX (RTX 2050)", "brand": "HP", "os": "Windows 11", "utility": "Gaming",
-        "cpu_full": "AMD Ryzen 5 8645HS", "ram_gb": 16, "storage_gb": 512,
-        "screen_size_in": 15.6, "spec_score": 70, "price_inr": 61750,
-        "gpu_type": "NVIDIA GeForce RTX 2050", "gpu_vram_gb": 4,
-    },
-    {
-        "name": "TUF Gaming F16 FX677VU", "brand": "Asus", "os": "Windows 11", "utility": "Gaming",
-        "cpu_full": "13th Gen Intel Core i7 13620H", "ram_gb": 16, "storage_gb": 512,
-        "screen_size_in": 16.0, "spec_score": 70, "price_inr": 92990,
-        "gpu_type": "NVIDIA GeForce RTX 4050", "gpu_vram_gb": 6,
-    },
-    {
-        "name": "LOQ 15ARP9 (RTX 4050)", "brand": "Lenovo", "os": "Windows 11", "utility": "Gaming",
-        "cpu_full": "AMD Ryzen 7 7435H", "ram_gb": 24, "storage_gb": 512,
-        "screen_size_in": 15.6, "spec_score": 70, "price_inr": 92990,
-        "gpu_type": "NVIDIA GeForce RTX 4050", "gpu_vram_gb": 6,
-    },
-    {
-        "name": "Vivobook 16X 2023 K3605ZC", "brand": "Asus", "os": "Windows 11", "utility": "Performance",
-        "cpu_full": "12th Gen Intel Core i5 12500H", "ram_gb": 16, "storage_gb": 512,
-        "screen_size_in": 16.0, "spec_score": 70, "price_inr": 64999,
-        "gpu_type": "NVIDIA GeForce RTX 3050", "gpu_vram_gb": 4,
-    },
-    {
-        "name": "Katana A15 AI B8VE-418IN", "brand": "MSI", "os": "Windows 11", "utility": "Gaming",
-        "cpu_full": "AMD Ryzen 7 8845HS", "ram_gb": 16, "storage_gb": 512,
-        "screen_size_in": 15.75, "spec_score": 70, "price_inr": 82990,
-        "gpu_type": "NVIDIA GeForce RTX 4050", "gpu_vram_gb": 6,
-    },
-    {
-        "name": "Galaxy Book 3 Pro NP960XFG", "brand": "Samsung", "os": "Windows 11", "utility": "Business",
-        "cpu_full": "13th Gen Intel Core i7 1360P", "ram_gb": 16, "storage_gb": 1024,
-        "screen_size_in": 16.0, "spec_score": 70, "price_inr": 99259,
-        "gpu_type": "Intel Iris Xe Graphics", "gpu_vram_gb": 0,
-    },
-    {
-        "name": "ThinkPad E14 Gen 6 (Core Ultra 7)", "brand": "Lenovo", "os": "Windows 11", "utility": "Business",
-        "cpu_full": "Intel Core Ultra 7 Series 1 155H", "ram_gb": 16, "storage_gb": 512,
-        "screen_size_in": 14.0, "spec_score": 70, "price_inr": 91390,
-        "gpu_type": "Integrated Intel Graphics", "gpu_vram_gb": 0,
-    },
-    {
-        "name": "Thin 15 B12UC-2240IN", "brand": "MSI", "os": "Windows 11 Home", "utility": "Gaming",
-        "cpu_full": "12th Gen Intel Core i7 12650H", "ram_gb": 16, "storage_gb": 512,
-        "screen_size_in": 15.6, "spec_score": 70, "price_inr": 71990,
-        "gpu_type": "NVIDIA GeForce RTX 3050", "gpu_vram_gb": 4,
-    },
-    {
-        "name": "ZBook Firefly 14 G11", "brand": "HP", "os": "Windows 11", "utility": "Business",
-        "cpu_full": "Intel Core Ultra 7 155U", "ram_gb": 16, "storage_gb": 512,
-        "screen_size_in": 14.0, "spec_score": 70, "price_inr": 90990,
-        "gpu_type": "Intel Arc Graphics", "gpu_vram_gb": 0,
-    },
-    {
-        "name": "TUF Gaming A15 FA566NCR-HN075W (RTX 3050)", "brand": "Asus", "os": "Windows 11 Home", "utility": "Gaming",
-        "cpu_full": "AMD Ryzen 7 7435HS", "ram_gb": 16, "storage_gb": 512,
-        "screen_size_in": 15.6, "spec_score": 70, "price_inr": 62248,
-        "gpu_type": "NVIDIA GeForce RTX 3050", "gpu_vram_gb": 4,
-    },
-    {
-        "name": "Thin 15 B12UCX", "brand": "MSI", "os": "Windows 11 Home", "utility": "Gaming",
-        "cpu_full": "12th Gen Intel Core i7 12650H", "ram_gb": 16, "storage_gb": 512,
-        "screen_size_in": 15.6, "spec_score": 70, "price_inr": 60999,
-        "gpu_type": "NVIDIA GeForce RTX 2050", "gpu_vram_gb": 4,
-    },
-    {
-        "name": "Prestige 16 AI Evo B1MG", "brand": "MSI", "os": "Windows 11", "utility": "Performance",
-        "cpu_full": "Intel Core Ultra 7 Series 1 155H", "ram_gb": 16, "storage_gb": 1024,
-        "screen_size_in": 16.0, "spec_score": 70, "price_inr": 88700,
-        "gpu_type": "Intel Integrated Arc", "gpu_vram_gb": 0,
-    },
-    {
-        "name": "Vivobook 16X K3605ZF", "brand": "Asus", "os": "Windows 11 Home", "utility": "Performance",
-        "cpu_full": "12th Gen Intel Core i7 12650H", "ram_gb": 16, "storage_gb": 512,
-        "screen_size_in": 16.0, "spec_score": 70, "price_inr": 64999,
-        "gpu_type": "NVIDIA GeForce RTX 2050", "gpu_vram_gb": 4,
-    },
-    {
-        "name": "Zbook Power G4-A", "brand": "HP", "os": "Windows 11", "utility": "Business",
-        "cpu_full": "AMD Ryzen 7 6800H", "ram_gb": 16, "storage_gb": 1024,
-        "screen_size_in": 15.6, "spec_score": 70, "price_inr": 99999,
-        "gpu_type": "NVIDIA Quadro T600", "gpu_vram_gb": 4,
-    },
-    {
-        "name": "Envy x360 15-ew0047TU", "brand": "HP", "os": "Windows 11", "utility": "Everyday Use",
-        "cpu_full": "12th Gen Intel Core i7 1255U", "ram_gb": 16, "storage_gb": 512,
-        "screen_size_in": 15.6, "spec_score": 70, "price_inr": 88999,
-        "gpu_type": "Intel Iris X Graphics", "gpu_vram_gb": 0,
-    },
-    {
-        "name": "TUF Gaming F17 FX777ZC", "brand": "Asus", "os": "Windows 11 Home", "utility": "Gaming",
-        "cpu_full": "12th Gen Intel Core i5 12500H", "ram_gb": 16, "storage_gb": 512,
-        "screen_size_in": 17.3, "spec_score": 70, "price_inr": 95899,
-        "gpu_type": "NVIDIA GeForce RTX 3050", "gpu_vram_gb": 4,
-    },
-    {
-        "name": "TUF Gaming A17 FA706IU-HX415T", "brand": "Asus", "os": "Windows 10", "utility": "Gaming",
-        "cpu_full": "4th Gen AMD Ryzen 7 4800H", "ram_gb": 16, "storage_gb": 256, 
-        "screen_size_in": 17.3, "spec_score": 70, "price_inr": 92990,
-        "gpu_type": "NVIDIA GeForce GTX 1660 Ti", "gpu_vram_gb": 6,
-    },
-    {
-        "name": "Victus 15-fa0188TX", "brand": "HP", "os": "Windows 11", "utility": "Gaming",
-        "cpu_full": "12th Gen Intel Core i7 12650H", "ram_gb": 16, "storage_gb": 512,
-        "screen_size_in": 15.6, "spec_score": 70, "price_inr": 77900,
-        "gpu_type": "NVIDIA GeForce RTX 3050", "gpu_vram_gb": 4,
-    },
-    {
-        "name": "LOQ 15IRX9", "brand": "Lenovo", "os": "Windows 11", "utility": "Gaming",
-        "cpu_full": "13th Gen Intel Core i5 13450HX", "ram_gb": 24, "storage_gb": 512,
-        "screen_size_in": 15.6, "spec_score": 69, "price_inr": 74787,
-        "gpu_type": "NVIDIA GeForce RTX 3050", "gpu_vram_gb": 6,
-    },
-    {
-        "name": "TUF Gaming A15 FA506NCG-HN200WS", "brand": "Asus", "os": "Windows 11", "utility": "Gaming",
-        "cpu_full": "AMD Ryzen 7 7445HS", "ram_gb": 16, "storage_gb": 512,
-        "screen_size_in": 15.6, "spec_score": 69, "price_inr": 65990,
-        "gpu_type": "NVIDIA GeForce RTX 3050", "gpu_vram_gb": 4,
-    },
-    {
-        "name": "Nitro V ANV15-52", "brand": "Acer", "os": "Windows 11", "utility": "Gaming",
-        "cpu_full": "13th Gen Intel Core i7 13620H", "ram_gb": 16, "storage_gb": 512,
-        "screen_size_in": 15.6, "spec_score": 69, "price_inr": 92990,
-        "gpu_type": "NVIDIA GeForce RTX 5050", "gpu_vram_gb": 8,
-    },
-    {
-        "name": "ThinkBook 16 G6", "brand": "Lenovo", "os": "Windows 11 Home", "utility": "Everyday Use",
-        "cpu_full": "AMD Ryzen 7 7730U", "ram_gb": 16, "storage_gb": 512,
-        "screen_size_in": 16.0, "spec_score": 69, "price_inr": 55550,
-        "gpu_type": "AMD Radeon Graphics", "gpu_vram_gb": 0,
-    },
-    {
-        "name": "Vivobook 16X K3605ZF (RTX 2050)", "brand": "Asus", "os": "Windows 11", "utility": "Performance",
-        "cpu_full": "12th Gen Intel Core i5 12500H", "ram_gb": 16, "storage_gb": 512,
-        "screen_size_in": 16.0, "spec_score": 69, "price_inr": 57990,
-        "gpu_type": "NVIDIA GeForce RTX 2050", "gpu_vram_gb": 4,
-    },
-    {
-        "name": "Dell G15-5530 (i7, RTX 3050 6GB)", "brand": "Dell", "os": "Windows 11", "utility": "Gaming",
-        "cpu_full": "13th Gen Intel Core i7 13650HX", "ram_gb": 16, "storage_gb": 1024,
-        "screen_size_in": 15.6, "spec_score": 69, "price_inr": 90990,
-        "gpu_type": "NVIDIA GeForce RTX 3050", "gpu_vram_gb": 6,
-    },
-    {
-        "name": "Modern 15 H AI C2HMG", "brand": "MSI", "os": "Windows 11 Home", "utility": "Everyday Use",
-        "cpu_full": "Intel Core Ultra 7 255H", "ram_gb": 16, "storage_gb": 1024,
-        "screen_size_in": 15.6, "spec_score": 69, "price_inr": 80990,
-        "gpu_type": "Intel Arc Graphics", "gpu_vram_gb": 0,
-    },
-    {
-        "name": "Vivobook 16X K3605ZU", "brand": "Asus", "os": "Windows 11", "utility": "Performance",
-        "cpu_full": "12th Gen Intel Core i5 12500H", "ram_gb": 16, "storage_gb": 512,
-        "screen_size_in": 16.0, "spec_score": 69, "price_inr": 78500,
-        "gpu_type": "NVIDIA GeForce RTX 4050", "gpu_vram_gb": 6,
-    },
-    {
-        "name": "Yoga 7 14IRL8", "brand": "Lenovo", "os": "Windows 11 Home", "utility": "Everyday Use",
-        "cpu_full": "13th Gen Intel Core i5 1340P", "ram_gb": 16, "storage_gb": 512,
-        "screen_size_in": 14.0, "spec_score": 69, "price_inr": 85990,
-        "gpu_type": "Integrated Intel Iris Xe Graphics", "gpu_vram_gb": 0,
-    },
-    {
-        "name": "TUF Gaming F15 FX577ZC-HN193W", "brand": "Asus", "os": "Windows 11", "utility": "Gaming",
-        "cpu_full": "12th Gen Intel Core i7 12700H", "ram_gb": 16, "storage_gb": 512,
-        "screen_size_in": 15.6, "spec_score": 69, "price_inr": 82990,
-        "gpu_type": "NVIDIA GeForce RTX 3050", "gpu_vram_gb": 4,
-    },
-    {
-        "name": "TUF Gaming A15 FA506NC-HN083WS", "brand": "Asus", "os": "Windows 11 Home", "utility": "Gaming",
-        "cpu_full": "AMD Ryzen 5 7535HS", "ram_gb": 16, "storage_gb": 512,
-        "screen_size_in": 15.6, "spec_score": 69, "price_inr": 65500,
-        "gpu_type": "NVIDIA GeForce RTX 3050", "gpu_vram_gb": 4,
-    },
-    {
-        "name": "TUF Gaming F15 FX507VU", "brand": "Asus", "os": "Windows 11 Home", "utility": "Gaming",
-        "cpu_full": "13th Gen Intel Core i7 13620H", "ram_gb": 16, "storage_gb": 512,
-        "screen_size_in": 15.6, "spec_score": 69, "price_inr": 92990,
-        "gpu_type": "NVIDIA GeForce RTX 4050", "gpu_vram_gb": 6,
-    },
-    {
-        "name": "Nitro V ANV15-51 (1TB SSD)", "brand": "Acer", "os": "Windows 11", "utility": "Gaming",
-        "cpu_full": "13th Gen Intel Core i7 13620H", "ram_gb": 16, "storage_gb": 1024,
-        "screen_size_in": 15.6, "spec_score": 69, "price_inr": 88750,
-        "gpu_type": "NVIDIA GeForce RTX 4050", "gpu_vram_gb": 6,
-    },
-    {
-        "name": "Pavilion Plus 16-ab0015TX", "brand": "HP", "os": "Windows 11", "utility": "Performance",
-        "cpu_full": "13th Gen Intel Core i5 13500H", "ram_gb": 16, "storage_gb": 512,
-        "screen_size_in": 16.0, "spec_score": 69, "price_inr": 82990,
-        "gpu_type": "NVIDIA GeForce RTX 3050", "gpu_vram_gb": 6,
-    },
-    {
-        "name": "Prestige 14 AI Evo C1MG", "brand": "MSI", "os": "Windows 11 Home", "utility": "Business",
-        "cpu_full": "Intel Core Ultra 7 155H", "ram_gb": 16, "storage_gb": 1024,
-        "screen_size_in": 14.0, "spec_score": 69, "price_inr": 89990,
-        "gpu_type": "Intel Integrated Intel Arc", "gpu_vram_gb": 0,
-    },
-    {
-        "name": "Cyborg 15 A12UDX", "brand": "MSI", "os": "Windows 11", "utility": "Gaming",
-        "cpu_full": "12th Gen Intel Core i5 12450H", "ram_gb": 16, "storage_gb": 512,
-        "screen_size_in": 15.6, "spec_score": 69, "price_inr": 71699,
-        "gpu_type": "NVIDIA GeForce RTX 3050", "gpu_vram_gb": 6,
-    },
-    {
-        "name": "Thin A15 AI B7UCX-068IN", "brand": "MSI", "os": "Windows 11", "utility": "Gaming",
-        "cpu_full": "AMD Ryzen 5 7535HS", "ram_gb": 16, "storage_gb": 512,
-        "screen_size_in": 15.6, "spec_score": 69, "price_inr": 50800,
-        "gpu_type": "NVIDIA GeForce RTX 2050", "gpu_vram_gb": 4,
-    },
-    {
-        "name": "Pavilion Plus 14-ey0789AU", "brand": "HP", "os": "Windows 11", "utility": "Everyday Use",
-        "cpu_full": "AMD Ryzen 7 7840H", "ram_gb": 16, "storage_gb": 1024,
-        "screen_size_in": 14.0, "spec_score": 69, "price_inr": 76740,
-        "gpu_type": "AMD Radeon 780M Graphics", "gpu_vram_gb": 0,
-    },
-    {
-        "name": "LOQ 15APH8 82XT004HIN", "brand": "Lenovo", "os": "Windows 11", "utility": "Gaming",
-        "cpu_full": "AMD Ryzen 7 7840HS", "ram_gb": 16, "storage_gb": 512,
-        "screen_size_in": 15.6, "spec_score": 69, "price_inr": 83990,
-        "gpu_type": "NVIDIA GeForce RTX 3050", "gpu_vram_gb": 6,
-    },
-    {
-        "name": "Thin GF63 12VE", "brand": "MSI", "os": "Windows 11 Home", "utility": "Gaming",
-        "cpu_full": "12th Gen Intel Core i7 12650H", "ram_gb": 16, "storage_gb": 512,
-        "screen_size_in": 15.6, "spec_score": 69, "price_inr": 93499,
-        "gpu_type": "NVIDIA GeForce RTX 4050", "gpu_vram_gb": 6,
-    },
-    {
-        "name": "Galaxy Book 3 360", "brand": "Samsung", "os": "Windows 11", "utility": "Everyday Use",
-        "cpu_full": "13th Gen Intel Core i7 1360P", "ram_gb": 16, "storage_gb": 512,
-        "screen_size_in": 15.6, "spec_score": 69, "price_inr": 98399,
-        "gpu_type": "Intel Iris Xe Graphics", "gpu_vram_gb": 0,
-    },
-    {
-        "name": "Pavilion Plus 14-eh0037TU", "brand": "HP", "os": "Windows 11", "utility": "Everyday Use",
-        "cpu_full": "12th Gen Intel Core i5 12500H", "ram_gb": 16, "storage_gb": 512,
-        "screen_size_in": 14.0, "spec_score": 69, "price_inr": 84699,
-        "gpu_type": "Intel Integrated Iris Xe", "gpu_vram_gb": 0,
-    },
-    {
-        "name": "IdeaPad Flex 5 82R90068IN", "brand": "Lenovo", "os": "Windows 11 Home", "utility": "Everyday Use",
-        "cpu_full": "AMD Ryzen 7 5700U", "ram_gb": 16, "storage_gb": 512,
-        "screen_size_in": 14.0, "spec_score": 69, "price_inr": 67949,
-        "gpu_type": "AMD Radeon", "gpu_vram_gb": 0,
-    },
-    {
-        "name": "Omen 16-B0352TX", "brand": "HP", "os": "Windows 10", "utility": "Gaming",
-        "cpu_full": "11th Gen Intel Core i7 11800H", "ram_gb": 16, "storage_gb": 1024,
-        "screen_size_in": 16.1, "spec_score": 69, "price_inr": 99999,
-        "gpu_type": "NVIDIA GeForce RTX 3050 Ti Graphics", "gpu_vram_gb": 4,
-    },
-    {
-        "name": "ThinkPad E14 Gen 6 (Core Ultra 7, 1TB)", "brand": "Lenovo", "os": "Windows 11", "utility": "Business",
-        "cpu_full": "Intel Core Ultra 7 Series 1 155H", "ram_gb": 16, "storage_gb": 1024,
-        "screen_size_in": 14.0, "spec_score": 69, "price_inr": 99950,
-        "gpu_type": "Integrated Intel Graphics", "gpu_vram_gb": 0,
-    },
-    {
-        "name": "Katana 15 B13VEK", "brand": "MSI", "os": "Windows 11 Home", "utility": "Gaming",
-        "cpu_full": "13th Gen Intel Core i7 13700H", "ram_gb": 16, "storage_gb": 1024,
-        "screen_size_in": 15.6, "spec_score": 69, "price_inr": 95511,
-        "gpu_type": "NVIDIA GeForce RTX 4050", "gpu_vram_gb": 6,
-    },
-    {
-        "name": "ThinkPad E14 21JRS0H300", "brand": "Lenovo", "os": "Windows 11 Home", "utility": "Everyday Use",
-        "cpu_full": "AMD Ryzen 7 7730U", "ram_gb": 16, "storage_gb": 512,
-        "screen_size_in": 14.0, "spec_score": 69, "price_inr": 63850,
-        "gpu_type": "AMD Radeon Graphics", "gpu_vram_gb": 0,
-    },
-    {
-        "name": "Victus 15-FA1402TX", "brand": "HP", "os": "Windows 11", "utility": "Gaming",
-        "cpu_full": "12th Gen Intel Core i7 12650H", "ram_gb": 16, "storage_gb": 1024,
-        "screen_size_in": 15.6, "spec_score": 69, "price_inr": 80100,
-        "gpu_type": "NVIDIA GeForce RTX 3050A", "gpu_vram_gb": 4,
-    },
-    {
-        "name": "IdeaPad Flex 5 82R900D9IN", "brand": "Lenovo", "os": "Windows 11 Home", "utility": "Everyday Use",
-        "cpu_full": "AMD Ryzen 7 5700U", "ram_gb": 16, "storage_gb": 512,
-        "screen_size_in": 14.0, "spec_score": 69, "price_inr": 61990,
-        "gpu_type": "AMD Radeon", "gpu_vram_gb": 0,
-    },
-    {
-        "name": "Thinkpad E14 G4 21E3S02M00", "brand": "Lenovo", "os": "Windows 11 Pro", "utility": "Business",
-        "cpu_full": "12th Gen Intel Core i7 1255U", "ram_gb": 16, "storage_gb": 512,
-        "screen_size_in": 14.0, "spec_score": 69, "price_inr": 93854,
-        "gpu_type": "Intel Iris Xe Graphics", "gpu_vram_gb": 0,
-    },
-    {
-        "name": "Katana 15 B12UDXK", "brand": "MSI", "os": "Windows 11 Home", "utility": "Gaming",
-        "cpu_full": "12th Gen Intel Core i7 12650H", "ram_gb": 8, "storage_gb": 512,
-        "screen_size_in": 15.6, "spec_score": 69, "price_inr": 90299,
-        "gpu_type": "NVIDIA GeForce RTX 3050", "gpu_vram_gb": 6,
-    },
-    {
-        "name": "TUF Gaming A17 FA706IU-H7220T", "brand": "Asus", "os": "Windows 10 Home", "utility": "Gaming",
-        "cpu_full": "4th Gen AMD Ryzen 7 4800H", "ram_gb": 16, "storage_gb": 256, 
-        "screen_size_in": 17.3, "spec_score": 69, "price_inr": 91099,
-        "gpu_type": "NVIDIA Geforce GTX 1660 Ti", "gpu_vram_gb": 6,
-    },
-    {
-        "name": "Vivobook 14 S3407CA (Core Ultra 7)", "brand": "Asus", "os": "Windows 11", "utility": "Everyday Use",
-        "cpu_full": "Intel Core Ultra 7 255H", "ram_gb": 16, "storage_gb": 512,
-        "screen_size_in": 14.0, "spec_score": 68, "price_inr": 79990,
-        "gpu_type": "Intel Integrated Intel", "gpu_vram_gb": 0,
-    },
-    {
-        "name": "Nitro V 16 ANV16-71", "brand": "Acer", "os": "Windows 11", "utility": "Gaming",
-        "cpu_full": "14th Gen Intel Core i5 14450HX", "ram_gb": 16, "storage_gb": 512,
-        "screen_size_in": 16.0, "spec_score": 68, "price_inr": 84990,
-        "gpu_type": "NVIDIA GeForce RTX 4050", "gpu_vram_gb": 6,
-    },
-    {
-        "name": "Victus 15-fb0185AX", "brand": "HP", "os": "Windows 11", "utility": "Gaming",
-        "cpu_full": "AMD Ryzen 5 5600H", "ram_gb": 8, "storage_gb": 512,
-        "screen_size_in": 15.6, "spec_score": 68, "price_inr": 49990,
-        "gpu_type": "AMD Radeon RX 6500M", "gpu_vram_gb": 4,
-    },
-    {
-        "name": "Nitro V ANV15-41 UN.QPFSI", "brand": "Acer", "os": "Windows 11", "utility": "Gaming",
-        "cpu_full": "AMD Ryzen 5 7535HS", "ram_gb": 16, "storage_gb": 512,
-        "screen_size_in": 15.6, "spec_score": 68, "price_inr": 63499,
-        "gpu_type": "NVIDIA GeForce RTX 3050", "gpu_vram_gb": 6,
-    },
-    {
-        "name": "ThinkBook 16 21MWA0R4IN", "brand": "Lenovo", "os": "Windows 11", "utility": "Everyday Use",
-        "cpu_full": "AMD Ryzen 7 7735HS", "ram_gb": 16, "storage_gb": 512,
-        "screen_size_in": 16.0, "spec_score": 68, "price_inr": 52990,
-        "gpu_type": "AMD Radeon Graphics", "gpu_vram_gb": 0,
-    },
-    {
-        "name": "LOQ 83DV007GIN", "brand": "Lenovo", "os": "Windows 11", "utility": "Gaming",
-        "cpu_full": "13th Gen Intel Core i5 13450HX", "ram_gb": 16, "storage_gb": 512,
-        "screen_size_in": 15.6, "spec_score": 68, "price_inr": 87990,
-        "gpu_type": "NVIDIA GeForce RTX 4050", "gpu_vram_gb": 6,
-    },
-    {
-        "name": "Infinix Zerobook 2023", "brand": "Infinix", "os": "Windows 11 Home", "utility": "Everyday Use",
-        "cpu_full": "13th Gen Intel Core i9 13900H", "ram_gb": 32, "storage_gb": 1024,
-        "screen_size_in": 15.6, "spec_score": 68, "price_inr": 87990,
-        "gpu_type": "Intel Integrated Iris Xe", "gpu_vram_gb": 0,
-    },
-    {
-        "name": "Dell 15 G15-5530 (i5, 1TB SSD)", "brand": "Dell", "os": "Windows 11", "utility": "Gaming",
-        "cpu_full": "13th Gen Intel Core i5 13450HX", "ram_gb": 16, "storage_gb": 1024,
-        "screen_size_in": 15.6, "spec_score": 68, "price_inr": 77490,
-        "gpu_type": "NVIDIA GeForce RTX 3050", "gpu_vram_gb": 6,
-    },
-    {
-        "name": "Vivobook 14 2025 S3407CA (Core Ultra 5)", "brand": "Asus", "os": "Windows 11", "utility": "Everyday Use",
-        "cpu_full": "Intel Core Ultra 5 225H", "ram_gb": 16, "storage_gb": 512,
-        "screen_size_in": 14.0, "spec_score": 68, "price_inr": 69990,
-        "gpu_type": "Intel Integrated UHD", "gpu_vram_gb": 0,
-    },
-    {
-        "name": "LOQ 15IRH8 82XV00F7IN", "brand": "Lenovo", "os": "Windows 11", "utility": "Gaming",
-        "cpu_full": "12th Gen Intel Core i5 12450H", "ram_gb": 16, "storage_gb": 512,
-        "screen_size_in": 15.6, "spec_score": 68, "price_inr": 82990,
-        "gpu_type": "NVIDIA GeForce RTX 4060", "gpu_vram_gb": 8,
-    },
-    {
-        "name": "IdeaPad 5 2-in-1 14IAL10", "brand": "Lenovo", "os": "Windows 11", "utility": "Everyday Use",
-        "cpu_full": "Intel Core Ultra 5 225H", "ram_gb": 16, "storage_gb": 1024,
-        "screen_size_in": 14.0, "spec_score": 68, "price_inr": 91100,
-        "gpu_type": "Intel Integrated Arc", "gpu_vram_gb": 0,
-    },
-    {
-        "name": "Vivobook 16X K3605ZC-RP587WS", "brand": "Asus", "os": "Windows 11", "utility": "Performance",
-        "cpu_full": "12th Gen Intel Core i5 12500H", "ram_gb": 16, "storage_gb": 512,
-        "screen_size_in": 16.0, "spec_score": 69, "price_inr": 62990, 
-        "gpu_type": "NVIDIA GeForce RTX 3050", "gpu_vram_gb": 4, 
-    },
-]
+# Path to a CSV / JSON Lines / Parquet feed; empty means the built-in LAPTOP_DATA_INR list.
+# Several feeds separated by os.pathsep (highest priority first) are ingested in parallel (see ingest.py).
+CATALOG_SOURCE = os.environ.get("LAPTOP_CATALOG") or None
+if CATALOG_SOURCE and os.pathsep in CATALOG_SOURCE:
+    CATALOG_SOURCE = tuple(feed for feed in CATALOG_SOURCE.split(os.pathsep) if feed)
+# Optional JSON Lines update log ({"upsert": {...}} / {"delete": "Name"} per line) applied incrementally
+CATALOG_UPDATES = os.environ.get("LAPTOP_CATALOG_UPDATES") or None
+# Optional price-history directory (see price_history.py) for trend sparklines and the price-drop filter
+PRICE_HISTORY = os.environ.get("LAPTOP_PRICE_HISTORY") or None
+TREND_DAYS = 30
+RELEVANCE_SORT = "Relevance (best match first)"
+CUSTOM_SORT = "Custom Score (high → low), then Price"
+
+def _load_progress(bar):
+    """Returns a load_catalog progress callback that drives a Streamlit progress bar."""
+    def update(rows_loaded, total_rows):
+        if total_rows:
+            bar.progress(min(rows_loaded / total_rows, 1.0), text=f"Loading catalog: {rows_loaded:,} / {total_rows:,} rows")
+        else:
+            bar.progress(0.0, text=f"Loading catalog: {rows_loaded:,} rows")
+    return update
+
+@st.cache_resource(max_entries=1, show_spinner=False)
+def get_snapshot_store(source, cache_key, _tracer=NULL_TRACER):
+    """Builds the catalog once per process for a given source version.
+
+    `cache_key` (see catalog_cache_key) changes when the feed file changes, which
+    rebuilds the catalog; max_entries=1 releases the previous version once no
+    session references it anymore. Incremental updates publish new read-only
+    snapshots in the returned store. Build stages are recorded by `_tracer` only
+    when the catalog is actually (re)built.
+
+    Catalogs live in host-wide shared memory (see shared_catalog): a process
+    whose source version another process already built maps that copy
+    instead of building its own.
+    """
+    shared = get_shared_catalogs()
+    bar = st.progress(0.0, text="Loading catalog...")
+
+    def build():
+        if isinstance(source, tuple):
+            return ingest_feeds(source, progress=_load_progress(bar), tracer=_tracer)[0]
+        return build_catalog(source, progress=_load_progress(bar), tracer=_tracer)
+
+    catalog = shared.get_or_build(cache_key, build)
+    bar.empty()
+    return SnapshotStore(catalog, freeze=shared.freeze)
+
+@st.cache_resource
+def get_shared_catalogs():
+    """The host's shared-memory catalog files, one handle per process."""
+    return SharedCatalogs()
+
+@st.cache_resource(max_entries=1, show_spinner=False)
+def get_filter_index(cache_key, _catalog):
+    """Builds the sidebar filter index once per catalog version."""
+    return FilterIndex(_catalog)
+
+@st.cache_resource(max_entries=1, show_spinner=False)
+def get_sort_index(cache_key, _catalog):
+    """Holds the results-table sort permutations once per catalog version."""
+    return SortIndex(_catalog)
+
+@st.cache_resource(max_entries=1, show_spinner="Indexing specs for similarity search...")
+def get_similarity_index(cache_key, _catalog):
+    """Builds the nearest-neighbour index on first use, once per catalog version."""
+    return SimilarityIndex(_catalog)
+
+@st.cache_resource(max_entries=1, show_spinner="Indexing names, CPUs and GPUs for search...")
+def get_search_index(cache_key, _catalog):
+    """Builds the text-search index on the first search, once per catalog version."""
+    return TextIndex(_catalog)
+
+@st.cache_resource(max_entries=1, show_spinner=False)
+def get_spec_scorer(cache_key, _catalog):
+    """Keeps the normalized custom-score feature matrix across reruns, once per catalog version."""
+    return SpecScorer(_catalog)
+
+@st.cache_resource(max_entries=1, show_spinner=False)
+def get_laptop_ids(cache_key, _catalog):
+    """Price-history IDs of the catalog rows, once per catalog version."""
+    return laptop_ids(_catalog.index)
 
-# Create DataFrame
-df = pd.DataFrame(LAPTOP_DATA_INR)
+@st.cache_resource(show_spinner=False)
+def get_price_history(path):
+    """Opens the memory-mapped price-history store once per process."""
+    return PriceHistory(path)
 
-# Clean up column names and set index
-df.columns = [
-    "Name", "Brand", "OS", "Utility", "CPU Full Model", "RAM (GB)", 
-    "Storage (GB)", "Screen (in)", "Spec Score", "Price (Rs)", 
-    "GPU Type", "GPU VRAM (GB)"
-]
 
-# Reorder columns for display
-df = df[[
-    "Name", "Brand", "OS", "Utility", "Price (Rs)", "Spec Score", 
-    "CPU Full Model", "RAM (GB)", "Storage (GB)", "GPU Type", 
-    "GPU VRAM (GB)", "Screen (in)", 
-]]
-df = df.set_index('Name')
+@st.cache_resource
+def get_export_cache():
+    """Bounded export cache shared by every session in this process."""
+    return ExportCache()
 
-# Extract CPU Brand and Model for filtering
-df['CPU Brand'] = df['CPU Full Model'].apply(lambda x: 'Apple' if 'Apple' in x else ('AMD' if 'AMD' in x else ('Intel' if 'Intel' in x or 'Core' in x else 'Other')))
-df['Intel CPU Model'] = df['CPU Full Model'].apply(lambda x: next((m for m in ['i9', 'i7', 'i5', 'i3', 'Ultra 9', 'Ultra 7', 'Ultra 5'] if m in x), 'Other') if 'Intel' in x or 'Core' in x else 'N/A')
-df['AMD CPU Model'] = df['CPU Full Model'].apply(lambda x: next((m for m in ['Ryzen 9', 'Ryzen 7', 'Ryzen 5', 'Ryzen 3'] if m in x), 'Other') if 'AMD' in x else 'N/A')
-df['GPU Dedicated'] = df['GPU VRAM (GB)'].apply(lambda x: 'Dedicated' if x > 0 else 'Integrated')
+def render_trace_panel(tracer):
+    """Optional sidebar panel with the per-stage timings of the current rerun."""
+    with st.expander("🐞 Debug: Stage Timings"):
+        st.checkbox("Trace rerun stages", key='trace_enabled', help="Records wall time and memory per stage (adds overhead while on).")
+        if not tracer.enabled:
+            st.caption("Tracing is off.")
+            return
+        run_records = tracer.run_records()
+        st.caption(f"Rerun #{tracer.run}: {sum(r['ms'] for r in run_records):,.1f} ms across {len(run_records)} stages")
+        st.dataframe(pd.DataFrame(run_records).drop(columns=['run']), use_container_width=True, hide_index=True)
+        st.download_button(
+            label="⬇️ Download Trace (JSON Lines)",
+            data=tracer.to_jsonl,
+            file_name='stage_trace.jsonl',
+            mime='application/x-ndjson',
+            key='download-trace'
+        )
 
 
 # -----------------------------------------------------------
 # 2. Main Streamlit Application and UI
 # -----------------------------------------------------------
 
-def main():
+def main(df, filter_index, sort_index, catalog_key, tracer=NULL_TRACER, price_history=None):
     st.title("💻 Advanced Laptop Data Analyzer & Comparison")
     st.markdown("Use the filters in the sidebar to refine your search and visualize the data.")
+    search_query = st.text_input(
+        "🔎 Search laptops",
+        placeholder="Name, CPU or GPU, e.g. RTX 4060, Ultra 7, Zenbook",
+        help="Every word must match a name, CPU or GPU; small typos are tolerated.",
+        key='search_query'
+    ).strip()
+    search_matches = None
+    if search_query:
+        # Inverted-index lookups, not a scan of the names; the filters below are applied to the matches
+        search_index = get_search_index(catalog_key, df)
+        with tracer.stage("text search", rows=len(df)):
+            search_matches = search_index.search(search_query)
     
     # --- Sidebar Filters ---
     with st.sidebar:
@@ -863,22 +194,10 @@ def main():
         max_price_inr = lakh_to_inr(selected_max_price_str) if selected_max_price_str != 'Max' else df['Price (Rs)'].max()
 
 
-        # 2. Brand Multi-select
+        # 2. Brand Multi-select and 3. Utility Multi-select
+        # (drawn at the end of the sidebar, once the facet counts are known; see below)
         st.subheader("🏢 Brand & Utility")
-        all_brands = sorted(df['Brand'].unique())
-        selected_brands = st.multiselect(
-            "Brand",
-            options=all_brands,
-            default=all_brands
-        )
-
-        # 3. Utility Multi-select
-        all_utilities = sorted(df['Utility'].unique())
-        selected_utilities = st.multiselect(
-            "Utility/Usage",
-            options=all_utilities,
-            default=all_utilities
-        )
+        facet_boxes = {'brands': st.container(), 'utilities': st.container()}
 
         # 4. RAM and Storage
         st.subheader("💾 Core Specs")
@@ -900,22 +219,12 @@ def main():
         
         # 5. CPU Filters
         st.subheader("🧠 CPU Specs")
-        all_cpu_brands = sorted(df['CPU Brand'].unique())
-        selected_cpu_brands = st.multiselect(
-            "CPU Brand",
-            options=all_cpu_brands,
-            default=all_cpu_brands
-        )
+        facet_boxes['cpu_brands'] = st.container()
 
         # 6. GPU Filters
         st.subheader("🎮 Graphics Specs")
-        gpu_type_options = ['Dedicated', 'Integrated']
-        selected_gpu_type = st.multiselect(
-            "Graphics Type",
-            options=gpu_type_options,
-            default=gpu_type_options
-        )
-        
+        facet_boxes['gpu_types'] = st.container()
+
         all_vram = sorted(df[df['GPU VRAM (GB)'] > 0]['GPU VRAM (GB)'].unique())
         min_vram_val = st.select_slider(
             "Minimum Dedicated VRAM (GB)",
@@ -951,33 +260,110 @@ def main():
             step=1
         )
 
+        # Custom score: the buyer's own weights instead of the precomputed Spec Score
+        custom_weights = None
+        with st.expander("🎚️ Custom Spec Score"):
+            use_custom_score = st.checkbox(
+                "Score laptops with my own weights",
+                value=False,
+                help="Replaces Spec Score on the chart, in the value score and as the default table order (0–100)."
+            )
+            score_weights = {
+                column: st.slider(column, 0.0, 2.0, default, step=0.1, key=f"score-weight-{column}", disabled=not use_custom_score)
+                for column, default in DEFAULT_SCORE_WEIGHTS.items()
+            }
+            if use_custom_score:
+                custom_weights = score_weights
+
+        # Faceted counts: every multi-select option shows how many laptops it
+        # matches under all the other active filters and the search. The
+        # multi-selects are drawn last, into their boxes above, so the counts
+        # see every other widget's value; their own values are already in
+        # session state on a rerun.
+        facet_options = {
+            'brands': ("Brand", sorted(df['Brand'].unique())),
+            'utilities': ("Utility/Usage", sorted(df['Utility'].unique())),
+            'cpu_brands': ("CPU Brand", sorted(df['CPU Brand'].unique())),
+            'gpu_types': ("Graphics Type", list(GPU_TYPES)),
+        }
+        spec = FilterSpec(
+            min_price=min_price_inr,
+            max_price=max_price_inr,
+            min_score=score_value,
+            min_ram=min_ram_val,
+            min_storage=min_storage_val,
+            min_vram=min_vram_val,
+            screen_min=screen_min,
+            screen_max=screen_max,
+            **{field: st.session_state.get(f'filter_{field}', options) for field, (_, options) in facet_options.items()},
+        )
+        predicate_cache = st.session_state.setdefault('predicate_cache', PredicateCache())
+        counts = facet_counts(
+            filter_index, spec, predicate_cache, tracer, within=None if search_matches is None else search_matches[0]
+        )
+        selected = {}
+        for field, (label, options) in facet_options.items():
+            selected[field] = facet_boxes[field].multiselect(
+                label,
+                options=options,
+                default=options,
+                key=f'filter_{field}',
+                format_func=lambda option, field=field: f"{option} ({counts[field].get(option, 0):,})",
+            )
+
+        # 9. Duplicate listings (same product under slightly different names)
+        hide_duplicates = st.checkbox(
+            "Hide duplicate listings",
+            value=False,
+            help="Show only the cheapest listing of each product when several listings name the same laptop."
+        )
+
+        # 10. Price trends (needs a price-history store)
+        min_drop_pct = 0
+        if price_history is not None:
+            st.subheader("📉 Price Trends")
+            min_drop_pct = st.slider(
+                "Price dropped this week by at least (%)",
+                min_value=0,
+                max_value=50,
+                value=0,
+                step=1,
+                help="Compared with the highest price of the last 7 days; 0 shows every laptop."
+            )
+
 
     # --- Apply Filters ---
-    
-    # Base Filtering
-    filtered_df = df[
-        (df['Price (Rs)'] >= min_price_inr) & 
-        (df['Price (Rs)'] <= max_price_inr) &
-        (df['Spec Score'] >= score_value) &
-        (df['Brand'].isin(selected_brands)) &
-        (df['Utility'].isin(selected_utilities)) &
-        (df['RAM (GB)'] >= min_ram_val) &
-        (df['Storage (GB)'] >= min_storage_val) &
-        (df['CPU Brand'].isin(selected_cpu_brands)) &
-        (df['Screen (in)'] >= screen_min) &
-        (df['Screen (in)'] < screen_max + 0.001) # Use a tiny offset for inclusive max
-    ]
-    
-    # GPU Type Filtering (Handle Integrated vs. Dedicated Logic)
-    if 'Dedicated' in selected_gpu_type and 'Integrated' not in selected_gpu_type:
-        filtered_df = filtered_df[filtered_df['GPU Dedicated'] == 'Dedicated']
-    elif 'Integrated' in selected_gpu_type and 'Dedicated' not in selected_gpu_type:
-        filtered_df = filtered_df[filtered_df['GPU Dedicated'] == 'Integrated']
-    # If both or neither selected, no filter is applied by default
+    # Same semantics as the headless query engine (query.FilterSpec.predicates):
+    # categorical predicates come from per-value bitmaps, range predicates from
+    # binary search over presorted values (see filter_index.FilterIndex)
+    # (the multi-selects drop options a new catalog version no longer has)
+    spec = replace(spec, **selected)
 
-    # Minimum VRAM filtering (only applies to dedicated GPUs)
-    if 'Dedicated' in selected_gpu_type and min_vram_val > 0:
-         filtered_df = filtered_df[filtered_df['GPU VRAM (GB)'] >= min_vram_val]
+    # Each predicate's bitmap is cached in session state keyed by its widget value,
+    # so moving one slider recomputes one predicate and reuses the others
+    # (the facet counts above already built this rerun's bitmaps)
+    positions = select_positions(filter_index, spec, predicate_cache, tracer)
+    if hide_duplicates:
+        with tracer.stage("hide duplicates", rows=len(positions)):
+            positions = distinct_positions(df, positions)
+    if min_drop_pct:
+        # Only the matching laptops' rows of the history are read
+        with tracer.stage("price drops", rows=len(positions)):
+            drops = price_history.price_drops(get_laptop_ids(catalog_key, df)[positions])
+            positions = positions[drops >= min_drop_pct / 100]
+    relevance = None
+    if search_matches is not None:
+        positions, relevance = restrict(positions, *search_matches)
+    # Session results are positions into the shared catalog, not a copy of its rows
+    filtered_df = CatalogView(df, positions)
+    score_col = 'Spec Score'
+    custom_scores = None
+    if custom_weights is not None:
+        # One matrix-vector product over the cached normalized spec matrix
+        with tracer.stage("custom score", rows=len(positions)):
+            custom_scores = get_spec_scorer(catalog_key, df).scores(custom_weights, positions)
+        filtered_df = filtered_df.assign(**{CUSTOM_SCORE_COL: custom_scores})
+        score_col = CUSTOM_SCORE_COL
 
 
     # --- Display Results ---
@@ -990,65 +376,270 @@ def main():
         st.markdown("### 📈 Price vs. Performance Scatter Plot")
         
         # Calculate Price/Score ratio for coloring (lower is better value)
-        # Add 1 to price to avoid division by zero (though prices are high enough)
-        filtered_df['Value Score (Lower is better)'] = filtered_df['Price (Rs)'] / filtered_df['Spec Score']
+        # A custom score of 0 (every weighted spec at the catalog minimum) has no value score
+        with tracer.stage("value score", rows=len(filtered_df)):
+            score = filtered_df[score_col].to_numpy(dtype=np.float64)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                value = np.where(score > 0, filtered_df['Price (Rs)'].to_numpy(dtype=np.float64) / score, np.nan)
+            filtered_df = filtered_df.assign(**{VALUE_COL: value})
 
-        fig = px.scatter(
-            filtered_df.reset_index(),
-            x="Price (Rs)",
-            y="Spec Score",
-            color="Value Score (Lower is better)",
-            size="RAM (GB)",
-            color_continuous_scale=px.colors.sequential.Viridis_r, # Reverse Viridis so lower value is better (darker)
-            hover_name="Name",
-            hover_data={
-                "Price (Rs)": ':,.0f', 
-                "Spec Score": True, 
-                "RAM (GB)": True,
-                "Storage (GB)": True,
-                "GPU VRAM (GB)": True,
-                "CPU Full Model": True,
-                "Value Score (Lower is better)": ':.0f'
-            },
-            template="plotly_white",
-            title="Price vs. Spec Score: Visualizing Value"
-        )
-        fig.update_layout(
-            height=600, 
-            xaxis_title="Price (INR)", 
-            yaxis_title="Spec Score (Performance)",
-            coloraxis_colorbar_title="Value Score"
+        # Laptops no other match beats on every chosen dimension (cheaper price, higher specs)
+        skyline_dims = st.multiselect(
+            "Highlight the Pareto frontier over",
+            options=list(SKYLINE_DIMENSIONS),
+            default=list(SKYLINE_DIMENSIONS),
+            format_func=lambda dim: score_col if dim == 'Spec Score' else dim,
+            help="A laptop is on the frontier when no other match is at least as good on all of these and better on one.",
+            key='skyline-dims'
         )
-        st.plotly_chart(fig, use_container_width=True)
+        # With custom weights, the score dimension is the custom score
+        skyline_columns = [score_col if dim == 'Spec Score' else dim for dim in skyline_dims]
+        frontier_df = None
+        if skyline_dims:
+            with tracer.stage("pareto frontier", rows=len(filtered_df)):
+                directions = {**SKYLINE_DIMENSIONS, CUSTOM_SCORE_COL: True}
+                # A float score has nearly one value per laptop, which defeats the skyline's
+                # grouping reduction (about 10x slower at 1M rows); compare it in whole points
+                frontier_df = filtered_df.iloc[
+                    skyline(filtered_df, skyline_columns, directions, resolution={CUSTOM_SCORE_COL: 1})
+                ]
+        connect_frontier = set(skyline_dims) == {"Price (Rs)", "Spec Score"}
+
+        if len(filtered_df) <= SCATTER_POINT_LIMIT:
+            with tracer.stage("scatter figure", rows=len(filtered_df)):
+                fig = scatter_figure(filtered_df.to_frame(), score_col=score_col)
+                if frontier_df is not None:
+                    add_frontier(fig, frontier_df, connect=connect_frontier, score_col=score_col)
+            st.plotly_chart(fig, use_container_width=True)
+        else:
+            # Too many points for the browser: aggregate server-side instead
+            st.caption(
+                f"{len(filtered_df):,} laptops match, so the chart shows a binned density "
+                f"(exact points are drawn for up to {SCATTER_POINT_LIMIT:,} laptops)."
+            )
+            with tracer.stage("density figure", rows=len(filtered_df)):
+                fig = density_figure(filtered_df, score_col=score_col)
+                if frontier_df is not None:
+                    add_frontier(fig, frontier_df, connect=connect_frontier, score_col=score_col)
+            st.plotly_chart(fig, use_container_width=True)
+
+            with st.expander("🔍 Drill into a region for exact points"):
+                price_lo, price_hi = int(filtered_df['Price (Rs)'].min()), int(filtered_df['Price (Rs)'].max())
+                score_lo, score_hi = int(np.floor(filtered_df[score_col].min())), int(np.ceil(filtered_df[score_col].max()))
+                zoom_price = st.slider("Price range (INR)", price_lo, price_hi, (price_lo, price_hi), step=1000)
+                zoom_score = st.slider(f"{score_col} range", score_lo, score_hi, (score_lo, score_hi))
+                zoom_df = filtered_df.take(
+                    filtered_df['Price (Rs)'].between(*zoom_price).to_numpy() &
+                    filtered_df[score_col].between(*zoom_score).to_numpy()
+                )
+                if len(zoom_df) <= SCATTER_POINT_LIMIT:
+                    st.plotly_chart(
+                        scatter_figure(zoom_df.to_frame(), title=f"Zoomed Region: {len(zoom_df):,} Laptops", score_col=score_col),
+                        use_container_width=True
+                    )
+                else:
+                    st.info(f"{len(zoom_df):,} laptops in this region; narrow it to {SCATTER_POINT_LIMIT:,} or fewer to see exact points.")
 
-        # --- Data Table Section ---
-        st.markdown("### 📋 Detailed Filtered Data")
-        
         # Select and format columns for display
         display_cols = [
             "Brand", "Utility", "Price (Rs)", "Spec Score", 
             "CPU Full Model", "RAM (GB)", "Storage (GB)", 
             "GPU Type", "GPU VRAM (GB)", "Screen (in)"
         ]
-        
+        column_config = {
+            "Price (Rs)": st.column_config.NumberColumn("Price (Rs)", format="₹%d"),
+            "Screen (in)": st.column_config.NumberColumn("Screen (in)", format="%.1f in"),
+            CUSTOM_SCORE_COL: st.column_config.NumberColumn(CUSTOM_SCORE_COL, format="%.1f", help="Your weighted spec score (0–100)"),
+        }
+
+        # --- Pareto Frontier Section ---
+        if frontier_df is not None:
+            st.markdown("### 🏆 Pareto Frontier")
+            st.caption(
+                f"{len(frontier_df):,} of {len(filtered_df):,} laptops are not beaten on "
+                f"{', '.join(skyline_columns)} at once"
+                + (f" ({CUSTOM_SCORE_COL} compared in whole points)." if CUSTOM_SCORE_COL in skyline_columns else ".")
+            )
+            st.dataframe(
+                frontier_df.sort_values("Price (Rs)")[display_cols + ([CUSTOM_SCORE_COL] if custom_scores is not None else [])],
+                use_container_width=True,
+                column_config=column_config
+            )
+
+        # --- Top Picks Section ---
+        # Partial selection of the K best matches; no sort of the full result
+        st.markdown("### 🥇 Top Picks")
+        objective_col, k_col = st.columns([3, 1])
+        objective = objective_col.selectbox("Rank by", options=OBJECTIVES)
+        top_k_count = k_col.number_input("How many", min_value=1, max_value=100, value=10, step=1)
+        weights = None
+        if objective != VALUE_OBJECTIVE:
+            with st.expander("⚖️ Weights", expanded=True):
+                weight_cols = st.columns(len(DEFAULT_WEIGHTS))
+                weights = {
+                    column: weight_col.slider(column, 0.0, 2.0, default, step=0.1, key=f"weight-{column}")
+                    for weight_col, (column, default) in zip(weight_cols, DEFAULT_WEIGHTS.items())
+                }
+        with tracer.stage("top picks", rows=len(filtered_df)):
+            picks_df = top_picks(filtered_df, top_k_count, objective, weights, bounds=column_bounds(df), score_col=score_col)
+        pick_score_label = f"{score_col.removesuffix(' Score')} pts per ₹1,000" if objective == VALUE_OBJECTIVE else "Weighted score"
         st.dataframe(
-            filtered_df[display_cols].sort_values(by=['Spec Score', 'Price (Rs)'], ascending=[False, True]), 
+            picks_df[[PICK_SCORE_COL] + display_cols],
             use_container_width=True,
             column_config={
-                "Price (Rs)": st.column_config.NumberColumn("Price (Rs)", format="₹%d"),
-                "Screen (in)": st.column_config.NumberColumn("Screen (in)", format="%.1f in"),
+                **column_config,
+                PICK_SCORE_COL: st.column_config.NumberColumn(pick_score_label, format="%.3f"),
             }
         )
 
+        # --- Data Table Section ---
+        st.markdown("### 📋 Detailed Filtered Data")
+        
+        # Sort with a cached catalog-wide permutation and only send one page to the browser
+        sort_col, size_col, page_col = st.columns([2, 1, 1])
+        # While searching, the best matches come first by default, then the custom score when it is on
+        sort_labels = (
+            ([RELEVANCE_SORT] if relevance is not None else []) +
+            ([CUSTOM_SORT] if custom_scores is not None else []) +
+            list(SORT_OPTIONS)
+        )
+        sort_label = sort_col.selectbox(
+            "Sort by", options=sort_labels,
+            index=0 if relevance is not None or custom_scores is not None else sort_labels.index(DEFAULT_SORT)
+        )
+        page_size = size_col.selectbox("Rows per page", options=PAGE_SIZES, index=1)
+        n_pages = page_count(len(positions), page_size)
+        page = page_col.number_input(f"Page (of {n_pages:,})", min_value=1, max_value=n_pages, value=1, step=1)
+
+        with tracer.stage("table sort", rows=len(positions)):
+            # Per-session scores have no catalog-wide permutation; rank just the pages up to this one
+            if sort_label == RELEVANCE_SORT:
+                # Equally relevant laptops keep the default table order
+                tie_rank = sort_index.rank(SORT_OPTIONS[DEFAULT_SORT])[positions]
+                sorted_positions = ranked(positions, relevance, tie_rank, limit=page * page_size)
+            elif sort_label == CUSTOM_SORT:
+                tie_rank = sort_index.rank((("Price (Rs)", True),))[positions]
+                sorted_positions = ranked(positions, custom_scores, tie_rank, limit=page * page_size)
+            else:
+                sorted_positions = sort_index.sort(positions, SORT_OPTIONS[sort_label])
+        page_positions = page_window(sorted_positions, page, page_size)
+        first_row = (page - 1) * page_size + 1
+        st.caption(f"Rows {first_row:,}–{first_row + len(page_positions) - 1:,} of {len(positions):,}")
+
+        page_df = df.iloc[page_positions][display_cols]
+        table_config = column_config
+        # Positions stay in catalog order through every filter, so a binary search finds each page row's scores
+        page_rows = np.searchsorted(positions, page_positions)
+        if custom_scores is not None:
+            page_df.insert(display_cols.index("Spec Score") + 1, CUSTOM_SCORE_COL, custom_scores[page_rows])
+        if relevance is not None:
+            page_df.insert(0, RELEVANCE_COL, relevance[page_rows])
+            table_config = {
+                **table_config,
+                RELEVANCE_COL: st.column_config.NumberColumn(
+                    RELEVANCE_COL, format="%.2f", help="1 per search word matched exactly, less for prefix and fuzzy matches"
+                ),
+            }
+        if price_history is not None:
+            with tracer.stage("price sparklines", rows=len(page_positions)):
+                trend = price_history.daily_prices(get_laptop_ids(catalog_key, df)[page_positions], days=TREND_DAYS)
+            page_df.insert(0, "Price Trend", [row[~np.isnan(row)].tolist() for row in trend])
+            table_config = {
+                **table_config,
+                "Price Trend": st.column_config.LineChartColumn(f"Price Trend ({TREND_DAYS}d)", help="Daily price from the price history"),
+            }
+
+        with tracer.stage("table serialization", rows=len(page_positions)):
+            table_event = st.dataframe(
+                page_df,
+                use_container_width=True,
+                column_config=table_config,
+                on_select="rerun",
+                selection_mode="single-row",
+                key='results-table'
+            )
+
+        # --- Similar Laptops Section ---
+        selected_rows = table_event.selection.rows
+        if not selected_rows or selected_rows[0] >= len(page_positions):
+            st.caption("💡 Select a row in the table to see the most similar laptops in the catalog.")
+        else:
+            selected_position = page_positions[selected_rows[0]]
+            st.markdown(f"### 🔁 Laptops Similar to **{df.index[selected_position]}**")
+            n_similar = st.slider("How many", min_value=1, max_value=25, value=5)
+            similarity_index = get_similarity_index(catalog_key, df)
+            with tracer.stage("similar laptops", rows=n_similar):
+                similar_df = similar_laptops(df, similarity_index, selected_position, n_similar)
+            st.dataframe(
+                similar_df[[DISTANCE_COL] + display_cols],
+                use_container_width=True,
+                column_config={
+                    **column_config,
+                    DISTANCE_COL: st.column_config.NumberColumn(DISTANCE_COL, format="%.3f", help="Distance between normalized spec vectors (0 = identical specs)"),
+                }
+            )
+
         # --- Download Button ---
-        csv = convert_df_to_csv(filtered_df.reset_index())
+        # Payloads are built on click and cached per (catalog, filter spec, format), not per frame hash;
+        # each is built whole in memory (Streamlit serves download data as bytes)
+        export_label = st.selectbox("Export format", options=list(EXPORT_FORMATS))
+        export_fmt, export_ext, export_mime = EXPORT_FORMATS[export_label]
+        # Filters applied outside the spec are part of the key too; the drop filter also depends on the history size
+        view_key = (
+            hide_duplicates, min_drop_pct, len(price_history) if min_drop_pct else None, search_query.lower(),
+            tuple(custom_weights.items()) if custom_weights is not None else None,
+        )
+        export_key = (catalog_key, spec, view_key, export_fmt)
+        export_cache = get_export_cache()
+
+        def build_export():
+            with tracer.stage(f"export: {export_fmt}", rows=len(filtered_df)):
+                return export_bytes(filtered_df.to_frame(), export_fmt)
+
         st.download_button(
-            label="⬇️ Download Filtered Data as CSV",
-            data=csv,
-            file_name='filtered_laptops_advanced.csv',
-            mime='text/csv',
+            label=f"⬇️ Download Filtered Data as {export_label}",
+            data=lambda: export_cache.get_or_create(export_key, build_export),
+            file_name=f'filtered_laptops_advanced.{export_ext}',
+            mime=export_mime,
             key='download-csv-advanced'
         )
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    # Per-session tracer; when tracing is off every stage() is a shared no-op
+    tracer = st.session_state.setdefault('tracer', Tracer())
+    tracer.set_enabled(st.session_state.get('trace_enabled', False))
+    tracer.start_run()
+
+    if isinstance(CATALOG_SOURCE, tuple):
+        cache_key = feeds_cache_key(CATALOG_SOURCE)
+    else:
+        cache_key = catalog_cache_key(CATALOG_SOURCE)
+    with tracer.stage("catalog build"):
+        store = get_snapshot_store(CATALOG_SOURCE, cache_key, _tracer=tracer)
+    if CATALOG_UPDATES:
+        with tracer.stage("catalog updates"):
+            store.apply_log(CATALOG_UPDATES)
+        # Bad log entries are skipped; tell each session once about new ones
+        seen = st.session_state.get('rejected_updates_seen', 0)
+        if store.rejected_count > seen:
+            _, _, error = store.rejected[-1]
+            st.toast(f"Skipped {store.rejected_count - seen} invalid catalog update(s): {error}", icon="⚠️")
+            st.session_state['rejected_updates_seen'] = store.rejected_count
+
+    # Pin one snapshot for the whole rerun. Holding it in session state keeps it
+    # alive until this session's next rerun, which switches to the latest version.
+    previous = st.session_state.get('snapshot')
+    snapshot = st.session_state['snapshot'] = store.current
+    if previous is not None and previous.version != snapshot.version:
+        st.toast(f"Catalog updated to version {snapshot.version}")
+    catalog = snapshot.catalog
+    catalog_key = (cache_key, snapshot.version)
+
+    with tracer.stage("index build"):
+        filter_index = get_filter_index(catalog_key, catalog)
+        sort_index = get_sort_index(catalog_key, catalog)
+    price_history = get_price_history(PRICE_HISTORY).refresh() if PRICE_HISTORY else None
+    main(catalog, filter_index, sort_index, catalog_key, tracer, price_history)
+
+    with st.sidebar:
+        render_trace_panel(tracer)
\ No newline at end of file
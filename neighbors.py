@@ -0,0 +1,191 @@
+""""Similar laptops": k-nearest-neighbour search over normalized spec vectors.
+
+The feature matrix and spatial index are built once per catalog. SciPy's
+cKDTree is used when SciPy is installed; otherwise a small NumPy KD-tree with
+a batched depth-first search gives the same answers. Either way a lookup
+visits a few leaves instead of measuring the distance to every row, and a
+batch of lookups is answered in one call.
+"""
+import numpy as np
+
+try:
+    from scipy.spatial import cKDTree
+except ImportError:  # optional dependency
+    cKDTree = None
+
+SIMILARITY_COLUMNS = [
+    "Price (Rs)", "Spec Score", "RAM (GB)", "Storage (GB)",
+    "GPU VRAM (GB)", "Screen (in)", "CPU Tier",
+]
+# Compared on a log scale: ₹40k vs ₹50k is as far apart as ₹200k vs ₹250k
+LOG_COLUMNS = {"Price (Rs)", "Storage (GB)"}
+DISTANCE_COL = "Distance"
+LEAF_SIZE = 64
+
+
+def feature_matrix(frame, columns=SIMILARITY_COLUMNS):
+    """(n, d) float64 matrix with every column scaled to 0..1 over the frame."""
+    features = np.empty((len(frame), len(columns)), dtype=np.float64)
+    for i, column in enumerate(columns):
+        values = frame[column].to_numpy(dtype=np.float64)
+        if column in LOG_COLUMNS:
+            values = np.log1p(np.maximum(values, 0))
+        lo, hi = (values.min(), values.max()) if len(values) else (0.0, 0.0)
+        features[:, i] = (values - lo) / ((hi - lo) or 1.0)
+    return features
+
+
+class KDTree:
+    """Minimal KD-tree (median splits on the widest dimension, bounding-box pruning).
+
+    Used when SciPy is not installed. Points of each leaf are stored
+    contiguously, so a leaf is scanned with one vectorized distance computation.
+    """
+
+    def __init__(self, points, leaf_size=LEAF_SIZE):
+        # Points are reordered in place so every node covers one contiguous slice
+        self.points = np.array(points, dtype=np.float64, order="C")
+        self.order = np.arange(len(self.points))
+        self.leaf_size = leaf_size
+        self.start, self.end, self.left, self.right, self.lo, self.hi = [], [], [], [], [], []
+        # Split dimension and value of each inner node: the right child holds the points >= split
+        self.dim, self.split = [], []
+
+        if len(self.points):
+            stack = [self._add_node(0, len(self.points))]
+            while stack:
+                node = stack.pop()
+                start, end = self.start[node], self.end[node]
+                spread = self.hi[node] - self.lo[node]
+                dim = int(np.argmax(spread))
+                if end - start <= leaf_size or spread[dim] == 0:
+                    continue
+                split = start + self._partition(start, end, dim)
+                self.left[node] = self._add_node(start, split)
+                self.right[node] = self._add_node(split, end)
+                self.dim[node], self.split[node] = dim, self.lo[self.right[node]][dim]
+                stack.extend((self.left[node], self.right[node]))
+
+        self.lo, self.hi = np.array(self.lo), np.array(self.hi)
+
+    def _partition(self, start, end, dim):
+        """Moves values below the median of `dim` to the front; returns the split offset.
+
+        Splitting between distinct values (rather than at the median row) keeps
+        sibling boxes disjoint when a column has only a few values (RAM, CPU tier).
+        """
+        values = self.points[start:end, dim]
+        median = np.partition(values, len(values) // 2)[len(values) // 2]
+        left = values < median
+        if not left.any():
+            left = values <= median
+        rows = np.concatenate([np.flatnonzero(left), np.flatnonzero(~left)])
+        self.points[start:end] = self.points[start:end][rows]
+        self.order[start:end] = self.order[start:end][rows]
+        return int(left.sum())
+
+    def _add_node(self, start, end):
+        segment = self.points[start:end]
+        self.start.append(start)
+        self.end.append(end)
+        self.left.append(-1)
+        self.right.append(-1)
+        self.dim.append(-1)
+        self.split.append(0.0)
+        self.lo.append(segment.min(axis=0))
+        self.hi.append(segment.max(axis=0))
+        return len(self.start) - 1
+
+    def query(self, points, k):
+        """(squared distances, row positions) of the k nearest points to each of `points`, nearest first.
+
+        The whole batch walks the tree together: queries that take the same
+        way through a node are handled as one group, so box pruning and leaf
+        scans are vectorized across queries. Returns two (len(points), k)
+        arrays, padded with inf / -1 when the tree holds fewer than k points.
+        """
+        points = np.asarray(points, dtype=np.float64).reshape(-1, self.points.shape[1])
+        best_dist = np.full((len(points), k), np.inf)
+        best_pos = np.full((len(points), k), -1, dtype=np.int64)
+        if not len(self.points) or k <= 0 or not len(points):
+            return best_dist, best_pos
+        worst = np.full(len(points), np.inf)
+        stack = [(0, np.arange(len(points)))]
+        while stack:
+            node, queries = stack.pop()
+            near = points[queries]
+            gap = np.maximum(np.maximum(self.lo[node] - near, near - self.hi[node]), 0.0)
+            # Queries whose k-th best is already nearer than this box skip it
+            keep = (gap * gap).sum(axis=1) <= worst[queries]
+            if not keep.all():
+                queries, near = queries[keep], near[keep]
+                if not len(queries):
+                    continue
+            if self.left[node] < 0:
+                start, end = self.start[node], self.end[node]
+                # Same summation as the box distance, so exactly tied points stay tied
+                diff = near[:, None, :] - self.points[None, start:end]
+                dist = np.concatenate([best_dist[queries], (diff * diff).sum(axis=2)], axis=1)
+                pos = np.concatenate(
+                    [best_pos[queries], np.broadcast_to(self.order[start:end], (len(queries), end - start))], axis=1
+                )
+                # Unfilled slots (-1) sort last by their inf distance; ties go to the lower position
+                ranked = np.lexsort((np.where(pos < 0, len(self.points), pos), dist))[:, :k]
+                best_dist[queries] = np.take_along_axis(dist, ranked, axis=1)
+                best_pos[queries] = np.take_along_axis(pos, ranked, axis=1)
+                worst[queries] = best_dist[queries, -1]
+                continue
+            # Pushed far child first, so every query visits the child on its side of the split first
+            left, right = self.left[node], self.right[node]
+            goes_left = near[:, self.dim[node]] < self.split[node]
+            on_left = np.count_nonzero(goes_left)
+            if on_left == len(queries):
+                stack += [(right, queries), (left, queries)]
+            elif on_left == 0:
+                stack += [(left, queries), (right, queries)]
+            else:
+                a, b = queries[goes_left], queries[~goes_left]
+                stack += [(right, a), (left, b), (left, a), (right, b)]
+        return best_dist, best_pos
+
+
+class SimilarityIndex:
+    """Nearest-neighbour lookups over one catalog's normalized spec vectors."""
+
+    def __init__(self, frame, columns=SIMILARITY_COLUMNS, leaf_size=LEAF_SIZE):
+        self.columns = list(columns)
+        self.features = feature_matrix(frame, self.columns)
+        if cKDTree is not None:
+            self.tree = cKDTree(self.features, leafsize=leaf_size)
+        else:
+            self.tree = KDTree(self.features, leaf_size=leaf_size)
+
+    def _query(self, points, k):
+        """(distances, row positions) of the k nearest rows to each point, padded with inf / -1."""
+        if cKDTree is not None:
+            dist, pos = self.tree.query(points, k=k)
+            dist, pos = dist.reshape(len(points), k), pos.reshape(len(points), k)
+            return dist, np.where(pos < len(self.features), pos, -1)
+        dist, pos = self.tree.query(points, k)
+        return np.sqrt(dist), pos
+
+    def query(self, positions, k=5):
+        """Batched lookup: for each catalog row position, its k most similar other rows.
+
+        Returns two (len(positions), k) arrays: distances and row positions,
+        nearest first. Rows with fewer than k neighbours are padded with inf / -1.
+        """
+        positions = np.atleast_1d(np.asarray(positions, dtype=np.int64))
+        dist, pos = self._query(self.features[positions], k + 1)
+        # Drop each row itself; if exact duplicates crowded it out, drop the farthest instead
+        others = np.argsort(pos == positions[:, None], axis=1, kind="stable")[:, :k]
+        return np.take_along_axis(dist, others, axis=1), np.take_along_axis(pos, others, axis=1)
+
+
+def similar_laptops(catalog, index, position, k=5):
+    """The k laptops most similar to catalog row `position`, with a DISTANCE_COL column."""
+    distances, neighbours = index.query([position], k)
+    found = neighbours[0] >= 0
+    similar = catalog.iloc[neighbours[0][found]].copy()
+    similar[DISTANCE_COL] = distances[0][found]
+    return similar
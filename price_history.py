@@ -0,0 +1,343 @@
+"""Append-only price history, stored column-wise on disk and read memory-mapped.
+
+    python price_history.py history/ --import prices.csv      # name,timestamp,price rows
+    python price_history.py history/ --record feed.parquet    # today's catalog prices
+    python price_history.py history/ --synthetic 90            # demo history for the catalog
+
+Every bulk append is written as one segment: a directory of .npy columns
+(laptop ID, timestamp, price) sorted by (laptop ID, timestamp). Segments are
+only ever replaced whole. Size-tiered merging folds a new segment into the
+previous one while that one is no larger, so a history stays at O(log n)
+segments.
+
+Queries open the segments with np.load(mmap_mode="r") and run vectorized
+binary searches over them. Looking up many laptops touches only the pages
+holding their rows, never the full history. Laptop IDs are stable 64-bit
+hashes of the cleaned listing names (see laptop_ids), so a history outlives
+catalog rebuilds.
+
+Several processes may share a store directory: appends (merge, write and
+segment swap) hold an exclusive lock on its LOCK_FILE, and opening newly
+listed segments holds a shared one (where fcntl is available, i.e. not on
+Windows; there only threads of one process are serialized).
+"""
+import argparse
+import os
+import shutil
+import threading
+import time
+import warnings
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+import numpy as np
+import pandas as pd
+
+from pricing import parse_prices
+
+COLUMNS = {"laptop_id": np.uint64, "timestamp": np.int64, "price": np.int32}
+LOCK_FILE = ".lock"
+DAY = 86_400
+WEEK = 7 * DAY
+
+
+def laptop_ids(names):
+    """Stable uint64 IDs for listing names (the catalog's Name index)."""
+    return pd.util.hash_array(np.asarray(names, dtype=object))
+
+
+def to_timestamps(values):
+    """Epoch seconds (int64) from datetimes, date strings or numbers of seconds."""
+    values = np.atleast_1d(np.asarray(values))
+    if values.dtype.kind in "iuf":
+        return values.astype(np.int64)
+    return pd.to_datetime(values, utc=True).as_unit("s").asi8
+
+
+def rolling_median(values, window):
+    """Median of each trailing `window` values along the last axis, ignoring NaNs.
+
+    The first window-1 positions use the values available so far.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    padded = np.concatenate([np.full(values.shape[:-1] + (window - 1,), np.nan), values], axis=-1)
+    windows = np.lib.stride_tricks.sliding_window_view(padded, window, axis=-1)
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)  # all-NaN windows before the first record
+        return np.nanmedian(windows, axis=-1)
+
+
+class Segment:
+    """One immutable, memory-mapped run of rows sorted by (laptop ID, timestamp)."""
+
+    def __init__(self, path):
+        self.path = path
+        self.name = os.path.basename(path)
+        for column in COLUMNS:
+            setattr(self, column, np.load(os.path.join(path, f"{column}.npy"), mmap_mode="r"))
+
+    def __len__(self):
+        return len(self.laptop_id)
+
+    def id_ranges(self, ids):
+        return (np.searchsorted(self.laptop_id, ids, side="left"),
+                np.searchsorted(self.laptop_id, ids, side="right"))
+
+    def bisect_right(self, lo, hi, t):
+        """Per query, the first position in [lo, hi) whose timestamp is > t."""
+        lo, hi = lo.copy(), hi.copy()
+        active = np.flatnonzero(lo < hi)
+        while len(active):
+            mid = (lo[active] + hi[active]) // 2
+            after = self.timestamp[mid] > t[active]
+            hi[active[after]] = mid[after]
+            lo[active[~after]] = mid[~after] + 1
+            active = active[lo[active] < hi[active]]
+        return lo
+
+
+def _ordered(ids, *times):
+    """IDs in ascending order with per-ID times permuted alike, plus the permutation.
+
+    Sorted lookups walk the segment files front to back instead of seeking at random.
+    """
+    ids = np.atleast_1d(np.asarray(ids, dtype=np.uint64))
+    order = np.argsort(ids, kind="stable")
+    times = [np.broadcast_to(to_timestamps(t), ids.shape)[order] for t in times]
+    return ids[order], order, *times
+
+
+def _restore(order, values):
+    restored = np.empty_like(values)
+    restored[order] = values
+    return restored
+
+
+class PriceHistory:
+    """A directory of price-history segments.
+
+    Appends and refreshes are serialized across threads and processes (see the
+    module docstring); queries read the current segment list without a lock.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.RLock()
+        os.makedirs(path, exist_ok=True)
+        self.segments = []
+        self.refresh()
+
+    @contextmanager
+    def _locked(self, exclusive):
+        """Holds the thread lock and, where supported, a shared or exclusive lock on the store's LOCK_FILE."""
+        with self._lock:
+            if fcntl is None:
+                yield
+                return
+            with open(os.path.join(self.path, LOCK_FILE), "a") as fh:
+                fcntl.flock(fh, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+                try:
+                    yield
+                finally:
+                    fcntl.flock(fh, fcntl.LOCK_UN)
+
+    def _segment_names(self):
+        return sorted(n for n in os.listdir(self.path) if n.startswith("segment-") and not n.endswith(".tmp"))
+
+    def refresh(self):
+        """Picks up segments written since the last call (a directory listing when nothing changed)."""
+        if self._segment_names() == [segment.name for segment in self.segments]:
+            return self
+        # Another process may be swapping segments; list and open them under its lock
+        with self._locked(exclusive=False):
+            self._refresh()
+        return self
+
+    def _refresh(self):
+        names = self._segment_names()
+        if names != [segment.name for segment in self.segments]:
+            opened = {segment.name: segment for segment in self.segments}
+            self.segments = [opened.get(n) or Segment(os.path.join(self.path, n)) for n in names]
+
+    def __len__(self):
+        return sum(len(segment) for segment in self.segments)
+
+    @property
+    def last_timestamp(self):
+        return max((int(segment.timestamp.max()) for segment in self.segments if len(segment)), default=None)
+
+    # -------------------------------------------------------
+    # Writes
+    # -------------------------------------------------------
+    def _write(self, columns):
+        """Writes a sorted segment under a temporary name and publishes it with a rename."""
+        # Numbered after every segment on disk, including ones being merged away
+        last = max((int(n.split("-")[1].split(".")[0]) for n in os.listdir(self.path) if n.startswith("segment-")), default=0)
+        final = os.path.join(self.path, f"segment-{last + 1:08d}")
+        tmp = final + ".tmp"
+        os.makedirs(tmp)
+        for column, values in columns.items():
+            np.save(os.path.join(tmp, f"{column}.npy"), values)
+        os.rename(tmp, final)
+        return Segment(final)
+
+    def append(self, ids, timestamps, prices):
+        """Bulk-appends price observations; returns the number of rows written.
+
+        Prices go through pricing.parse_prices, so literals like "₹1.25 Lakh"
+        are accepted. Rows whose price cannot be stored (unparseable, negative,
+        non-finite or beyond the int32 price column) are skipped with a
+        warning instead of wrapping around.
+        """
+        parsed = parse_prices(pd.Series(np.asarray(prices)), dtype=COLUMNS["price"].__name__)
+        valid = parsed.values.notna().to_numpy()
+        if not valid.all():
+            warnings.warn(
+                f"Skipped {int((~valid).sum()):,} price observations that are not a price in "
+                f"0..{np.iinfo(COLUMNS['price']).max:,}: {parsed.invalid.head(5).tolist()}",
+                stacklevel=2,
+            )
+        columns = {
+            "laptop_id": np.asarray(ids, dtype=np.uint64)[valid],
+            "timestamp": np.broadcast_to(to_timestamps(timestamps), np.shape(ids))[valid],
+            "price": parsed.values.to_numpy(dtype=np.int64, na_value=0)[valid],
+        }
+        if not len(columns["laptop_id"]):
+            return 0
+        with self._locked(exclusive=True):
+            self._refresh()
+            # Size-tiered merge: fold in trailing segments that are no larger than the new rows
+            kept = list(self.segments)
+            merged = []
+            while kept and len(kept[-1]) <= len(columns["laptop_id"]):
+                segment = kept.pop()
+                merged.append(segment)
+                columns = {c: np.concatenate([getattr(segment, c), v]) for c, v in columns.items()}
+            order = np.lexsort((columns["timestamp"], columns["laptop_id"]))
+            columns = {c: columns[c][order].astype(dtype) for c, dtype in COLUMNS.items()}
+            # Queries in other threads keep iterating the old list; swap in the new one whole
+            self.segments = kept + [self._write(columns)]
+            for segment in merged:
+                shutil.rmtree(segment.path, ignore_errors=True)
+        return len(order)
+
+    # -------------------------------------------------------
+    # Queries (vectorized over laptops)
+    # -------------------------------------------------------
+    def price_at(self, ids, t):
+        """Price in effect at time `t` (scalar or per ID): the last observation at or before it.
+
+        Returns float64 prices, NaN for laptops without an observation by then.
+        """
+        ids, order, t = _ordered(ids, t)
+        best_t = np.full(len(ids), np.iinfo(np.int64).min)
+        prices = np.full(len(ids), np.nan)
+        for segment in self.segments:
+            lo, hi = segment.id_ranges(ids)
+            pos = segment.bisect_right(lo, hi, t) - 1
+            found = np.flatnonzero(pos >= lo)
+            seen = segment.timestamp[pos[found]]
+            # Later segments win ties: they were appended later
+            newer = seen >= best_t[found]
+            found = found[newer]
+            best_t[found] = seen[newer]
+            prices[found] = segment.price[pos[found]]
+        return _restore(order, prices)
+
+    def price_range(self, ids, start, end):
+        """(min, max) price observed in [start, end] per laptop; NaN when none was."""
+        ids, order, start, end = _ordered(ids, start, end)
+        low = np.full(len(ids), np.nan)
+        high = np.full(len(ids), np.nan)
+        for segment in self.segments:
+            lo, hi = segment.id_ranges(ids)
+            first = segment.bisect_right(lo, hi, start - 1)
+            stop = segment.bisect_right(first, hi, end)
+            counts = stop - first
+            hit = np.flatnonzero(counts > 0)
+            if not len(hit):
+                continue
+            # Gather only the rows inside each laptop's window, then reduce per laptop
+            offsets = np.concatenate(([0], np.cumsum(counts[hit])[:-1]))
+            rows = np.arange(counts[hit].sum()) - np.repeat(offsets - first[hit], counts[hit])
+            values = segment.price[rows].astype(np.float64)
+            low[hit] = np.fmin(low[hit], np.minimum.reduceat(values, offsets))
+            high[hit] = np.fmax(high[hit], np.maximum.reduceat(values, offsets))
+        return _restore(order, low), _restore(order, high)
+
+    def daily_prices(self, ids, end=None, days=30):
+        """(len(ids), days) matrix of the price in effect at the end of each day up to `end`."""
+        ids = np.atleast_1d(np.asarray(ids, dtype=np.uint64))
+        end = int(to_timestamps(time.time() if end is None else end)[0])
+        times = end - DAY * np.arange(days - 1, -1, -1)
+        prices = self.price_at(np.repeat(ids, days), np.tile(times, len(ids)))
+        return prices.reshape(len(ids), days)
+
+    def price_drops(self, ids, now=None, window=WEEK):
+        """Fractional drop of the current price below the highest price of the last `window` seconds.
+
+        The price already in effect when the window opened counts as seen in it.
+        0.2 means 20% cheaper than the recent peak; NaN without history.
+        """
+        ids = np.atleast_1d(np.asarray(ids, dtype=np.uint64))
+        now = int(to_timestamps(time.time() if now is None else now)[0])
+        current = self.price_at(ids, now)
+        _, peak = self.price_range(ids, now - window, now)
+        peak = np.fmax(peak, self.price_at(ids, now - window))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return 1.0 - current / peak
+
+    def history(self, laptop_id, start=None, end=None):
+        """One laptop's observations in time order as a (timestamp, price) frame."""
+        ids = np.array([laptop_id], dtype=np.uint64)
+        start = np.iinfo(np.int64).min + 1 if start is None else to_timestamps(start)[0]
+        end = np.iinfo(np.int64).max if end is None else to_timestamps(end)[0]
+        parts = []
+        for segment in self.segments:
+            lo, hi = segment.id_ranges(ids)
+            first = segment.bisect_right(lo, hi, np.array([start - 1]))[0]
+            stop = segment.bisect_right(lo, hi, np.array([end]))[0]
+            parts.append(pd.DataFrame({"timestamp": segment.timestamp[first:stop], "price": segment.price[first:stop]}))
+        frame = pd.concat(parts, ignore_index=True) if parts else pd.DataFrame({"timestamp": [], "price": []})
+        frame = frame.sort_values("timestamp", kind="stable").reset_index(drop=True)
+        frame["timestamp"] = pd.to_datetime(frame["timestamp"], unit="s", utc=True)
+        return frame
+
+
+def main(argv=None):
+    from catalog import build_catalog
+    from dedup import clean_names
+
+    parser = argparse.ArgumentParser(description="Append to a laptop price-history store.")
+    parser.add_argument("store", help="price-history directory (created if missing)")
+    action = parser.add_mutually_exclusive_group(required=True)
+    action.add_argument("--import", dest="import_path", help="CSV / Parquet file with name, timestamp, price columns")
+    action.add_argument("--record", nargs="?", const="", metavar="CATALOG",
+                        help="append the catalog's current prices at the current time (default: built-in data)")
+    action.add_argument("--synthetic", type=int, metavar="DAYS", help="append a random-walk history for the catalog")
+    parser.add_argument("--catalog", help="catalog feed for --synthetic (default: built-in data)")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    store = PriceHistory(args.store)
+    if args.import_path:
+        frame = pd.read_parquet(args.import_path) if args.import_path.endswith((".parquet", ".pq")) else pd.read_csv(args.import_path)
+        written = store.append(laptop_ids(clean_names(frame["name"])), frame["timestamp"], frame["price"])
+    elif args.record is not None:
+        catalog = build_catalog(args.record or None)
+        written = store.append(laptop_ids(catalog.index), time.time(), catalog["Price (Rs)"].to_numpy())
+    else:
+        from synthetic import generate_price_history
+
+        history = generate_price_history(build_catalog(args.catalog), args.synthetic, seed=args.seed)
+        written = store.append(laptop_ids(history["name"]), history["timestamp"], history["price"])
+    print(f"Appended {written:,} price observations; {len(store):,} in {len(store.segments)} segment(s)")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,103 @@
+"""Price normalisation: parses INR price literals ("₹1.25 Lakh", "₹2 Crore", "65,990") into rupees."""
+import re
+from collections import namedtuple
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+
+PRICE_PATTERN = re.compile(
+    r"^\s*(?:₹|rs\.?|inr)?\s*"
+    r"(?P<amount>\d[\d,]*(?:\.\d+)?|\.\d+)\s*"
+    r"(?P<unit>crores?|cr|lakhs?|lacs?|l|thousand|k)?\.?\s*(?:/-)?\s*$",
+    re.IGNORECASE,
+)
+
+UNIT_MULTIPLIERS = {
+    None: 1,
+    "": 1,
+    "k": 1_000,
+    "thousand": 1_000,
+    "l": 100_000,
+    "lakh": 100_000,
+    "lakhs": 100_000,
+    "lac": 100_000,
+    "lacs": 100_000,
+    "cr": 10_000_000,
+    "crore": 10_000_000,
+    "crores": 10_000_000,
+}
+
+# Literal -> rupees (NaN when unparseable), shared across calls so repeated feed
+# chunks do not re-run the regex for literals already seen
+_MEMO = {}
+MEMO_LIMIT = 200_000
+
+ParsedPrices = namedtuple("ParsedPrices", ["values", "invalid"])
+
+
+def _parse_literals(literals):
+    """Parses distinct literals into a float array of rupees (NaN when unparseable)."""
+    literals = pd.Series(literals, dtype=object)
+    amounts = pd.to_numeric(literals, errors="coerce").to_numpy(dtype=float, copy=True)
+
+    text = np.isnan(amounts) & literals.map(lambda v: isinstance(v, str)).to_numpy(dtype=bool)
+    if text.any():
+        parts = literals[text].str.extract(PRICE_PATTERN)
+        # As float, so a huge amount times its unit overflows to a large number instead of wrapping
+        number = pd.to_numeric(parts["amount"].str.replace(",", "", regex=False), errors="coerce").astype(float)
+        unit = parts["unit"].str.lower().map(UNIT_MULTIPLIERS).fillna(1)
+        amounts[text] = (number * unit).to_numpy(dtype=float)
+    return amounts
+
+
+def _out_of_range(amounts, dtype):
+    """Amounts that cannot be a price stored as `dtype`: non-finite, negative or too large once rounded."""
+    rounded = np.rint(amounts)
+    with np.errstate(invalid="ignore"):
+        return ~np.isnan(amounts) & ~((rounded >= 0) & (rounded < np.iinfo(dtype).max + 1.0))
+
+
+def parse_prices(values, dtype="int64"):
+    """Parses a Series of price literals in one pass.
+
+    Handles Lakh/L/Lac, Crore/Cr, K/thousand and plain (optionally comma-grouped,
+    ₹/Rs-prefixed) amounts, as well as values that are already numeric. Each
+    distinct literal is parsed once. Returns ParsedPrices(values, invalid):
+    `values` is a nullable integer Series of whole rupees (rounded, not
+    truncated) with <NA> for rows that could not be parsed or fall outside
+    0..max of `dtype` (negative, infinite or overflowing amounts), and
+    `invalid` holds the original literals of those rows.
+    """
+    values = pd.Series(values)
+    if values.dtype.kind in "iuf":
+        amounts = values.to_numpy(dtype=float, copy=True)
+    else:
+        codes, uniques = pd.factorize(values)
+        uniques = pd.Series(uniques, dtype=object)
+        parsed = np.empty(len(uniques), dtype=float)
+
+        known = uniques.map(lambda v: v in _MEMO).to_numpy(dtype=bool) if _MEMO else np.zeros(len(uniques), dtype=bool)
+        parsed[known] = [_MEMO[v] for v in uniques[known]]
+        if (~known).any():
+            fresh = uniques[~known]
+            parsed[~known] = _parse_literals(fresh)
+            if len(_MEMO) + len(fresh) > MEMO_LIMIT:
+                _MEMO.clear()
+            _MEMO.update(zip(fresh, parsed[~known]))
+
+        amounts = np.where(codes >= 0, parsed[codes], np.nan)
+
+    amounts[_out_of_range(amounts, dtype)] = np.nan
+    bad = np.isnan(amounts) & values.notna().to_numpy()
+    result = pd.Series(pd.array(np.rint(amounts), dtype=dtype.capitalize()), index=values.index, name=values.name)
+    return ParsedPrices(result, values[bad])
+
+
+@lru_cache(maxsize=1024)
+def parse_price(literal):
+    """Parses a single price literal into whole rupees; raises ValueError if unparseable or out of range."""
+    amount = _parse_literals([literal])[0]
+    if np.isnan(amount) or _out_of_range(np.array([amount]), "int64")[0]:
+        raise ValueError(f"Unrecognised price literal: {literal!r}")
+    return int(round(amount))
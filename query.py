@@ -0,0 +1,280 @@
+"""Headless query engine: the sidebar filter semantics as a pure API, plus a batch CLI.
+
+    python query.py specs.jsonl --catalog feed.parquet --output results.jsonl
+
+Each input line is a JSON FilterSpec (see FilterSpec.from_dict); each output
+line holds the spec id, its match count and the top matches. An invalid line
+gets an {"id": ..., "error": ...} output line and the batch goes on.
+"""
+import argparse
+import json
+import sys
+from dataclasses import asdict, dataclass, fields, replace
+
+import numpy as np
+
+from catalog import build_catalog
+from filter_index import FilterIndex, PredicateCache
+from pricing import parse_price
+from table import DEFAULT_SORT, SORT_OPTIONS, SortIndex
+from tracing import NULL_TRACER
+
+GPU_TYPES = ("Dedicated", "Integrated")
+# Multi-select FilterSpec fields and the categorical index column each one filters
+FACET_COLUMNS = [("brands", "Brand"), ("utilities", "Utility"), ("cpu_brands", "CPU Brand"), ("gpu_types", "GPU Dedicated")]
+
+# Columns returned for each match (Name is the index)
+RESULT_COLUMNS = [
+    "Brand", "Utility", "Price (Rs)", "Spec Score",
+    "CPU Full Model", "RAM (GB)", "Storage (GB)",
+    "GPU Type", "GPU VRAM (GB)", "Screen (in)",
+]
+
+
+# FilterSpec fields by kind; None is allowed where the field's default is None
+MULTI_SELECT_FIELDS = ("brands", "utilities", "cpu_brands", "gpu_types")
+NUMERIC_FIELDS = ("min_price", "max_price", "min_score", "min_ram", "min_storage", "min_vram", "screen_min", "screen_max")
+OPTIONAL_FIELDS = ("min_price", "max_price", "min_score")
+
+
+def _normalize_values(name, values):
+    if values is None:
+        return None
+    # A bare string would otherwise be read as a list of its characters
+    if not isinstance(values, (list, tuple, set, frozenset)) or not all(isinstance(v, str) for v in values):
+        raise TypeError(f"{name} must be a list of strings")
+    return tuple(sorted(set(values)))
+
+
+def _check_number(name, value):
+    if value is None and name in OPTIONAL_FIELDS:
+        return value
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        raise TypeError(f"{name} must be a number, got {type(value).__name__}")
+    return value
+
+
+def _plain(value):
+    """Converts numpy scalars to plain Python numbers so specs hash and serialize cleanly."""
+    if isinstance(value, np.floating):
+        return float(str(value))  # shortest repr, so float32 17.3 stays 17.3
+    return value.item() if isinstance(value, np.generic) else value
+
+
+@dataclass(frozen=True)
+class FilterSpec:
+    """One sidebar filter state. None for a multi-select means "all values".
+
+    Specs are normalized on creation (sorted tuples, plain numbers), so two
+    specs that select the same laptops compare and hash equal. A field of the
+    wrong type (e.g. "16" for min_ram, or "HP" instead of ["HP"]) raises TypeError.
+    """
+    min_price: int = None
+    max_price: int = None
+    min_score: int = None
+    brands: tuple = None
+    utilities: tuple = None
+    min_ram: int = 0
+    min_storage: int = 0
+    cpu_brands: tuple = None
+    gpu_types: tuple = GPU_TYPES
+    min_vram: int = 0
+    screen_min: float = 0.0
+    screen_max: float = 100.0
+
+    def __post_init__(self):
+        for name in MULTI_SELECT_FIELDS:
+            object.__setattr__(self, name, _normalize_values(name, getattr(self, name)))
+        for name in NUMERIC_FIELDS:
+            object.__setattr__(self, name, _check_number(name, _plain(getattr(self, name))))
+
+    @classmethod
+    def from_dict(cls, data):
+        """Builds a spec from a JSON-style dict; prices may be literals such as "₹1.25 Lakh"."""
+        known = {f.name for f in fields(cls)}
+        unknown = set(data) - known
+        if unknown:
+            raise ValueError(f"Unknown FilterSpec fields: {sorted(unknown)}")
+        data = dict(data)
+        for name in ("min_price", "max_price"):
+            if isinstance(data.get(name), str):
+                data[name] = None if data[name] == "Max" else parse_price(data[name])
+        return cls(**data)
+
+    def to_dict(self):
+        return {k: list(v) if isinstance(v, tuple) else v for k, v in asdict(self).items()}
+
+    def predicates(self):
+        """Translates the spec into FilterIndex isin/range predicates.
+
+        Mirrors the sidebar: the GPU type filter only applies when exactly one of
+        Dedicated/Integrated is chosen, and the minimum VRAM only when Dedicated
+        is among the chosen types.
+        """
+        isin = {}
+        for column, accepted in (("Brand", self.brands), ("Utility", self.utilities), ("CPU Brand", self.cpu_brands)):
+            if accepted is not None:
+                isin[column] = accepted
+        ranges = {
+            'Price (Rs)': (self.min_price, self.max_price),
+            'Spec Score': (self.min_score, None),
+            'RAM (GB)': (self.min_ram, None),
+            'Storage (GB)': (self.min_storage, None),
+            'Screen (in)': (self.screen_min, self.screen_max + 0.001, 'left'), # Use a tiny offset for inclusive max
+        }
+
+        gpu_types = self.gpu_types or ()
+        if 'Dedicated' in gpu_types and 'Integrated' not in gpu_types:
+            isin['GPU Dedicated'] = ('Dedicated',)
+        elif 'Integrated' in gpu_types and 'Dedicated' not in gpu_types:
+            isin['GPU Dedicated'] = ('Integrated',)
+
+        if 'Dedicated' in gpu_types and self.min_vram > 0:
+            ranges['GPU VRAM (GB)'] = (self.min_vram, None)
+        return isin, ranges
+
+
+def select_positions(index, spec, predicate_cache=None, tracer=NULL_TRACER):
+    """Row positions of the catalog matching a spec (in catalog order)."""
+    isin, ranges = spec.predicates()
+    if predicate_cache is not None:
+        return predicate_cache.select(index, isin=isin, ranges=ranges, tracer=tracer)
+    with tracer.stage("filter"):
+        return index.select(isin=isin, ranges=ranges)
+
+
+def facet_counts(index, spec, predicate_cache=None, tracer=NULL_TRACER, within=None):
+    """Match count of every option of the spec's multi-selects, given the rest of the spec.
+
+    Returns {spec field: {option: count}} for brands, utilities, cpu_brands and
+    gpu_types: the laptops that selecting just that option would match, with
+    every other filter as it is. `within` optionally limits the counts to some
+    row positions (e.g. text-search matches).
+    """
+    isin, ranges = spec.predicates()
+    if predicate_cache is not None:
+        bitmaps = predicate_cache.bitmaps(index, isin, ranges, tracer)
+    else:
+        bitmaps = index.predicate_bitmaps(isin, ranges)
+    if within is not None:
+        bitmaps = {**bitmaps, None: index.positions_bitmap(within)}
+
+    # The minimum VRAM depends on the GPU type selection (see FilterSpec.predicates):
+    # it applies to the Dedicated count alone and to the other facets only while
+    # Dedicated is selected
+    vram_column = "GPU VRAM (GB)"
+    _, dedicated_ranges = replace(spec, gpu_types=("Dedicated",)).predicates()
+    gpu_bitmaps = {column: bitmap for column, bitmap in bitmaps.items() if column != vram_column}
+    vram = {}
+    if vram_column in dedicated_ranges:
+        vram["Dedicated"] = bitmaps[vram_column] if vram_column in bitmaps else index.range_bitmap(
+            vram_column, *dedicated_ranges[vram_column]
+        )
+
+    columns = [column for _, column in FACET_COLUMNS if column != "GPU Dedicated"]
+    with tracer.stage("filter: facet counts", facets=len(FACET_COLUMNS)):
+        counts = index.facet_counts(columns, bitmaps)
+        counts.update(index.facet_counts(["GPU Dedicated"], gpu_bitmaps, {"GPU Dedicated": vram}))
+    return {field: counts[column] for field, column in FACET_COLUMNS}
+
+
+def query(catalog, spec, index=None):
+    """Returns the catalog rows matching a FilterSpec, exactly as the sidebar would filter them.
+
+    Pass a prebuilt FilterIndex to answer many queries against the same catalog.
+    """
+    if index is None:
+        index = FilterIndex(catalog)
+    return catalog.iloc[select_positions(index, spec)]
+
+
+def records(frame):
+    """Converts result rows (Name index included) into JSON-ready dicts."""
+    # float32 specs (see catalog.compact_catalog) would otherwise print as 17.299999237...
+    narrow = [c for c in frame.columns if frame[c].dtype == np.float32]
+    frame = frame.astype({c: "float64" for c in narrow}).round({c: 4 for c in narrow})
+    records = frame.reset_index().to_dict(orient="records")
+    return [{k: _plain(v) for k, v in record.items()} for record in records]
+
+
+def top_matches(catalog, sort_index, positions, limit=10, sort=DEFAULT_SORT, offset=0):
+    """The `limit` best-ranked matching rows (after `offset`) as a frame of RESULT_COLUMNS."""
+    if not limit:
+        return catalog.iloc[positions[:0]][RESULT_COLUMNS]
+    ordered = sort_index.sort(positions, SORT_OPTIONS[sort])
+    return catalog.iloc[ordered[offset:offset + limit]][RESULT_COLUMNS]
+
+
+def run_batch(catalog, specs, limit=10, sort=DEFAULT_SORT):
+    """Evaluates many specs against one shared catalog and index.
+
+    Yields one result dict per spec, in input order. Consecutive specs that
+    share predicates reuse their bitmaps, and identical specs are answered once.
+    A ValueError in place of a spec (see read_specs) yields {"id", "error"}.
+    """
+    index = FilterIndex(catalog)
+    sort_index = SortIndex(catalog)
+    predicate_cache = PredicateCache()
+    answered = {}
+    for spec_id, spec in specs:
+        if isinstance(spec, ValueError):
+            yield {"id": spec_id, "error": str(spec)}
+            continue
+        if spec not in answered:
+            positions = select_positions(index, spec, predicate_cache)
+            answered[spec] = (len(positions), records(top_matches(catalog, sort_index, positions, limit, sort)))
+        count, matches = answered[spec]
+        yield {"id": spec_id, "count": count, "matches": matches}
+
+
+def read_specs(lines):
+    """Parses JSON Lines into (id, FilterSpec) pairs; an "id" field is optional.
+
+    An invalid line yields (id, ValueError) instead, with the line number as
+    the id unless the line has a readable "id".
+    """
+    for line_no, line in enumerate(lines, start=1):
+        line = line.strip()
+        if not line:
+            continue
+        spec_id = line_no
+        try:
+            data = json.loads(line)
+            if not isinstance(data, dict):
+                raise ValueError("expected a JSON object")
+            spec_id = data.pop("id", line_no)
+            spec = FilterSpec.from_dict(data)
+        except (ValueError, TypeError) as exc:
+            spec = ValueError(f"Invalid FilterSpec on line {line_no}: {exc}")
+        yield spec_id, spec
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Evaluate laptop FilterSpecs from a JSON Lines file in one batch.")
+    parser.add_argument("specs", help="JSON Lines file of FilterSpecs ('-' for stdin)")
+    parser.add_argument("--catalog", help="CSV / JSON Lines / Parquet feed (default: built-in sample data)")
+    parser.add_argument("--output", help="output JSON Lines file (default: stdout)")
+    parser.add_argument("--limit", type=int, default=10, help="matches returned per spec (0 for counts only)")
+    parser.add_argument("--sort", choices=list(SORT_OPTIONS), default=DEFAULT_SORT, help="order of returned matches")
+    args = parser.parse_args(argv)
+
+    catalog = build_catalog(args.catalog)
+    specs_in = sys.stdin if args.specs == "-" else open(args.specs, encoding="utf-8")
+    out = sys.stdout if args.output is None else open(args.output, "w", encoding="utf-8")
+    errors = 0
+    try:
+        for result in run_batch(catalog, read_specs(specs_in), limit=args.limit, sort=args.sort):
+            errors += "error" in result
+            out.write(json.dumps(result, ensure_ascii=False) + "\n")
+    finally:
+        if specs_in is not sys.stdin:
+            specs_in.close()
+        if out is not sys.stdout:
+            out.close()
+    if errors:
+        print(f"{errors:,} invalid FilterSpec line(s)", file=sys.stderr)
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,81 @@
+"""Top-K "best pick" ranking by partial selection instead of full sorts.
+
+Objectives score every candidate (higher is better) and `top_k` keeps the K
+best with np.argpartition, so ranking n matches costs O(n + K log K).
+"""
+import numpy as np
+
+VALUE_OBJECTIVE = "Best value (₹ per spec point)"
+WEIGHTED_OBJECTIVE = "Weighted mix"
+OBJECTIVES = [VALUE_OBJECTIVE, WEIGHTED_OBJECTIVE]
+
+# Column -> default weight for the weighted mix; price counts against a laptop
+DEFAULT_WEIGHTS = {
+    "Spec Score": 1.0,
+    "RAM (GB)": 0.3,
+    "Storage (GB)": 0.2,
+    "GPU VRAM (GB)": 0.3,
+    "Price (Rs)": 1.0,
+}
+PICK_SCORE_COL = "Pick Score"
+
+
+def column_bounds(frame, columns=tuple(DEFAULT_WEIGHTS)):
+    """Min and max per column, used to put the weighted-mix columns on a 0..1 scale."""
+    return {column: (float(frame[column].min()), float(frame[column].max())) for column in columns}
+
+
+def objective_scores(frame, objective=VALUE_OBJECTIVE, weights=None, bounds=None, score_col="Spec Score"):
+    """Scores each row for an objective; higher is better.
+
+    The value objective is `score_col` points per rupee (the reciprocal of the
+    chart's value score when the chart uses the same score column, so both rank
+    laptops identically). The weighted mix sums the
+    min-max normalized columns times their weights, with price subtracted.
+    `bounds` (see column_bounds) should come from the whole catalog so scores
+    do not shift as filters change.
+    """
+    if objective == VALUE_OBJECTIVE:
+        price = frame["Price (Rs)"].to_numpy(dtype=np.float64)
+        score = frame[score_col].to_numpy(dtype=np.float64)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            scores = score / price
+    elif objective == WEIGHTED_OBJECTIVE:
+        weights = DEFAULT_WEIGHTS if weights is None else weights
+        bounds = column_bounds(frame, list(weights)) if bounds is None else bounds
+        scores = np.zeros(len(frame))
+        for column, weight in weights.items():
+            if not weight:
+                continue
+            lo, hi = bounds[column]
+            normalized = (frame[column].to_numpy(dtype=np.float64) - lo) / ((hi - lo) or 1.0)
+            scores += -weight * normalized if column == "Price (Rs)" else weight * normalized
+    else:
+        raise ValueError(f"Unknown objective '{objective}'")
+    return np.where(np.isfinite(scores), scores, -np.inf)
+
+
+def top_k(scores, k):
+    """Indices of the k highest scores, best first; ties go to the lower index."""
+    scores = np.asarray(scores)
+    k = min(k, len(scores))
+    if k <= 0:
+        return np.empty(0, dtype=np.int64)
+    if k < len(scores):
+        kth = scores[np.argpartition(-scores, k - 1)[:k]].min()
+        # Everything strictly better, then the earliest rows tied with the k-th score
+        better = np.flatnonzero(scores > kth)
+        tied = np.flatnonzero(scores == kth)[:k - len(better)]
+        candidates = np.concatenate([better, tied])
+    else:
+        candidates = np.arange(len(scores))
+    return candidates[np.lexsort((candidates, -scores[candidates]))]
+
+
+def top_picks(frame, k=10, objective=VALUE_OBJECTIVE, weights=None, bounds=None, score_col="Spec Score"):
+    """The k best rows of a frame for an objective, with their score in PICK_SCORE_COL."""
+    scores = objective_scores(frame, objective, weights, bounds, score_col)
+    best = top_k(scores, k)
+    picks = frame.iloc[best].copy()
+    picks[PICK_SCORE_COL] = scores[best] * 1000 if objective == VALUE_OBJECTIVE else scores[best]
+    return picks
@@ -0,0 +1,87 @@
+"""Custom spec scores from user weights: one matrix-vector product per weight change.
+
+    python scoring.py --weight "CPU Tier=2" --weight "GPU VRAM (GB)=1.5" --catalog feed.parquet
+
+The score features of a catalog are min-max scaled to 0..1 once (storage on a
+log scale, as for similar-laptop search; see neighbors.feature_matrix) and
+kept as an (n, d) float32 matrix. A custom score is that matrix times the
+weight vector, scaled so the weights sum to 100. Scores therefore span 0..100
+like Spec Score, and the value score (₹ per point) keeps its meaning.
+Re-scoring a million rows reads a 20 MB matrix once.
+"""
+import argparse
+
+import numpy as np
+
+from neighbors import feature_matrix
+
+# Column -> default weight of the custom score
+DEFAULT_SCORE_WEIGHTS = {
+    "CPU Tier": 1.0,
+    "RAM (GB)": 1.0,
+    "Storage (GB)": 0.5,
+    "GPU VRAM (GB)": 1.0,
+    "Screen (in)": 0.5,
+}
+CUSTOM_SCORE_COL = "Custom Score"
+
+
+class SpecScorer:
+    """The normalized score-feature matrix of one catalog, built once and scored for any weights."""
+
+    def __init__(self, frame, columns=tuple(DEFAULT_SCORE_WEIGHTS)):
+        self.columns = list(columns)
+        self.matrix = np.ascontiguousarray(feature_matrix(frame, self.columns), dtype=np.float32)
+
+    def __len__(self):
+        return len(self.matrix)
+
+    def weight_vector(self, weights):
+        """Weights in column order, scaled to sum to 100 (all zeros stay zeros)."""
+        unknown = set(weights) - set(self.columns)
+        if unknown:
+            raise ValueError(f"Unknown score columns: {sorted(unknown)}; expected some of {self.columns}")
+        vector = np.array([weights.get(column, 0.0) for column in self.columns], dtype=np.float32)
+        if (vector < 0).any():
+            raise ValueError("Score weights must not be negative")
+        total = vector.sum()
+        return vector * np.float32(100 / total) if total else vector
+
+    def scores(self, weights, positions=None):
+        """Custom score (0..100) of every row, or of the rows at `positions`."""
+        matrix = self.matrix if positions is None else self.matrix.take(positions, axis=0)
+        return matrix @ self.weight_vector(weights)
+
+
+def parse_weight(text):
+    """'COLUMN=WEIGHT' -> (column, weight)."""
+    column, sep, weight = text.rpartition("=")
+    if not sep:
+        raise argparse.ArgumentTypeError(f"Expected COLUMN=WEIGHT, got '{text}'")
+    try:
+        return column.strip(), float(weight)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Weight for '{column}' is not a number: '{weight}'") from None
+
+
+def main(argv=None):
+    from catalog import build_catalog
+
+    parser = argparse.ArgumentParser(description="Rank laptops by a custom, user-weighted spec score.")
+    parser.add_argument("--weight", type=parse_weight, action="append", default=[],
+                        help=f"COLUMN=WEIGHT, repeatable; columns: {', '.join(DEFAULT_SCORE_WEIGHTS)}")
+    parser.add_argument("--catalog", help="CSV / JSON Lines / Parquet feed (default: built-in sample data)")
+    parser.add_argument("--limit", type=int, default=20)
+    args = parser.parse_args(argv)
+
+    catalog = build_catalog(args.catalog)
+    weights = {**DEFAULT_SCORE_WEIGHTS, **dict(args.weight)}
+    scores = SpecScorer(catalog).scores(weights)
+    best = np.argsort(-scores, kind="stable")[:args.limit]
+    results = catalog.iloc[best][list(DEFAULT_SCORE_WEIGHTS) + ["Spec Score", "Price (Rs)"]]
+    print(results.assign(**{CUSTOM_SCORE_COL: scores[best].astype(np.float64).round(1)}).to_string())
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
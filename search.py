@@ -0,0 +1,288 @@
+"""Typo-tolerant text search over listing names and CPU / GPU models.
+
+    python search.py "rtx 4060" --catalog feed.parquet
+
+A TextIndex is built once per catalog. Every text is split into lowercase
+alphanumeric words, and one sorted vocabulary holds the words of all searched
+columns. Each column keeps an inverted index from word to the rows (Name) or
+the distinct values (the categorical CPU / GPU columns) that contain it.
+Words without digits are also indexed by their character trigrams, so a
+misspelt query word finds its vocabulary words by trigram overlap instead of
+by comparing it with every word.
+
+A query matches a row when each of its words matches some word of the row in
+any searched column:
+
+    exact    the same word                                  score 1.0
+    prefix   a longer word starting with it ("ult" ~ ultra) score PREFIX_SCORE
+    fuzzy    a similar word ("nvidai" ~ nvidia)             score FUZZY_WEIGHT * trigram Dice
+
+Fuzzy matching only applies to words of MIN_FUZZY_LENGTH or more letters; words
+with digits must match exactly or by prefix, so "4060" never finds "4050". A
+row's relevance is the sum of its query words' best scores. Only the rows the
+caller passes in (the sidebar filter's matches) are ever scored.
+
+Words that mix letters and digits are also indexed by their parts ("rtx4060"
+as "rtx" and "4060"), and a query word like that which matches nothing as a
+whole is searched as its parts. So "RTX4060" and "RTX 4060" find the same
+laptops however the catalog spells them.
+"""
+import argparse
+import bisect
+import re
+
+import numpy as np
+import pandas as pd
+
+# Searched alongside the Name index
+SEARCH_COLUMNS = ["CPU Full Model", "GPU Type"]
+RELEVANCE_COL = "Relevance"
+PREFIX_SCORE = 0.8
+FUZZY_WEIGHT = 0.7
+# Trigram Dice similarity a fuzzy match needs
+FUZZY_THRESHOLD = 0.5
+MIN_FUZZY_LENGTH = 4
+WORD_SEPARATORS = r"[\W_]+"
+# A letter/digit boundary inside a word: "rtx4060" -> "rtx", "4060"
+PART_BOUNDARY = r"(?<=[^\W\d_])(?=\d)|(?<=\d)(?=[^\W\d_])"
+
+
+def split_words(texts):
+    """(text number, word) pairs of lowercase alphanumeric words, for a sequence of strings."""
+    cleaned = (
+        pd.Series(texts, dtype="str").fillna("").str.lower()
+        .str.replace(WORD_SEPARATORS, " ", regex=True).str.strip()
+    )
+    lengths = cleaned.str.len().to_numpy()
+    counts = np.where(lengths > 0, cleaned.str.count(" ").to_numpy(), -1) + 1
+    words = " ".join(cleaned[lengths > 0]).split(" ") if counts.any() else []
+    return np.repeat(np.arange(len(cleaned)), counts), words
+
+
+def word_parts(word):
+    """A word split at its letter/digit boundaries ("13620h" -> ["13620", "h"])."""
+    return re.split(PART_BOUNDARY, word)
+
+
+def _with_parts(text_no, words):
+    """Adds the parts of words that mix letters and digits, so "RTX4060" is also found as "rtx 4060"."""
+    codes, uniques = pd.factorize(np.asarray(words, dtype=object))
+    uniques = pd.Series(uniques, dtype="str")
+    mixed = np.flatnonzero(~(uniques.str.isalpha() | uniques.str.isdigit()).to_numpy())
+    if not len(mixed):
+        return text_no, words
+    spaced = uniques.iloc[mixed].str.replace(PART_BOUNDARY, " ", regex=True)
+    # Parts of every mixed distinct word, CSR-style, gathered once per occurrence
+    n_parts = np.zeros(len(uniques), dtype=np.int64)
+    n_parts[mixed] = spaced.str.count(" ").to_numpy() + 1
+    offsets = np.zeros(len(uniques) + 1, dtype=np.int64)
+    np.cumsum(n_parts, out=offsets[1:])
+    parts = np.array(" ".join(spaced).split(" "), dtype=object)
+    compound = np.flatnonzero(n_parts[codes] > 0)
+    extra, counts = _gather(offsets, parts, codes[compound])
+    return np.concatenate([text_no, np.repeat(text_no[compound], counts)]), list(words) + extra.tolist()
+
+
+def _trigrams(words):
+    """Distinct (word number, trigram key) pairs of words padded with a space on each side."""
+    padded = [f" {word} " for word in words]
+    lengths = np.fromiter(map(len, padded), dtype=np.int64, count=len(padded))
+    grams = lengths - 2
+    if not grams.sum():
+        return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.uint64)
+    chars = np.frombuffer("".join(padded).encode("utf-32-le"), dtype=np.uint32).astype(np.uint64)
+    word_no = np.repeat(np.arange(len(words)), grams)
+    starts = np.cumsum(lengths) - lengths
+    first_gram = np.cumsum(grams) - grams
+    pos = starts[word_no] + np.arange(grams.sum()) - first_gram[word_no]
+    # Code points fit in 21 bits, so three of them pack into one key
+    keys = (chars[pos] << np.uint64(42)) | (chars[pos + 1] << np.uint64(21)) | chars[pos + 2]
+    order = np.lexsort((keys, word_no))
+    word_no, keys = word_no[order], keys[order]
+    distinct = np.ones(len(keys), dtype=bool)
+    distinct[1:] = (word_no[1:] != word_no[:-1]) | (keys[1:] != keys[:-1])
+    return word_no[distinct], keys[distinct]
+
+
+def _postings(keys, values, n_keys):
+    """CSR inverted index: values[offsets[k]:offsets[k + 1]] belong to key k."""
+    order = np.argsort(keys, kind="stable")
+    offsets = np.zeros(n_keys + 1, dtype=np.int64)
+    np.cumsum(np.bincount(keys, minlength=n_keys), out=offsets[1:])
+    return offsets, values[order]
+
+
+def _gather(offsets, entries, keys):
+    """Concatenated posting entries of several keys, plus the number each key contributed."""
+    counts = offsets[keys + 1] - offsets[keys]
+    first = np.cumsum(counts) - counts
+    rows = np.arange(counts.sum()) - np.repeat(first - offsets[keys], counts)
+    return entries[rows], counts
+
+
+class TextIndex:
+    """Inverted word and trigram indexes over a catalog's Name index and SEARCH_COLUMNS."""
+
+    def __init__(self, frame, columns=SEARCH_COLUMNS):
+        self.n_rows = len(frame)
+        # Each field: the texts it indexes and, for categorical columns, every row's text number
+        fields = [(frame.index, None)]
+        for column in columns:
+            codes, uniques = pd.factorize(frame[column])
+            # Missing values point at an extra empty text
+            fields.append((list(uniques) + [""], np.where(codes < 0, len(uniques), codes).astype(np.int32)))
+
+        split = [_with_parts(*split_words(texts)) for texts, _ in fields]
+        words = np.concatenate([np.asarray(field_words, dtype=object) for _, field_words in split])
+        word_ids, vocabulary = pd.factorize(words, sort=True)
+        del words
+        vocabulary = list(vocabulary)
+        # The sorted vocabulary as one string plus offsets: compact, and bisectable for prefixes
+        self._vocab = "".join(vocabulary)
+        self._vocab_offsets = np.zeros(len(vocabulary) + 1, dtype=np.int64)
+        lengths = np.fromiter(map(len, vocabulary), dtype=np.int64, count=len(vocabulary))
+        np.cumsum(lengths, out=self._vocab_offsets[1:])
+
+        self.fields = []
+        start = 0
+        for (texts, codes), (text_no, field_words) in zip(fields, split):
+            ids = word_ids[start:start + len(field_words)]
+            start += len(field_words)
+            offsets, entries = _postings(ids, text_no.astype(np.int32), len(vocabulary))
+            text_rows = None if codes is None else np.bincount(codes, minlength=len(texts))
+            self.fields.append((len(texts), codes, offsets, entries, text_rows))
+
+        # Trigrams of the digit-free words, for fuzzy lookups
+        has_digits = pd.Series(vocabulary, dtype="str").str.contains(r"\d", regex=True).to_numpy()
+        self._fuzzy_words = np.flatnonzero(~has_digits)
+        word_no, keys = _trigrams([vocabulary[i] for i in self._fuzzy_words])
+        self._gram_keys, gram_ids = np.unique(keys, return_inverse=True)
+        self._gram_offsets, self._gram_words = _postings(gram_ids, word_no.astype(np.int32), len(self._gram_keys))
+        self._gram_counts = np.bincount(word_no, minlength=len(self._fuzzy_words))
+
+    def __len__(self):
+        return self.n_rows
+
+    def _word(self, i):
+        return self._vocab[self._vocab_offsets[i]:self._vocab_offsets[i + 1]]
+
+    def word_matches(self, word):
+        """(vocabulary ids, scores) of the vocabulary words one query word matches."""
+        n_words = len(self._vocab_offsets) - 1
+        lo = bisect.bisect_left(range(n_words), word, key=self._word)
+        hi = bisect.bisect_left(range(n_words), word + "\U0010ffff", key=self._word)
+        ids = np.arange(lo, hi)
+        scores = np.full(len(ids), PREFIX_SCORE)
+        if len(ids) and self._word(lo) == word:
+            scores[0] = 1.0
+        if len(word) < MIN_FUZZY_LENGTH or not word.isalpha():
+            return ids, scores
+
+        _, keys = _trigrams([word])
+        found = np.minimum(np.searchsorted(self._gram_keys, keys), len(self._gram_keys) - 1)
+        found = found[self._gram_keys[found] == keys] if len(self._gram_keys) else found[:0]
+        hits, _ = _gather(self._gram_offsets, self._gram_words, found)
+        candidates, overlap = np.unique(hits, return_counts=True)
+        dice = 2 * overlap / (len(keys) + self._gram_counts[candidates])
+        similar = dice >= FUZZY_THRESHOLD
+        fuzzy_ids = self._fuzzy_words[candidates[similar]]
+        fuzzy_scores = FUZZY_WEIGHT * dice[similar]
+        # A word that is also a prefix match keeps the better score
+        ids = np.concatenate([fuzzy_ids, ids])
+        scores = np.concatenate([fuzzy_scores, scores])
+        order = np.lexsort((-scores, ids))
+        ids, scores = ids[order], scores[order]
+        first = np.ones(len(ids), dtype=bool)
+        first[1:] = ids[1:] != ids[:-1]
+        return ids[first], scores[first]
+
+    def _text_scores(self, ids, scores):
+        """Per field, the best score of the given vocabulary words in every text (None if in none).
+
+        Also returns an upper bound on the number of rows they occur in.
+        """
+        field_scores, estimate = [], 0
+        for n_texts, _, offsets, entries, text_rows in self.fields:
+            texts, counts = _gather(offsets, entries, ids)
+            if not len(texts):
+                field_scores.append(None)
+                continue
+            text_scores = np.zeros(n_texts, dtype=np.float32)
+            np.maximum.at(text_scores, texts, np.repeat(scores, counts).astype(np.float32))
+            field_scores.append(text_scores)
+            estimate += len(texts) if text_rows is None else int(text_rows[texts].sum())
+        return field_scores, estimate
+
+    def _scores_at(self, field_scores, positions):
+        """A word's best score over the fields at each of `positions` (None: every row)."""
+        best = None
+        for (_, codes, _, _, _), text_scores in zip(self.fields, field_scores):
+            if text_scores is None:
+                continue
+            if codes is None:
+                # Name: texts are rows
+                row_scores = text_scores if positions is None else text_scores.take(positions)
+            else:
+                row_scores = text_scores.take(codes if positions is None else codes.take(positions))
+            best = row_scores if best is None else np.maximum(best, row_scores, out=best)
+        return best
+
+    def search(self, query, positions=None):
+        """Rows matching every word of `query`, as (positions, relevance scores).
+
+        Only `positions` (default: every row) are searched; matches keep their
+        order. A query without words matches every one of them with score 0.
+        """
+        _, words = split_words([query])
+        found = {}
+        for word in dict.fromkeys(words):
+            ids, scores = self.word_matches(word)
+            if not len(ids) and len(word_parts(word)) > 1:
+                # "rtx4060" against a catalog that writes "RTX 4060": every part has to match instead
+                found.update((part, self.word_matches(part)) for part in word_parts(word) if part not in found)
+            else:
+                found[word] = ids, scores
+        matches = [self._text_scores(ids, scores) for ids, scores in found.values()]
+        if any(estimate == 0 for _, estimate in matches):
+            return np.zeros(0, dtype=np.int64), np.zeros(0)
+        # Rarest word first: later words are only scored on the rows still matching
+        matches.sort(key=lambda match: match[1])
+        total = None
+        for field_scores, _ in matches:
+            word_scores = self._scores_at(field_scores, positions)
+            keep = np.flatnonzero(word_scores > 0)
+            positions = keep if positions is None else np.asarray(positions)[keep]
+            total = word_scores[keep] if total is None else total[keep] + word_scores[keep]
+        if positions is None:
+            positions = np.arange(self.n_rows)
+        return positions, np.zeros(len(positions)) if total is None else total.astype(np.float64)
+
+
+def restrict(positions, matches, scores):
+    """The `positions` that are among search `matches`, with their scores (both ascending)."""
+    positions = np.asarray(positions)
+    found = np.minimum(np.searchsorted(matches, positions), max(len(matches) - 1, 0))
+    hit = matches[found] == positions if len(matches) else np.zeros(len(positions), dtype=bool)
+    return positions[hit], scores[found[hit]]
+
+
+def main(argv=None):
+    from catalog import build_catalog
+
+    parser = argparse.ArgumentParser(description="Search laptop names and CPU / GPU models.")
+    parser.add_argument("query")
+    parser.add_argument("--catalog", help="CSV / JSON Lines / Parquet feed (default: built-in sample data)")
+    parser.add_argument("--limit", type=int, default=20)
+    args = parser.parse_args(argv)
+
+    catalog = build_catalog(args.catalog)
+    positions, scores = TextIndex(catalog).search(args.query)
+    order = np.argsort(-scores, kind="stable")[:args.limit]
+    results = catalog.iloc[positions[order]][["CPU Full Model", "GPU Type", "Price (Rs)"]]
+    print(results.assign(**{RELEVANCE_COL: scores[order].round(3)}).to_string())
+    print(f"{len(positions):,} matches")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,272 @@
+"""Local asyncio HTTP query service over one shared, read-only catalog.
+
+    python service.py --catalog feed.parquet --port 8765
+
+    POST /query   body: a FilterSpec JSON object, plus optional
+                  "limit" (default 50), "offset", "sort" and "format" ("json" | "arrow")
+    POST /catalog/updates  body: {"upserts": [raw records], "deletes": [names]}
+                  publishes a new catalog snapshot (see snapshots.py)
+    GET  /health  catalog size and version, and response-cache statistics
+
+Responses are cached in a bounded LRU keyed on the catalog version, the
+normalized FilterSpec and the paging/format options, so equivalent requests
+(e.g. brands listed in a different order) share one entry.
+"""
+import argparse
+import asyncio
+import json
+import sys
+import threading
+import traceback
+
+from catalog import build_catalog
+from export import ExportCache, export_bytes
+from filter_index import FilterIndex
+from query import FilterSpec, records, select_positions, top_matches
+from snapshots import SnapshotStore
+from table import DEFAULT_SORT, SORT_OPTIONS, SortIndex
+
+DEFAULT_LIMIT = 50
+MAX_LIMIT = 10_000
+MAX_BODY_BYTES = 1024 * 1024
+
+REASONS = {
+    200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed", 413: "Payload Too Large",
+    500: "Internal Server Error",
+}
+CONTENT_TYPES = {"json": "application/json", "arrow": "application/vnd.apache.arrow.file"}
+
+
+class HTTPError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+class CatalogState:
+    """One snapshot plus the indexes built for it; replaced as a whole on updates."""
+
+    def __init__(self, snapshot):
+        self.snapshot = snapshot
+        self.catalog = snapshot.catalog
+        self.index = FilterIndex(self.catalog)
+        self.sort_index = SortIndex(self.catalog)
+        for sort_keys in SORT_OPTIONS.values():
+            self.sort_index.rank(sort_keys)  # warm up so concurrent requests never race to build a rank
+
+
+class QueryService:
+    """Answers FilterSpec queries against immutable catalog snapshots, with an LRU response cache."""
+
+    def __init__(self, catalog, cache_entries=1024, cache_bytes=256 * 1024 * 1024):
+        self.store = SnapshotStore(catalog)
+        self.state = CatalogState(self.store.current)
+        self._swap_lock = threading.Lock()
+        self.cache = ExportCache(max_entries=cache_entries, max_bytes=cache_bytes)
+        # Requests are answered on executor threads
+        self._stats_lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def catalog(self):
+        return self.state.catalog
+
+    def parse_request(self, body):
+        """Splits a request body into (FilterSpec, limit, offset, sort, format)."""
+        try:
+            data = json.loads(body or b"{}")
+        except ValueError as exc:
+            raise HTTPError(400, f"Body is not valid JSON: {exc}") from exc
+        if not isinstance(data, dict):
+            raise HTTPError(400, "Body must be a JSON object")
+
+        limit = data.pop("limit", DEFAULT_LIMIT)
+        offset = data.pop("offset", 0)
+        sort = data.pop("sort", DEFAULT_SORT)
+        fmt = data.pop("format", "json")
+        # bool is an int subclass; true/false are not counts
+        if isinstance(limit, bool) or not isinstance(limit, int) or not 0 <= limit <= MAX_LIMIT:
+            raise HTTPError(400, f"limit must be an integer between 0 and {MAX_LIMIT}")
+        if isinstance(offset, bool) or not isinstance(offset, int) or offset < 0:
+            raise HTTPError(400, "offset must be a non-negative integer")
+        if sort not in SORT_OPTIONS:
+            raise HTTPError(400, f"sort must be one of {list(SORT_OPTIONS)}")
+        if fmt not in CONTENT_TYPES:
+            raise HTTPError(400, f"format must be one of {list(CONTENT_TYPES)}")
+        try:
+            spec = FilterSpec.from_dict(data)
+        except (ValueError, TypeError) as exc:
+            raise HTTPError(400, str(exc)) from exc
+        return spec, limit, offset, sort, fmt
+
+    def answer(self, spec, limit, offset, sort, fmt):
+        """Returns the response body for a query, from the cache when possible."""
+        state = self.state  # one snapshot for the whole request, even if an update lands meanwhile
+        key = (state.snapshot.version, spec, limit, offset, sort, fmt)
+        built = []
+
+        def build():
+            built.append(True)
+            positions = select_positions(state.index, spec)
+            matches = top_matches(state.catalog, state.sort_index, positions, limit, sort, offset)
+            if fmt == "arrow":
+                return export_bytes(matches, "arrow")
+            payload = {"count": len(positions), "offset": offset, "matches": records(matches)}
+            return json.dumps(payload, ensure_ascii=False).encode("utf-8")
+
+        body = self.cache.get_or_create(key, build)
+        with self._stats_lock:
+            if built:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return body
+
+    def parse_updates(self, body):
+        try:
+            data = json.loads(body or b"{}")
+        except ValueError as exc:
+            raise HTTPError(400, f"Body is not valid JSON: {exc}") from exc
+        if not isinstance(data, dict) or set(data) - {"upserts", "deletes"}:
+            raise HTTPError(400, 'Body must be an object with "upserts" and/or "deletes"')
+        upserts, deletes = data.get("upserts", []), data.get("deletes", [])
+        if not isinstance(upserts, list) or not all(isinstance(r, dict) for r in upserts):
+            raise HTTPError(400, "upserts must be a list of record objects")
+        if not isinstance(deletes, list) or not all(isinstance(n, str) for n in deletes):
+            raise HTTPError(400, "deletes must be a list of names")
+        return upserts, deletes
+
+    def apply_updates(self, upserts, deletes):
+        """Publishes a new snapshot and swaps it in; in-flight queries finish on the old one."""
+        try:
+            snapshot = self.store.update(upserts, deletes)
+        except (ValueError, KeyError) as exc:
+            raise HTTPError(400, str(exc)) from exc
+        state = CatalogState(snapshot) if snapshot is not self.state.snapshot else None
+        with self._swap_lock:
+            # Concurrent updates may finish indexing out of order; never step back a version
+            if state is not None and snapshot.version > self.state.snapshot.version:
+                self.state = state
+        return json.dumps({"version": snapshot.version, "rows": len(snapshot.catalog)}).encode("utf-8")
+
+    def health(self):
+        with self._stats_lock:
+            hits, misses = self.hits, self.misses
+        return json.dumps({
+            "version": self.state.snapshot.version,
+            "rows": len(self.catalog),
+            "cache_entries": len(self.cache),
+            "cache_hits": hits,
+            "cache_misses": misses,
+        }).encode("utf-8")
+
+    # -- HTTP -----------------------------------------------------------
+
+    async def handle(self, method, path, body):
+        """Routes one request and returns (status, content type, body)."""
+        path = path.split("?", 1)[0]
+        if path == "/health":
+            if method != "GET":
+                raise HTTPError(405, "Use GET /health")
+            return 200, CONTENT_TYPES["json"], self.health()
+        if path == "/query":
+            if method != "POST":
+                raise HTTPError(405, "Use POST /query with a FilterSpec JSON body")
+            request = self.parse_request(body)
+            # Filtering is NumPy-bound; run it off the event loop so other connections keep flowing
+            loop = asyncio.get_running_loop()
+            payload = await loop.run_in_executor(None, self.answer, *request)
+            return 200, CONTENT_TYPES[request[-1]], payload
+        if path == "/catalog/updates":
+            if method != "POST":
+                raise HTTPError(405, "Use POST /catalog/updates with upserts/deletes")
+            upserts, deletes = self.parse_updates(body)
+            loop = asyncio.get_running_loop()
+            payload = await loop.run_in_executor(None, self.apply_updates, upserts, deletes)
+            return 200, CONTENT_TYPES["json"], payload
+        raise HTTPError(404, f"No route for {path}")
+
+    async def serve_connection(self, reader, writer):
+        """Serves HTTP/1.1 requests on one connection until the client closes it."""
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                try:
+                    method, path, version = request_line.decode("latin-1").split()
+                except ValueError:
+                    break
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+
+                keep_alive = headers.get("connection", "").lower() != "close" and version == "HTTP/1.1"
+                try:
+                    try:
+                        length = int(headers.get("content-length", 0))
+                    except ValueError:
+                        raise HTTPError(400, "Invalid Content-Length header") from None
+                    if length < 0:
+                        raise HTTPError(400, "Invalid Content-Length header")
+                    if length > MAX_BODY_BYTES:
+                        raise HTTPError(413, f"Body larger than {MAX_BODY_BYTES} bytes")
+                    body = await reader.readexactly(length) if length else b""
+                    status, content_type, payload = await self.handle(method, path, body)
+                except HTTPError as exc:
+                    status, content_type = exc.status, CONTENT_TYPES["json"]
+                    payload = json.dumps({"error": str(exc)}).encode("utf-8")
+                    keep_alive = keep_alive and exc.status != 413
+                except (asyncio.IncompleteReadError, ConnectionResetError):
+                    raise
+                except Exception as exc:
+                    # A bug must not leave the client without a response
+                    print(f"Failed to answer {method} {path}:", file=sys.stderr)
+                    traceback.print_exc()
+                    status, content_type = 500, CONTENT_TYPES["json"]
+                    payload = json.dumps({"error": f"{type(exc).__name__}: {exc}"}).encode("utf-8")
+
+                writer.write(
+                    f"HTTP/1.1 {status} {REASONS[status]}\r\n"
+                    f"Content-Type: {content_type}\r\n"
+                    f"Content-Length: {len(payload)}\r\n"
+                    f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n".encode("latin-1") + payload
+                )
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionResetError):
+            pass
+        finally:
+            writer.close()
+
+    async def serve(self, host="127.0.0.1", port=8765):
+        server = await asyncio.start_server(self.serve_connection, host, port)
+        async with server:
+            await server.serve_forever()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serve laptop catalog queries over HTTP.")
+    parser.add_argument("--catalog", help="CSV / JSON Lines / Parquet feed (default: built-in sample data)")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--cache-entries", type=int, default=1024, help="maximum cached responses")
+    args = parser.parse_args(argv)
+
+    service = QueryService(build_catalog(args.catalog), cache_entries=args.cache_entries)
+    print(f"Serving {len(service.catalog):,} laptops on http://{args.host}:{args.port}")
+    try:
+        asyncio.run(service.serve(args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
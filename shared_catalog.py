@@ -0,0 +1,241 @@
+"""Host-wide, read-only catalog buffers and per-session views over them.
+
+A built catalog is written once as an uncompressed Arrow IPC file in shared
+memory (/dev/shm when the host has it) and memory-mapped back. In the mapped
+frame:
+- numeric columns are read-only NumPy views of the mapping;
+- listing names and other strings stay in the mapped Arrow buffers;
+- only the one-byte categorical codes are materialized per process.
+Every Streamlit process on the host therefore reads the same physical pages,
+and a process that finds the file for its source already there skips the
+build.
+
+Sessions never copy the catalog. A CatalogView is the session's row positions
+plus the columns the session computed itself. Base columns are gathered one
+at a time when read, and a full frame is materialized only for small results
+or downloads.
+"""
+import hashlib
+import importlib
+import os
+import tempfile
+import threading
+import weakref
+
+import numpy as np
+import pandas as pd
+
+SHARED_DIR = os.environ.get("LAPTOP_SHARED_DIR") or os.path.join(
+    "/dev/shm" if os.path.isdir("/dev/shm") else tempfile.gettempdir(), "laptop-analyzer"
+)
+# Base catalogs kept on the host; older ones are removed (processes still mapping them are unaffected)
+MAX_BASE_FILES = 4
+# Modules whose code decides a built catalog's contents; a deploy that changes them must not map old files
+BUILD_MODULES = ["catalog", "dedup", "ingest", "laptop_data", "pricing", "taxonomy"]
+
+
+def build_id():
+    """Digest of the catalog-building code, part of every shared file's key."""
+    digest = hashlib.sha256()
+    for name in BUILD_MODULES:
+        with open(importlib.import_module(name).__file__, "rb") as fh:
+            digest.update(fh.read())
+    return digest.hexdigest()[:16]
+
+
+def _pyarrow():
+    try:
+        import pyarrow as pa
+    except ImportError as exc:
+        raise ImportError("Shared catalogs require pyarrow (pip install pyarrow)") from exc
+    return pa
+
+
+def write_shared(frame, path):
+    """Writes a frame (index included) as an Arrow IPC file, atomically replacing `path`."""
+    pa = _pyarrow()
+    table = pa.Table.from_pandas(frame, preserve_index=True)
+    tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with pa.OSFile(tmp, "wb") as sink, pa.ipc.new_file(sink, table.schema) as writer:
+        writer.write_table(table)
+    os.replace(tmp, path)
+
+
+def map_shared(path):
+    """Memory-maps an Arrow IPC file written by write_shared back into a frame without copying buffers."""
+    pa = _pyarrow()
+    table = pa.ipc.open_file(pa.memory_map(path)).read_all()
+    # One block per column, so numeric columns can stay views of the mapping
+    return table.to_pandas(split_blocks=True)
+
+
+class SharedCatalogs:
+    """Shared-memory catalog files for one host, keyed by catalog source version."""
+
+    def __init__(self, directory=SHARED_DIR, max_base_files=MAX_BASE_FILES):
+        self.directory = directory
+        self.max_base_files = max_base_files
+        self._lock = threading.Lock()
+        self._mapped = weakref.WeakValueDictionary()
+        self._count = 0
+        self.build_id = build_id()
+        os.makedirs(directory, exist_ok=True)
+        self._prune_snapshots()
+
+    def _path(self, name):
+        return os.path.join(self.directory, name)
+
+    def _map(self, path):
+        frame = map_shared(path)
+        self._mapped[id(frame)] = frame
+        return frame
+
+    def is_shared(self, frame):
+        return self._mapped.get(id(frame)) is frame
+
+    def get_or_build(self, key, build):
+        """The shared frame for a catalog source version, building and publishing it if no process has yet.
+
+        `key` must identify the source contents across processes (see
+        catalog.catalog_cache_key); `build()` returns the catalog frame.
+        """
+        digest = hashlib.sha256(repr((self.build_id, key)).encode()).hexdigest()[:32]
+        path = self._path(f"catalog-{digest}.arrow")
+        with self._lock:
+            if os.path.exists(path):
+                os.utime(path)  # keeps it off the pruning list
+            else:
+                write_shared(build(), path)
+                self._prune()
+            return self._map(path)
+
+    def _prune(self):
+        base = sorted(
+            (entry for entry in os.scandir(self.directory) if entry.name.startswith("catalog-") and entry.name.endswith(".arrow")),
+            key=lambda entry: entry.stat().st_mtime,
+            reverse=True,
+        )
+        for entry in base[self.max_base_files:]:
+            _remove_quietly(entry.path)
+        self._prune_snapshots()
+
+    def _prune_snapshots(self):
+        """Removes the snapshot files of processes that exited without cleaning up (e.g. crashed)."""
+        for entry in os.scandir(self.directory):
+            if not (entry.name.startswith("snapshot-") and entry.name.endswith(".arrow")):
+                continue
+            try:
+                pid = int(entry.name.split("-")[1])
+            except (IndexError, ValueError):
+                continue
+            if not _pid_alive(pid):
+                _remove_quietly(entry.path)
+
+    def freeze(self, frame):
+        """Moves a frame into a process-private shared-memory file (a SnapshotStore `freeze` hook).
+
+        Updated snapshots depend on which updates this process applied, so they
+        are not looked up by other processes; the file is removed once the
+        snapshot is garbage-collected.
+        """
+        if self.is_shared(frame):
+            return frame
+        with self._lock:
+            self._count += 1
+            path = self._path(f"snapshot-{os.getpid()}-{self._count}.arrow")
+        write_shared(frame, path)
+        mapped = self._map(path)
+        weakref.finalize(mapped, _remove_quietly, path)
+        return mapped
+
+
+def _pid_alive(pid):
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True  # another user's process
+    return True
+
+
+def _remove_quietly(path):
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+class _ILoc:
+    def __init__(self, view):
+        self.view = view
+
+    def __getitem__(self, rows):
+        return self.view.take(rows).to_frame()
+
+
+class CatalogView:
+    """Selected rows of a shared catalog plus per-session columns, without copying the catalog.
+
+    Supports what the app's helpers read from a results frame: `len`,
+    `view[column]` (a Series), `.index`, `.columns` and `.iloc[rows]` (a small
+    materialized frame). `take` narrows the view and `assign` adds session
+    columns; both return new views.
+    """
+
+    def __init__(self, catalog, positions, columns=None):
+        self.catalog = catalog
+        self.positions = np.asarray(positions, dtype=np.int64)
+        self._own = dict(columns or {})
+        self._gathered = {}
+
+    def __len__(self):
+        return len(self.positions)
+
+    @property
+    def empty(self):
+        return len(self.positions) == 0
+
+    @property
+    def index(self):
+        return self.catalog.index[self.positions]
+
+    @property
+    def columns(self):
+        return pd.Index(list(self.catalog.columns) + [c for c in self._own if c not in self.catalog.columns])
+
+    @property
+    def iloc(self):
+        return _ILoc(self)
+
+    def __getitem__(self, column):
+        if column in self._own:
+            return pd.Series(self._own[column], name=column)
+        if column not in self._gathered:
+            # Take from the values only; a Series take would gather the Name index too
+            self._gathered[column] = pd.Series(self.catalog[column].array.take(self.positions), name=column)
+        return self._gathered[column]
+
+    def assign(self, **columns):
+        """A view with extra per-session columns (arrays aligned with the view's rows)."""
+        view = CatalogView(self.catalog, self.positions, {**self._own, **columns})
+        view._gathered = self._gathered
+        return view
+
+    def take(self, rows):
+        """A view of some of this view's rows (positions or a boolean mask)."""
+        rows = np.asarray(rows)
+        if rows.dtype == bool:
+            rows = np.flatnonzero(rows)
+        return CatalogView(
+            self.catalog, self.positions[rows],
+            {name: np.asarray(values)[rows] for name, values in self._own.items()},
+        )
+
+    def to_frame(self, columns=None):
+        """Materializes the rows (all columns, or just `columns`) as a Name-indexed frame."""
+        frame = self.catalog.iloc[self.positions] if columns is None else self.catalog.iloc[self.positions][
+            [c for c in columns if c not in self._own]
+        ]
+        own = {name: np.asarray(values) for name, values in self._own.items() if columns is None or name in columns}
+        return frame.assign(**own) if own else frame
@@ -0,0 +1,134 @@
+"""Pareto frontier (skyline) of laptops over user-chosen spec dimensions.
+
+A laptop is on the skyline when no other laptop is at least as good on every
+chosen dimension and strictly better on one. Two dimensions use an O(n log n)
+sort-and-sweep; more use a block-nested sort-filter-skyline (SFS) pass.
+Both run after a grouping reduction that keeps, for each combination of the
+low-cardinality dimensions (RAM, storage, VRAM, score), only the best value of
+the remaining one. That shrinks a million rows to a few thousand candidates.
+A continuous dimension (such as a custom float score) defeats the reduction,
+so callers round it to a `resolution` step first.
+"""
+import numpy as np
+
+# Dimension -> True when larger is better
+SKYLINE_DIMENSIONS = {
+    "Price (Rs)": False,
+    "Spec Score": True,
+    "RAM (GB)": True,
+    "Storage (GB)": True,
+    "GPU VRAM (GB)": True,
+}
+
+# Above this many groups the reduction no longer pays for itself
+MAX_REDUCTION_GROUPS = 1_000_000
+SFS_BLOCK = 512
+
+
+def oriented_points(frame, dimensions, directions=SKYLINE_DIMENSIONS, resolution=None):
+    """(n, d) float64 matrix of the chosen columns where lower is always better.
+
+    `directions` maps each column to True when larger is better; `resolution`
+    optionally maps columns to a step their values are rounded to (e.g. 1 for
+    whole score points), so values closer than that count as equal.
+    """
+    resolution = resolution or {}
+    points = np.empty((len(frame), len(dimensions)), dtype=np.float64)
+    for i, column in enumerate(dimensions):
+        values = frame[column].to_numpy(dtype=np.float64)
+        if column in resolution:
+            values = np.round(values / resolution[column]) * resolution[column]
+        points[:, i] = -values if directions[column] else values
+    return points
+
+
+def _reduce(points):
+    """Mask of rows that hold their group's minimum of the highest-cardinality dimension.
+
+    Rows are grouped by every other dimension; within a group only the cheapest
+    (or otherwise best) rows can be non-dominated.
+    """
+    codes, cardinalities = [], []
+    for column in points.T:
+        uniques, inverse = np.unique(column, return_inverse=True)
+        codes.append(inverse)
+        cardinalities.append(len(uniques))
+    free = int(np.argmax(cardinalities))
+    n_groups = 1
+    for i, cardinality in enumerate(cardinalities):
+        if i != free:
+            n_groups *= cardinality
+    if n_groups > MAX_REDUCTION_GROUPS:
+        return np.ones(len(points), dtype=bool)
+
+    group = np.zeros(len(points), dtype=np.int64)
+    for i, code in enumerate(codes):
+        if i != free:
+            group = group * cardinalities[i] + code
+    best = np.full(n_groups, np.inf)
+    np.minimum.at(best, group, points[:, free])
+    return points[:, free] == best[group]
+
+
+def _sweep_2d(points):
+    """Skyline of distinct 2-D points in lexicographic order: keep strictly new minima of y."""
+    y = points[:, 1]
+    best_before = np.minimum.accumulate(np.concatenate(([np.inf], y[:-1])))
+    return y < best_before
+
+
+def _dominated(points, window):
+    """For each point, whether some window point is <= it on every dimension."""
+    dominated = np.zeros(len(points), dtype=bool)
+    step = max(1, (1 << 22) // max(1, len(points) * points.shape[1]))
+    for start in range(0, len(window), step):
+        chunk = window[start:start + step]
+        dominated |= (chunk[None, :, :] <= points[:, None, :]).all(axis=2).any(axis=1)
+    return dominated
+
+
+def _sfs(points):
+    """Block-nested sort-filter-skyline over distinct points.
+
+    Points are visited by ascending coordinate sum, so a point can only be
+    dominated by points visited before it; each block is checked against the
+    skyline found so far and then against itself.
+    """
+    order = np.argsort(points.sum(axis=1), kind="stable")
+    keep = np.zeros(len(points), dtype=bool)
+    window = points[:0]
+    for start in range(0, len(order), SFS_BLOCK):
+        block_rows = order[start:start + SFS_BLOCK]
+        block = points[block_rows]
+        alive = ~_dominated(block, window) if len(window) else np.ones(len(block), dtype=bool)
+        block_rows, block = block_rows[alive], block[alive]
+        within = (block[None, :, :] <= block[:, None, :]).all(axis=2)
+        np.fill_diagonal(within, False)
+        alive = ~within.any(axis=1)
+        keep[block_rows[alive]] = True
+        window = np.concatenate([window, block[alive]])
+    return keep
+
+
+def skyline_mask(points):
+    """Boolean mask of the non-dominated rows of a lower-is-better (n, d) matrix.
+
+    Rows with identical values are all kept (none strictly beats the other).
+    """
+    n, d = points.shape
+    mask = np.zeros(n, dtype=bool)
+    if n == 0 or d == 0:
+        return mask
+    if d == 1:
+        return points[:, 0] == points[:, 0].min()
+
+    candidates = np.flatnonzero(_reduce(points))
+    distinct, inverse = np.unique(points[candidates], axis=0, return_inverse=True)
+    keep = _sweep_2d(distinct) if d == 2 else _sfs(distinct)
+    mask[candidates[keep[inverse.ravel()]]] = True
+    return mask
+
+
+def skyline(frame, dimensions, directions=SKYLINE_DIMENSIONS, resolution=None):
+    """Row positions (in frame order) of the Pareto frontier over `dimensions` (see oriented_points)."""
+    return np.flatnonzero(skyline_mask(oriented_points(frame, dimensions, directions, resolution)))
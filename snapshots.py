@@ -0,0 +1,302 @@
+"""Incremental catalog updates published as versioned, immutable snapshots.
+
+    store = SnapshotStore(build_catalog(feed))
+    store.update(upserts=[{"name": "Victus 15", "price_inr": 61990}], deletes=["Old Model"])
+    store.current.catalog   # the latest frozen catalog
+
+Upserts and deletes are keyed by Name. Only upserted rows are normalized and
+get their CPU/GPU columns derived; the untouched rows are carried over as-is.
+Every update publishes a new Snapshot. The store keeps a strong reference only
+to the latest one, so an older snapshot is reclaimed as soon as the last
+session still holding it moves on.
+
+Update logs are JSON Lines files that feeds append to, one operation per line:
+
+    {"upsert": {"name": "Victus 15", "price_inr": "₹61,990"}}
+    {"delete": "Old Model"}
+
+Operations apply in log order, so an upsert followed by a delete of the same
+Name removes it. A malformed line or an upsert that cannot be applied is
+skipped and kept in SnapshotStore.rejected; the rest of the log still applies.
+"""
+import json
+import os
+import threading
+import time
+import weakref
+from collections import deque
+from dataclasses import dataclass, field
+
+import numpy as np
+import pandas as pd
+
+from catalog import (
+    DEFAULT_FIELD_MAP, DISPLAY_COLUMNS, FLOAT_COLUMNS, INT_COLUMNS, REQUIRED_COLUMNS, add_derived_columns, freeze_frame,
+    normalize_chunk,
+)
+from dedup import CANONICAL_ID_COL, extend_canonical_ids
+
+NUMERIC_COLUMNS = set(INT_COLUMNS + FLOAT_COLUMNS)
+# Rejected update-log entries kept for reporting
+MAX_REJECTED = 100
+
+
+@dataclass(frozen=True, eq=False)
+class Snapshot:
+    """One published catalog version. Never modified after publication."""
+    version: int
+    catalog: pd.DataFrame
+    created: float = field(default_factory=time.time)
+    upserted: int = 0
+    deleted: int = 0
+
+
+def _merged_dtype(current, incoming):
+    """A dtype that holds both the catalog's column and the updated rows' values."""
+    if isinstance(current, pd.CategoricalDtype):
+        added = pd.Index(incoming.dropna().unique()).difference(current.categories)
+        return pd.CategoricalDtype(current.categories.append(added)) if len(added) else current
+    if current.kind in "iu" and len(incoming):
+        info = np.iinfo(current)
+        fits = info.min <= incoming.min() and incoming.max() <= info.max
+        if fits:
+            return current
+        for bound in (incoming.min(), incoming.max()):
+            current = np.promote_types(current, np.min_scalar_type(bound))
+        return current
+    return current
+
+
+def _merged_index_dtype(current, incoming):
+    if isinstance(current, pd.CategoricalDtype):
+        return _merged_dtype(current, pd.Series(incoming))
+    return None
+
+
+def derive_rows(records, catalog, field_map=None):
+    """Normalizes raw upsert records and derives their CPU/GPU columns.
+
+    A record for a Name already in the catalog may be partial (e.g. just a new
+    price); missing fields are taken from that Name's current row. Several
+    records for one Name are merged in order first, so a later one only
+    overrides the fields it gives. New names must come with every field.
+    """
+    mapping = {**DEFAULT_FIELD_MAP, **(field_map or {})}
+    raw = pd.DataFrame(list(records)).rename(columns=mapping)
+    if "Name" not in raw.columns or raw["Name"].isna().any():
+        raise ValueError("Every upsert needs a name")
+    # Partial upserts of the same Name combine in order: each field keeps its last given value
+    raw = raw.reindex(columns=DISPLAY_COLUMNS).groupby("Name", sort=False).last().reset_index()
+
+    current = catalog[~catalog.index.duplicated()].reindex(raw["Name"])
+    current = current.reset_index()[[c for c in DISPLAY_COLUMNS if c in current.columns or c == "Name"]]
+    raw = raw.fillna({c: pd.Series(current[c].astype(object).to_numpy()) for c in current.columns if c != "Name"})
+    # Filled-in values arrive as objects; text columns go back to strings for the CPU/GPU parsers
+    raw = raw.astype({c: "str" for c in DISPLAY_COLUMNS if c not in NUMERIC_COLUMNS and raw[c].notna().all()})
+    incomplete = raw[raw.isna().any(axis=1)]
+    if len(incomplete):
+        raise ValueError(f"New names need every field; incomplete upserts: {list(incomplete['Name'])}")
+    # normalize_chunk treats a missing optional spec as 0; a value that is there but not a number is an error
+    optional = [c for c in INT_COLUMNS + FLOAT_COLUMNS if c not in REQUIRED_COLUMNS]
+    unparseable = pd.DataFrame({c: pd.to_numeric(raw[c], errors="coerce").isna() for c in optional}).any(axis=1)
+    if unparseable.any():
+        raise ValueError(f"Upserts with a non-numeric spec value: {list(raw.loc[unparseable, 'Name'])}")
+
+    rows = normalize_chunk(raw, mapping)
+    if len(rows) < len(raw):
+        raise ValueError(f"Upserts with an unparseable price or spec score: {list(raw.drop(index=rows.index)['Name'])}")
+    rows = rows.set_index("Name")
+    return add_derived_columns(rows)
+
+
+def apply_updates(catalog, upserts=(), deletes=(), field_map=None):
+    """Returns a new catalog with `upserts` replacing and `deletes` removing rows by Name.
+
+    Rows of upserted names are replaced by the new record (all duplicates of a
+    name included) and appended at the end, so only those rows are re-derived; deleted names that are not in the
+    catalog are ignored. Column dtypes, categoricals included, are kept so the
+    result stays compact. Upserted rows get canonical IDs by re-scoring only
+    the brand/CPU blocks they fall into.
+    """
+    upserts = list(upserts)
+    rows = derive_rows(upserts, catalog, field_map) if upserts else None
+    removed = set(deletes) | (set(rows.index) if rows is not None else set())
+    kept = catalog[~catalog.index.isin(list(removed))] if removed else catalog
+    if rows is None:
+        return kept.copy()
+
+    has_ids = CANONICAL_ID_COL in catalog.columns
+    if has_ids:
+        # Replaced names offer their previous ID; the rest are assigned below, once the rows are in place
+        previous = catalog[CANONICAL_ID_COL].groupby(level=0, observed=True).min()
+        rows[CANONICAL_ID_COL] = previous.reindex(rows.index).fillna(-1).astype(np.int64).to_numpy()
+    rows = rows[catalog.columns]
+    columns = {}
+    for name in catalog.columns:
+        dtype = _merged_dtype(catalog[name].dtype, rows[name])
+        columns[name] = pd.concat([kept[name].astype(dtype), rows[name].astype(dtype)], ignore_index=True)
+    index = kept.index.append(pd.Index(rows.index))
+    index_dtype = _merged_index_dtype(catalog.index.dtype, rows.index)
+    if index_dtype is not None:
+        index = pd.CategoricalIndex(index.astype(object), dtype=index_dtype, name=catalog.index.name)
+    frame = pd.DataFrame(columns)
+    frame.index = index.rename(catalog.index.name)
+    if has_ids:
+        ids = extend_canonical_ids(frame, np.arange(len(kept), len(frame)))
+        frame[CANONICAL_ID_COL] = pd.to_numeric(ids, downcast="integer")
+    return frame
+
+
+def _parse_log_line(line):
+    """One update-log line as ("upsert", record) or ("delete", name); ValueError if malformed."""
+    op = json.loads(line)
+    if isinstance(op, dict) and isinstance(op.get("upsert"), dict):
+        return "upsert", op["upsert"]
+    if isinstance(op, dict) and isinstance(op.get("delete"), str):
+        return "delete", op["delete"]
+    raise ValueError("Update log entry needs an 'upsert' record or a 'delete' name")
+
+
+def read_update_log(path, offset=0):
+    """Reads operations appended to an update log since byte `offset`.
+
+    Returns (operations, rejected, new_offset): `operations` holds ("upsert",
+    record) and ("delete", name) pairs in log order, `rejected` holds (line,
+    error) for malformed lines. A trailing line without a newline is still
+    being written and is left for the next call.
+    """
+    operations, rejected = [], []
+    with open(path, "rb") as fh:
+        fh.seek(offset)
+        for line in fh:
+            if not line.endswith(b"\n"):
+                break
+            offset += len(line)
+            if not line.strip():
+                continue
+            try:
+                operations.append(_parse_log_line(line))
+            except ValueError as exc:
+                rejected.append((line[:200].decode("utf-8", "replace").rstrip(), str(exc)))
+    return operations, rejected, offset
+
+
+def _record_name(record, mapping):
+    """The Name an upsert record is keyed by, or None if it has no usable one."""
+    for key, value in record.items():
+        if mapping.get(key, key) == "Name":
+            return value if isinstance(value, str) else None
+    return None
+
+
+def log_batches(operations, field_map=None):
+    """Splits logged operations into (upserts, deletes) batches that keep the log's order.
+
+    One batch can apply its upserts and deletes together as long as no Name is
+    both upserted and deleted in it, so a new batch starts at the first
+    operation that would mix the two for one Name.
+    """
+    mapping = {**DEFAULT_FIELD_MAP, **(field_map or {})}
+    upserts, deletes, upserted, deleted = [], [], set(), set()
+    for kind, value in operations:
+        name = _record_name(value, mapping) if kind == "upsert" else value
+        if name in (deleted if kind == "upsert" else upserted):
+            yield upserts, deletes
+            upserts, deletes, upserted, deleted = [], [], set(), set()
+        if kind == "upsert":
+            upserts.append(value)
+            upserted.add(name)
+        else:
+            deletes.append(value)
+            deleted.add(name)
+    if upserts or deletes:
+        yield upserts, deletes
+
+
+class SnapshotStore:
+    """Publishes catalog versions; only the latest is held strongly.
+
+    Sessions pin a snapshot by keeping a reference to it (e.g. in session
+    state) for the duration of a rerun and pick up `current` on the next one.
+    `freeze(frame)` makes each published catalog read-only; the default copies
+    it into read-only buffers, shared_catalog.SharedCatalogs.freeze moves it
+    into shared memory instead.
+    """
+
+    def __init__(self, catalog, field_map=None, freeze=freeze_frame):
+        self.field_map = field_map
+        self.freeze = freeze
+        self._lock = threading.RLock()
+        self._alive = weakref.WeakValueDictionary()
+        self._log_offsets = {}
+        self.rejected = deque(maxlen=MAX_REJECTED)  # (log path, entry, error) of skipped update-log entries
+        self.rejected_count = 0
+        self._current = None
+        self._publish(catalog)
+
+    @property
+    def current(self):
+        return self._current
+
+    def get(self, version):
+        """A still-referenced snapshot by version, or None once it was reclaimed."""
+        return self._alive.get(version)
+
+    def live_versions(self):
+        return sorted(self._alive.keys())
+
+    def _publish(self, catalog, **changes):
+        version = 0 if self._current is None else self._current.version + 1
+        snapshot = Snapshot(version, self.freeze(catalog), **changes)
+        self._alive[version] = snapshot
+        self._current = snapshot
+        return snapshot
+
+    def update(self, upserts=(), deletes=()):
+        """Applies upserts/deletes to the latest snapshot and publishes the result."""
+        upserts, deletes = list(upserts), list(deletes)
+        with self._lock:
+            if not upserts and not deletes:
+                return self._current
+            catalog = apply_updates(self._current.catalog, upserts, deletes, self.field_map)
+            return self._publish(catalog, upserted=len(upserts), deleted=len(deletes))
+
+    def apply_log(self, path):
+        """Applies whatever was appended to an update log since the last call.
+
+        A cheap stat when nothing changed, so it can run on every rerun.
+        Entries that cannot be applied are skipped and recorded in `rejected`,
+        so one bad line never stops the log or the snapshot being served.
+        """
+        path = os.path.abspath(path)
+        if not os.path.exists(path) or os.path.getsize(path) <= self._log_offsets.get(path, 0):
+            return self._current
+        with self._lock:
+            operations, rejected, offset = read_update_log(path, self._log_offsets.get(path, 0))
+            self._log_offsets[path] = offset
+            snapshot = self._current
+            for upserts, deletes in log_batches(operations, self.field_map):
+                snapshot = self._apply_batch(upserts, deletes, rejected)
+            self.rejected.extend((path, entry, error) for entry, error in rejected)
+            self.rejected_count += len(rejected)
+            return snapshot
+
+    def _apply_batch(self, upserts, deletes, rejected):
+        """update() for one log batch; upserts that cannot be applied go to `rejected`."""
+        try:
+            return self.update(upserts, deletes)
+        except (ValueError, KeyError, TypeError):
+            pass
+        # Check the upserts one by one, each with the accepted ones for its Name, and apply the valid ones
+        mapping = {**DEFAULT_FIELD_MAP, **(self.field_map or {})}
+        accepted, valid = {}, []
+        for record in upserts:
+            name = _record_name(record, mapping)
+            try:
+                derive_rows(accepted.get(name, []) + [record], self._current.catalog, self.field_map)
+            except (ValueError, KeyError, TypeError) as exc:
+                rejected.append((record, str(exc)))
+            else:
+                accepted.setdefault(name, []).append(record)
+                valid.append(record)
+        return self.update(valid, deletes)
@@ -0,0 +1,98 @@
+"""Synthetic catalog generator for scale testing.
+
+    python synthetic.py 1000000 --seed 7 --output feed_1m.parquet
+
+Rows are drawn from the built-in LAPTOP_DATA_INR listings, so every brand, OS,
+utility, CPU string and GPU string seen in the real data appears with roughly
+its real frequency, and the CPU/GPU/VRAM combinations stay consistent. Price,
+spec score, RAM, storage and screen size are then jittered so the numeric
+columns are not just copies. The same seed always produces the same catalog.
+generate_price_history adds a day-by-day price walk for a built catalog.
+"""
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from laptop_data import LAPTOP_DATA_INR
+
+RAM_CHOICES = np.array([8, 16, 24, 32, 64])
+STORAGE_CHOICES = np.array([256, 512, 1024, 2048])
+SCREEN_CHOICES = np.array([13.3, 14.0, 15.3, 15.6, 16.0, 17.3, 18.0])
+
+
+def generate_catalog(n_rows, seed=0, templates=None):
+    """Returns a DataFrame of `n_rows` synthetic listings using the raw source field names."""
+    rng = np.random.default_rng(seed)
+    base = pd.DataFrame(templates if templates is not None else LAPTOP_DATA_INR)
+    picks = rng.integers(0, len(base), size=n_rows)
+    frame = base.iloc[picks].reset_index(drop=True)
+
+    # Keep the template's CPU/GPU pairing but vary the numeric specs around it
+    price = frame["price_inr"].to_numpy() * rng.lognormal(0.0, 0.15, n_rows)
+    frame["price_inr"] = (np.round(price / 10) * 10 - 10).astype(np.int64).clip(15_000)
+    frame["spec_score"] = (frame["spec_score"].to_numpy() + rng.integers(-5, 6, n_rows)).clip(20, 99)
+
+    # ~20% of listings are other configurations of the same model
+    reconfigured = rng.random(n_rows) < 0.2
+    frame.loc[reconfigured, "ram_gb"] = rng.choice(RAM_CHOICES, reconfigured.sum())
+    frame.loc[reconfigured, "storage_gb"] = rng.choice(STORAGE_CHOICES, reconfigured.sum())
+    resized = rng.random(n_rows) < 0.05
+    frame.loc[resized, "screen_size_in"] = rng.choice(SCREEN_CHOICES, resized.sum())
+
+    frame["name"] = frame["name"] + " #" + pd.Series(np.arange(n_rows)).astype(str)
+    return frame
+
+
+def generate_price_history(catalog, days=90, seed=0, end=None, change_rate=0.1):
+    """Returns (name, timestamp, price) observations for a Name-indexed catalog.
+
+    Each laptop gets a first observation `days` ago and then changes price on
+    about `change_rate` of the days by a few percent either way. The walk is
+    built backwards from the catalog price, so the latest observation matches
+    it. Timestamps are epoch seconds, one day apart, ending at `end` (default: now).
+    """
+    rng = np.random.default_rng(seed)
+    end = int(time.time()) if end is None else int(end)
+    n_rows = len(catalog)
+    steps = np.where(rng.random((n_rows, days)) < change_rate, rng.lognormal(0.0, 0.06, (n_rows, days)), 1.0)
+    steps[:, 0] = 1.0
+    # Price on day d is today's price divided by the steps after it
+    after = np.cumprod(steps[:, ::-1], axis=1)[:, ::-1]
+    prices = catalog["Price (Rs)"].to_numpy(dtype=np.float64)[:, None] / np.concatenate(
+        [after[:, 1:], np.ones((n_rows, 1))], axis=1
+    )
+    prices = (np.round(prices / 10) * 10).astype(np.int64)
+
+    # Keep the first day and every day the price actually moved
+    changed = np.ones((n_rows, days), dtype=bool)
+    changed[:, 1:] = prices[:, 1:] != prices[:, :-1]
+    rows, day = np.nonzero(changed)
+    return pd.DataFrame({
+        "name": np.asarray(catalog.index, dtype=object)[rows],
+        "timestamp": end - (days - 1 - day) * 86_400,
+        "price": prices[rows, day],
+    })
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate a synthetic laptop catalog feed.")
+    parser.add_argument("rows", type=int, help="number of listings")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", required=True, help="output .csv, .jsonl or .parquet file")
+    args = parser.parse_args(argv)
+
+    frame = generate_catalog(args.rows, args.seed)
+    if args.output.endswith(".parquet"):
+        frame.to_parquet(args.output, index=False)
+    elif args.output.endswith((".jsonl", ".ndjson")):
+        frame.to_json(args.output, orient="records", lines=True, force_ascii=False)
+    else:
+        frame.to_csv(args.output, index=False)
+    print(f"Wrote {len(frame):,} listings to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
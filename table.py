@@ -0,0 +1,79 @@
+"""Server-side sorting and paging for the results table."""
+import numpy as np
+
+# Label -> sort keys as (column, ascending) pairs, applied left to right
+SORT_OPTIONS = {
+    "Spec Score (high → low), then Price": (("Spec Score", False), ("Price (Rs)", True)),
+    "Price (low → high)": (("Price (Rs)", True), ("Spec Score", False)),
+    "Price (high → low)": (("Price (Rs)", False), ("Spec Score", False)),
+    "RAM (high → low)": (("RAM (GB)", False), ("Price (Rs)", True)),
+    "GPU VRAM (high → low)": (("GPU VRAM (GB)", False), ("Price (Rs)", True)),
+    "Screen (large → small)": (("Screen (in)", False), ("Price (Rs)", True)),
+}
+DEFAULT_SORT = "Spec Score (high → low), then Price"
+PAGE_SIZES = [25, 50, 100, 250]
+
+
+class SortIndex:
+    """Catalog-wide sort permutations, computed once per sort key and reused for every filter.
+
+    Each permutation is stored as a rank per row, so ordering a filtered result
+    only sorts its own k positions by rank instead of re-sorting the frame.
+    """
+
+    def __init__(self, frame):
+        self.frame = frame
+        self.ranks = {}
+
+    def rank(self, sort_keys):
+        sort_keys = tuple(sort_keys)
+        if sort_keys not in self.ranks:
+            # np.lexsort treats the last key as primary; descending keys are negated
+            keys = []
+            for column, ascending in reversed(sort_keys):
+                values = self.frame[column].to_numpy().astype(np.float64)
+                keys.append(values if ascending else -values)
+            order = np.lexsort(keys)
+            rank = np.empty(len(order), dtype=np.int64)
+            rank[order] = np.arange(len(order))
+            self.ranks[sort_keys] = rank
+        return self.ranks[sort_keys]
+
+    def sort(self, positions, sort_keys):
+        """Returns the row positions reordered by the given sort keys."""
+        positions = np.asarray(positions)
+        return positions[np.argsort(self.rank(sort_keys)[positions], kind="stable")]
+
+
+def _descending_key(scores, tie_rank):
+    """One int64 per row that sorts by descending score, then ascending tie rank (NaN scores last)."""
+    scores = np.nan_to_num(np.asarray(scores, dtype=np.float32), nan=-np.inf)
+    bits = scores.view(np.int32).astype(np.int64)
+    # IEEE-754 bit patterns order like the floats once negative values are flipped
+    ordered = np.where(bits < 0, bits ^ 0x7FFFFFFF, bits)
+    return (-ordered << 32) | np.asarray(tie_rank, dtype=np.int64)
+
+
+def ranked(positions, scores, tie_rank=None, limit=None):
+    """Positions by descending score for per-session scores (relevance, custom scores).
+
+    Ties go by `tie_rank` (e.g. a SortIndex rank per position), else keep their
+    order. With `limit`, only the first `limit` positions are ranked, by partial
+    selection: enough for the pages up to the current one.
+    """
+    positions = np.asarray(positions)
+    key = _descending_key(scores, np.arange(len(positions)) if tie_rank is None else tie_rank)
+    if limit is not None and 0 < limit < len(key):
+        top = np.argpartition(key, limit - 1)[:limit]
+        return positions[top[np.argsort(key[top])]]
+    return positions[np.argsort(key)]
+
+
+def page_count(n_rows, page_size):
+    return max(1, -(-n_rows // page_size))
+
+
+def page_window(positions, page, page_size):
+    """Returns the slice of (already sorted) positions shown on a 1-based page."""
+    start = (page - 1) * page_size
+    return positions[start:start + page_size]
@@ -0,0 +1,217 @@
+"""CPU/GPU taxonomy: parses free-text processor and graphics strings into structured fields.
+
+Parsing is vectorized over the *distinct* strings of a column: a catalog with
+millions of rows typically carries a few hundred CPU/GPU names, so each compiled
+pattern runs once per distinct name and the result is broadcast back to every
+row with a single integer take.
+"""
+import re
+from collections import namedtuple
+
+import numpy as np
+import pandas as pd
+
+# A pattern table entry. `regex` may define the named groups tier, gen, sku and
+# suffix (CPU) or series, gen and model (GPU); constant fields fill in what the
+# regex cannot capture. `generation` is a label template where "{gen}" is
+# replaced by the captured group. The first matching entry wins.
+Pattern = namedtuple("Pattern", ["vendor", "family", "regex", "tier", "generation"], defaults=(None, None))
+
+# -----------------------------------------------------------
+# CPU pattern table
+# -----------------------------------------------------------
+CPU_PATTERNS = [
+    # Intel Core Ultra 5 125U / Core Ultra 7 Series 1 155H / Core Ultra 5 226V
+    Pattern("Intel", "Core Ultra",
+            r"Core\s+Ultra\s+(?P<tier>[3579])(?:\s+Series\s+\d)?\s+(?P<sku>(?P<gen>[1-9])\d{2})(?P<suffix>(?:[A-Z]{1,2}\d?)?)\b",
+            generation="Series {gen}"),
+    # Intel Core i3 N305 (N-series, no generation prefix)
+    Pattern("Intel", "Core i", r"Core\s+i(?P<tier>[3579])\s+(?P<suffix>N)(?P<sku>\d{3})\b", generation="N-series"),
+    # Intel Core i7 13620H / i7 1255U / i5 14450HX
+    Pattern("Intel", "Core i",
+            r"Core\s+i(?P<tier>[3579])[\s-]+(?P<sku>(?P<gen>1\d|[4-9])\d{2,3})(?P<suffix>(?:[A-Z]{1,2}\d?)?)\b",
+            generation="{gen}th Gen"),
+    # Intel Core 5 210H / Core 7 150U (Core "Series 1/2" without Ultra)
+    Pattern("Intel", "Core", r"Core\s+(?P<tier>[3579])\s+(?P<sku>(?P<gen>[1-9])\d{2})(?P<suffix>(?:[A-Z]{1,2}\d?)?)\b",
+            generation="Series {gen}"),
+    Pattern("Intel", "Celeron", r"Celeron", tier=1),
+    Pattern("Intel", "Pentium", r"Pentium", tier=1),
+    # AMD Ryzen AI 9 HX 370 / Ryzen AI 7 350
+    Pattern("AMD", "Ryzen AI",
+            r"Ryzen\s+AI\s+(?P<tier>[3579])\s+(?:(?P<suffix>HX|H)\s+)?(?P<sku>(?P<gen>\d)\d{2})\b",
+            generation="Ryzen AI {gen}00"),
+    # AMD Ryzen 7 7435HS / Ryzen 5 5600H / Ryzen 7 4800H
+    Pattern("AMD", "Ryzen", r"Ryzen\s+(?P<tier>[3579])\s+(?:PRO\s+)?(?P<sku>(?P<gen>\d)\d{3})(?P<suffix>(?:[A-Z]{1,2}\d?)?)\b",
+            generation="Ryzen {gen}000"),
+    Pattern("AMD", "Athlon", r"Athlon", tier=1),
+    # Apple M1 .. M4 (Pro/Max/Ultra variants rank higher than the base chip)
+    Pattern("Apple", "Apple M Max", r"Apple\s+M(?P<gen>\d)\s+(?:Max|Ultra)\b", tier=9, generation="M{gen}"),
+    Pattern("Apple", "Apple M Pro", r"Apple\s+M(?P<gen>\d)\s+Pro\b", tier=7, generation="M{gen}"),
+    Pattern("Apple", "Apple M", r"Apple\s+M(?P<gen>\d)\b", tier=5, generation="M{gen}"),
+    # Qualcomm Snapdragon X Elite / X Plus
+    Pattern("Qualcomm", "Snapdragon X Elite", r"Snapdragon\s+X\s*Elite", tier=7, generation="X"),
+    Pattern("Qualcomm", "Snapdragon X Plus", r"Snapdragon\s+X\s*Plus", tier=5, generation="X"),
+    Pattern("Qualcomm", "Snapdragon", r"Snapdragon"),
+    # Huawei Kirin X90
+    Pattern("Huawei", "Kirin", r"Kirin\s+(?P<sku>\w+)"),
+    Pattern("MediaTek", "Kompanio", r"MediaTek|Kompanio"),
+    # Vendor-only fallbacks for strings that name a brand but no known family
+    Pattern("Intel", "Other", r"Intel|Core"),
+    Pattern("AMD", "Other", r"AMD|Ryzen"),
+    Pattern("Apple", "Other", r"Apple"),
+]
+
+# -----------------------------------------------------------
+# GPU pattern table
+# -----------------------------------------------------------
+GPU_PATTERNS = [
+    # NVIDIA GeForce RTX 4060 / GTX 1660 Ti / RTX 3050 A / RTX 3050A / MX 550
+    Pattern("NVIDIA", "GeForce", r"(?P<series>RTX|GTX|MX)\s*(?P<model>(?P<gen>\d\d?)\d\d(?:\s*(?:Ti|A)\b)?)"),
+    Pattern("NVIDIA", "Quadro", r"Quadro\s+(?P<model>[A-Z]*\d+)"),
+    Pattern("NVIDIA", "RTX Ada/A", r"RTX\s+(?P<model>A?\d{3,4})\s*(?:Ada)?"),
+    # AMD Radeon RX 6500M (discrete) / Radeon 780M, 680M (integrated)
+    Pattern("AMD", "Radeon RX", r"Radeon\s+RX\s*(?P<model>\d{4}[A-Z]*)"),
+    Pattern("AMD", "Radeon", r"Radeon\s+(?P<model>\d{3}M)"),
+    Pattern("AMD", "Radeon", r"Radeon|AMD"),
+    # Intel Arc / Iris Xe (incl. the "Iris X" typo) / UHD / generic
+    Pattern("Intel", "Arc", r"\bArc\b"),
+    Pattern("Intel", "Iris Xe", r"Iris\s*Xe?\b"),
+    Pattern("Intel", "UHD", r"\bUHD\b"),
+    Pattern("Intel", "Intel Graphics", r"Intel"),
+    # Apple "8 Core GPU" / "10-Core GPU"
+    Pattern("Apple", "Apple GPU", r"Apple|\d+[\s-]*Core\s+GPU"),
+    Pattern("Qualcomm", "Adreno", r"Adreno"),
+]
+
+CPU_FIELDS = ["CPU Vendor", "CPU Family", "CPU Tier", "CPU Generation", "CPU Suffix"]
+GPU_FIELDS = ["GPU Vendor", "GPU Series", "GPU Model"]
+
+UNKNOWN = "Other"
+
+
+def _compile(patterns):
+    # The outer "hit" group lets a single str.extract both test and capture
+    return [p._replace(regex=re.compile(f"(?P<hit>{p.regex})", re.IGNORECASE)) for p in patterns]
+
+
+def _match_table(uniques, patterns):
+    """Runs a pattern table over distinct strings.
+
+    Returns (pattern_ids, groups): for every distinct string the index of the first
+    matching pattern (-1 if none) and a frame of the captured named groups.
+    """
+    pattern_ids = np.full(len(uniques), -1, dtype=np.int16)
+    groups = pd.DataFrame(index=uniques.index, columns=["tier", "gen", "sku", "suffix", "series", "model"], dtype=object)
+    remaining = pd.Series(True, index=uniques.index)
+    for pid, pattern in enumerate(patterns):
+        candidates = uniques[remaining]
+        if candidates.empty:
+            break
+        extracted = candidates.str.extract(pattern.regex)
+        extracted = extracted[extracted["hit"].notna()].drop(columns="hit")
+        if not len(extracted):
+            continue
+        pattern_ids[extracted.index] = pid
+        remaining[extracted.index] = False
+        if len(extracted.columns):
+            groups.loc[extracted.index, extracted.columns] = extracted.to_numpy()
+    return pattern_ids, groups
+
+
+def _broadcast(values, codes, categorical=True):
+    """Expands per-distinct-string values back to one value per row."""
+    if categorical:
+        per_unique = pd.Categorical(values)
+        row_codes = np.where(codes >= 0, per_unique.codes[codes], -1)
+        return pd.Categorical.from_codes(row_codes, per_unique.categories)
+    return np.where(codes >= 0, np.asarray(values)[codes], 0)
+
+
+def _label(patterns, pattern_ids, attribute, default=UNKNOWN):
+    table = np.array([getattr(p, attribute) for p in patterns] + [default], dtype=object)
+    return table[pattern_ids]  # pattern id -1 picks the trailing default
+
+
+def _generation_labels(patterns, pattern_ids, gen):
+    labels = np.full(len(pattern_ids), UNKNOWN, dtype=object)
+    for pid, pattern in enumerate(patterns):
+        if pattern.generation is None:
+            continue
+        rows = (pattern_ids == pid)
+        if "{gen}" in pattern.generation:
+            rows &= gen.notna().to_numpy()
+            prefix, suffix = pattern.generation.split("{gen}")
+            labels[rows] = (prefix + gen[rows].astype(str) + suffix).to_numpy()
+        else:
+            labels[rows] = pattern.generation
+    return labels
+
+
+COMPILED_CPU_PATTERNS = _compile(CPU_PATTERNS)
+COMPILED_GPU_PATTERNS = _compile(GPU_PATTERNS)
+
+
+def _legacy_cpu_models(vendor, family, tier):
+    """Derives the original 'Intel CPU Model' / 'AMD CPU Model' labels from parsed fields."""
+    tier = tier.astype(str).astype(object)
+    intel = np.where(vendor == "Intel", "Other", "N/A").astype(object)
+    intel = np.where(family == "Core i", "i" + tier, intel)
+    intel = np.where(family == "Core Ultra", "Ultra " + tier, intel)
+
+    amd = np.where(vendor == "AMD", "Other", "N/A").astype(object)
+    amd = np.where(np.isin(family, ["Ryzen", "Ryzen AI"]), "Ryzen " + tier, amd)
+    return intel, amd
+
+
+def parse_cpu(cpu_strings):
+    """Parses a Series of CPU names into vendor/family/tier/generation/suffix columns.
+
+    Returns a frame aligned with the input: CPU Tier is an int8 (3/5/7/9, 1 for
+    entry-level parts, 0 when unknown); the other fields, plus the original
+    'Intel CPU Model' / 'AMD CPU Model' labels, are categoricals.
+    """
+    codes, uniques = pd.factorize(cpu_strings)
+    uniques = pd.Series(uniques, dtype=object).str.strip()
+    pattern_ids, groups = _match_table(uniques, COMPILED_CPU_PATTERNS)
+
+    const_tier = _label(COMPILED_CPU_PATTERNS, pattern_ids, "tier", default=0)
+    captured_tier = pd.to_numeric(groups["tier"], errors="coerce").to_numpy()
+    tier = np.where(np.isnan(captured_tier), pd.to_numeric(pd.Series(const_tier), errors="coerce").fillna(0), captured_tier)
+
+    tier = tier.astype(np.int8)
+    vendor = _label(COMPILED_CPU_PATTERNS, pattern_ids, "vendor")
+    family = _label(COMPILED_CPU_PATTERNS, pattern_ids, "family")
+    suffix = groups["suffix"].str.upper().replace("", np.nan).fillna("None").to_numpy()
+    intel_model, amd_model = _legacy_cpu_models(vendor, family, tier)
+    return pd.DataFrame({
+        "CPU Vendor": _broadcast(vendor, codes),
+        "CPU Family": _broadcast(family, codes),
+        "CPU Tier": _broadcast(tier, codes, categorical=False).astype(np.int8),
+        "CPU Generation": _broadcast(_generation_labels(COMPILED_CPU_PATTERNS, pattern_ids, groups["gen"]), codes),
+        "CPU Suffix": _broadcast(suffix, codes),
+        "Intel CPU Model": _broadcast(intel_model, codes),
+        "AMD CPU Model": _broadcast(amd_model, codes),
+    }, index=cpu_strings.index)
+
+
+def parse_gpu(gpu_strings):
+    """Parses a Series of GPU names into vendor/series/model categorical columns."""
+    codes, uniques = pd.factorize(gpu_strings)
+    uniques = pd.Series(uniques, dtype=object).str.strip()
+    pattern_ids, groups = _match_table(uniques, COMPILED_GPU_PATTERNS)
+
+    family = pd.Series(_label(COMPILED_GPU_PATTERNS, pattern_ids, "family"), index=uniques.index)
+    # GeForce parts are grouped by product line, e.g. "RTX 40xx", "GTX 16xx"
+    geforce = groups["series"].notna() & groups["gen"].notna()
+    # Groups that never matched come back as all-NaN object columns, so cast before joining
+    series = family.where(~geforce, groups["series"].astype(str).str.upper() + " " + groups["gen"].astype(str) + "xx")
+    # "RTX 3050A" and "RTX 3050 A" are the same part
+    model = groups["model"].astype("str").str.replace(r"(\d)\s*(Ti|A)$", r"\1 \2", regex=True)
+    model = (groups["series"].fillna("").astype(str).str.upper() + " " + model).str.strip()
+    model = model.where(groups["model"].notna(), "None")
+
+    return pd.DataFrame({
+        "GPU Vendor": _broadcast(_label(COMPILED_GPU_PATTERNS, pattern_ids, "vendor"), codes),
+        "GPU Series": _broadcast(series.to_numpy(dtype=object), codes),
+        "GPU Model": _broadcast(model.to_numpy(dtype=object), codes),
+    }, index=gpu_strings.index)
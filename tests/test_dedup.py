@@ -0,0 +1,126 @@
+"""Canonical IDs: exact-key and near-duplicate merges, and incremental extension."""
+import numpy as np
+import pandas as pd
+import pytest
+
+from catalog import build_catalog
+from dedup import (
+    CANONICAL_ID_COL, MERGE_THRESHOLD, canonical_ids, distinct_positions, extend_canonical_ids, match_keys,
+    sketch_similarity, trigram_sketches,
+)
+
+LISTINGS = [
+    # name, brand, CPU, price
+    ("HP Victus 15", "HP", "12th Gen Intel Core i5 12450H", 61_990),
+    ("Victus\u200e 15", "HP", "Core i5 12450H", 59_990),
+    ("victus-15", "HP", "Intel Core i5 12450H Processor", 60_990),
+    ("Victus 15", "HP", "Core i7 13620H", 74_990),
+    ("Victus 15", "Lenovo", "Core i5 12450H", 58_990),
+    ("ROG Zephyrus G14 GA403UV-QS171WS", "Asus", "Ryzen 9 8945HS", 199_990),
+    ("ROG Zephyrus G14 GA403UV QS171W", "Asus", "Ryzen 9 8945HS", 189_990),
+    ("ROG Zephyrus G16 GU605MV-QR135WS", "Asus", "Ryzen 9 8945HS", 209_990),
+    ("Pavilion 15", "HP", "Core i5 12450H", 55_990),
+]
+
+
+def listings(rows=LISTINGS):
+    names, brands, cpus, prices = zip(*rows)
+    return pd.DataFrame(
+        {"Brand": brands, "CPU Full Model": cpus, "Price (Rs)": prices}, index=pd.Index(names, name="Name")
+    )
+
+
+def same_clusters(a, b):
+    """Whether two ID arrays group rows the same way, whatever the labels."""
+    return (pd.factorize(np.asarray(a))[0] == pd.factorize(np.asarray(b))[0]).all()
+
+
+def trigram_jaccard(a, b):
+    grams = [{f" {s} "[i:i + 3] for i in range(len(s))} for s in (a, b)]
+    return len(grams[0] & grams[1]) / len(grams[0] | grams[1])
+
+
+def test_exact_keys_merge_within_brand_and_cpu():
+    ids = canonical_ids(listings())
+    # Brand prefix, invisible characters, case, punctuation and CPU wording do not matter
+    assert ids[0] == ids[1] == ids[2]
+    # Another CPU, another brand or another name is another laptop
+    assert len({ids[0], ids[3], ids[4], ids[8]}) == 4
+    assert ids.dtype == np.int32 and ids[0] == 0
+
+
+def test_near_duplicates_merge_by_sketch_similarity():
+    frame = listings()
+    ids = canonical_ids(frame)
+    assert ids[5] == ids[6]
+    assert ids[7] != ids[5]
+    keys = match_keys(frame.index, frame["Brand"])
+    sketches = trigram_sketches(keys)
+    assert sketch_similarity(sketches, [5], [6])[0] >= MERGE_THRESHOLD > sketch_similarity(sketches, [5], [7])[0]
+
+
+def test_sketch_similarity_estimates_trigram_jaccard():
+    keys = match_keys(listings().index, listings()["Brand"]).tolist()
+    left, right = np.triu_indices(len(keys), 1)
+    estimated = sketch_similarity(trigram_sketches(keys), left, right)
+    exact = np.array([trigram_jaccard(keys[i], keys[j]) for i, j in zip(left, right)])
+    # Only hash collisions in the 512-bit sketch separate the estimate from the exact value
+    np.testing.assert_allclose(estimated, exact, atol=0.05)
+    assert (sketch_similarity(trigram_sketches(["same", "same"]), [0], [1]) == 1.0).all()
+
+
+def test_extend_keeps_ids_and_merges_new_rows():
+    base = listings(LISTINGS[:-1])
+    base[CANONICAL_ID_COL] = canonical_ids(base)
+    added = listings([
+        ("HP VICTUS 15", "HP", "Core i5 12450H", 57_990),  # a duplicate of rows 0-2
+        ("Omen 16", "HP", "Core i7 13620H", 139_990),  # new
+        ("Pavilion 15", "HP", "Core i5 12450H", 55_990),  # new
+    ])
+    added[CANONICAL_ID_COL] = -1
+    frame = pd.concat([base, added])
+    new_rows = np.arange(len(base), len(frame))
+    ids = extend_canonical_ids(frame, new_rows)
+
+    np.testing.assert_array_equal(ids[:len(base)], base[CANONICAL_ID_COL])
+    assert ids[len(base)] == base[CANONICAL_ID_COL].iloc[0]
+    top = base[CANONICAL_ID_COL].max()
+    assert sorted(ids[len(base) + 1:]) == [top + 1, top + 2]
+    # The same clusters as scoring the whole catalog again
+    assert same_clusters(ids, canonical_ids(frame))
+
+
+def test_replaced_row_keeps_its_id():
+    frame = listings()
+    frame[CANONICAL_ID_COL] = canonical_ids(frame)
+    previous = frame[CANONICAL_ID_COL].iloc[3]
+    frame = frame.iloc[[i for i in range(len(frame)) if i != 3] + [3]]
+    ids = extend_canonical_ids(frame, [len(frame) - 1])
+    assert ids[-1] == previous
+    assert same_clusters(ids, canonical_ids(frame))
+
+
+def test_extend_matches_full_rescoring_on_the_catalog():
+    catalog = build_catalog(None)
+    rng = np.random.default_rng(0)
+    new_rows = np.sort(rng.choice(len(catalog), 15, replace=False))
+    frame = catalog.copy()
+    frame[CANONICAL_ID_COL] = frame[CANONICAL_ID_COL].astype(np.int64)
+    frame.iloc[new_rows, frame.columns.get_loc(CANONICAL_ID_COL)] = -1
+    assert same_clusters(extend_canonical_ids(frame, new_rows), catalog[CANONICAL_ID_COL])
+
+
+@pytest.mark.parametrize("positions", [[0, 1, 2, 3, 4, 5, 6, 7, 8], [8, 6, 2, 0, 5], [], [3]])
+def test_distinct_positions_keep_the_cheapest_listing(positions):
+    frame = listings()
+    frame[CANONICAL_ID_COL] = canonical_ids(frame)
+    kept = distinct_positions(frame, np.array(positions, dtype=np.int64))
+    ids = frame[CANONICAL_ID_COL].to_numpy()
+    prices = frame["Price (Rs)"].to_numpy()
+    # First cheapest position per ID
+    cheapest = {}
+    for p in positions:
+        if ids[p] not in cheapest or prices[p] < prices[cheapest[ids[p]]]:
+            cheapest[ids[p]] = p
+    expected = [p for p in positions if cheapest[ids[p]] == p]
+    assert kept.tolist() == expected
@@ -0,0 +1,58 @@
+"""Facet counts must equal the match count of selecting just that option."""
+from dataclasses import replace
+
+import numpy as np
+import pytest
+
+from catalog import build_catalog
+from filter_index import FilterIndex, PredicateCache
+from query import FACET_COLUMNS, GPU_TYPES, FilterSpec, facet_counts, select_positions
+from synthetic import generate_catalog
+
+
+@pytest.fixture(scope="module", params=["builtin", "synthetic"])
+def catalog(request):
+    return build_catalog(None if request.param == "builtin" else generate_catalog(5_000, seed=1))
+
+
+def assert_counts_match(catalog, index, spec, within=None, predicate_cache=None):
+    counts = facet_counts(index, spec, predicate_cache, within=within)
+    for field, _ in FACET_COLUMNS:
+        for option, count in counts[field].items():
+            positions = select_positions(index, replace(spec, **{field: (option,)}))
+            if within is not None:
+                positions = np.intersect1d(positions, within)
+            assert count == len(positions), (spec, field, option)
+
+
+def test_gpu_type_counts_apply_min_vram_to_dedicated_only(catalog):
+    index = FilterIndex(catalog)
+    for gpu_types in [GPU_TYPES, ("Dedicated",), ("Integrated",), ()]:
+        spec = FilterSpec(gpu_types=gpu_types, min_vram=6)
+        assert_counts_match(catalog, index, spec)
+        counts = facet_counts(index, spec)["gpu_types"]
+        assert counts["Integrated"] == int((catalog["GPU Dedicated"] == "Integrated").sum())
+
+
+def test_counts_match_selection_for_random_specs(catalog):
+    index = FilterIndex(catalog)
+    predicate_cache = PredicateCache()
+    rng = np.random.default_rng(0)
+    options = {field: sorted(catalog[column].unique()) for field, column in FACET_COLUMNS}
+    vram = [0] + sorted(catalog.loc[catalog["GPU VRAM (GB)"] > 0, "GPU VRAM (GB)"].unique())
+    prices = catalog["Price (Rs)"].to_numpy()
+    for _ in range(60):
+        chosen = {
+            field: tuple(rng.choice(values, rng.integers(0, len(values) + 1), replace=False).tolist())
+            for field, values in options.items() if rng.random() < 0.5
+        }
+        low, high = sorted(rng.choice(prices, 2).tolist())
+        spec = FilterSpec(
+            min_price=low if rng.random() < 0.5 else None,
+            max_price=high if rng.random() < 0.5 else None,
+            min_ram=int(rng.choice([0, 8, 16, 32])),
+            min_vram=int(rng.choice(vram)),
+            **chosen,
+        )
+        within = np.sort(rng.choice(len(catalog), len(catalog) // 2, replace=False)) if rng.random() < 0.3 else None
+        assert_counts_match(catalog, index, spec, within, predicate_cache)
@@ -0,0 +1,97 @@
+"""Feed ingestion: conflict policies, and spawned workers giving the serial result."""
+import numpy as np
+import pandas as pd
+import pytest
+
+from catalog import DISPLAY_COLUMNS
+from ingest import ingest_feeds, resolve_conflicts
+
+
+def listing(name, price, score=60):
+    return {
+        "Name": name, "Brand": name.split()[0], "OS": "Windows 11", "Utility": "Gaming", "Price (Rs)": price,
+        "Spec Score": score, "CPU Full Model": "Intel Core i5 12450H", "RAM (GB)": 16, "Storage (GB)": 512,
+        "GPU Type": "NVIDIA RTX 4050", "GPU VRAM (GB)": 6, "Screen (in)": 15.6,
+    }
+
+
+FEEDS = {
+    "amazon.csv": [
+        listing("HP Victus 15", 61_990),
+        listing("HP Victus 15", 64_990),  # a second listing of the name in the same feed
+        listing("Acer Nitro V", 72_990),
+        listing("Dell G15", 79_990),
+        listing("Asus TUF A15", None),  # no price
+    ],
+    "flipkart.csv": [
+        listing("HP Victus 15", 60_990),
+        listing("Acer Nitro V", 72_990),
+        listing("Lenovo LOQ 15", 69_990),
+    ],
+    "croma.csv": [
+        listing("Dell G15", 74_990),
+        listing("Lenovo LOQ 15", 71_990, score=None),  # no spec score
+    ],
+}
+
+
+@pytest.fixture
+def feeds(tmp_path):
+    paths = []
+    for name, rows in FEEDS.items():
+        path = tmp_path / name
+        pd.DataFrame(rows, columns=DISPLAY_COLUMNS).to_csv(path, index=False)
+        paths.append(path)
+    return paths
+
+
+@pytest.mark.parametrize("policy, kept", [
+    # Rows: (feed, name, price). Cheapest: Victus from feed 1, Nitro tied (feed 0), G15 from feed 2
+    ("cheapest", [False, False, True, True, False, True, False, True]),
+    ("priority", [True, True, False, True, False, False, True, True]),
+])
+def test_resolve_conflicts(policy, kept):
+    rows = [
+        (0, "Victus", 61_990), (0, "Victus", 64_990), (1, "Victus", 60_990),
+        (0, "Nitro", 72_990), (1, "Nitro", 72_990),
+        (2, "G15", 74_990), (0, "G15", 79_990), (1, "LOQ", 69_990),
+    ]
+    feed, names, prices = map(np.array, zip(*rows))
+    feed = feed.astype(np.int32)
+    np.testing.assert_array_equal(resolve_conflicts(feed, pd.Series(names), prices, policy), kept)
+
+
+def test_resolve_conflicts_edge_cases():
+    assert resolve_conflicts(np.array([], dtype=np.int32), pd.Series([], dtype=str), np.array([])).shape == (0,)
+    with pytest.raises(ValueError, match="Unknown conflict policy"):
+        resolve_conflicts(np.zeros(1, dtype=np.int32), pd.Series(["a"]), np.ones(1), "newest")
+
+
+@pytest.mark.parametrize("policy, prices", [
+    ("cheapest", {"HP Victus 15": [60_990], "Acer Nitro V": [72_990], "Dell G15": [74_990], "Lenovo LOQ 15": [69_990]}),
+    ("priority", {"HP Victus 15": [61_990, 64_990], "Acer Nitro V": [72_990], "Dell G15": [79_990],
+                  "Lenovo LOQ 15": [69_990]}),
+])
+def test_spawned_workers_match_serial_ingestion(feeds, policy, prices):
+    serial, serial_report = ingest_feeds(feeds, workers=1, policy=policy, chunksize=2)
+    parallel, parallel_report = ingest_feeds(feeds, workers=3, policy=policy, chunksize=2)
+    pd.testing.assert_frame_equal(parallel, serial)
+    pd.testing.assert_frame_equal(parallel_report, serial_report)
+
+    assert serial.groupby(level="Name", sort=False)["Price (Rs)"].agg(list).to_dict() == prices
+    report = serial_report.set_index("Feed")
+    assert report["Rows read"].tolist() == [5, 3, 2]
+    assert report["Invalid rows"].tolist() == [1, 0, 1]
+    assert (report["Rows kept"] + report["Lost to conflicts"]).tolist() == [4, 3, 1]
+    assert report["Rows kept"].sum() == len(serial)
+
+
+def test_feed_errors_name_the_feed(feeds, tmp_path):
+    missing = tmp_path / "missing.csv"
+    with pytest.raises(FileNotFoundError, match="missing.csv"):
+        ingest_feeds([feeds[0], missing], workers=1)
+    # A worker's error comes back as a message, prefixed with its feed
+    with pytest.raises(ValueError, match=r"^Feed .*missing\.csv: FileNotFoundError"):
+        ingest_feeds([feeds[0], missing], workers=2)
+    with pytest.raises(ValueError, match="field maps"):
+        ingest_feeds(feeds, field_maps=[None])
@@ -0,0 +1,62 @@
+"""Batched nearest-neighbour lookups must match a brute-force scan."""
+import numpy as np
+import pytest
+
+import neighbors
+from catalog import build_catalog
+from neighbors import KDTree, SimilarityIndex
+from synthetic import generate_catalog
+
+
+def brute_force(points, queries, k):
+    """Squared distances and positions of the k nearest points, ties to the lower position."""
+    dist = ((queries[:, None, :] - points[None]) ** 2).sum(axis=2)
+    ranked = np.lexsort((np.broadcast_to(np.arange(len(points)), dist.shape), dist))[:, :k]
+    return np.take_along_axis(dist, ranked, axis=1), ranked
+
+
+@pytest.mark.parametrize("n", [0, 1, 7, 300, 3_000])
+@pytest.mark.parametrize("k", [1, 5, 20])
+def test_kdtree_matches_brute_force(n, k):
+    rng = np.random.default_rng(n + k)
+    # Few distinct values per column, so there are many exact ties and duplicate points
+    points = rng.integers(0, 5, (n, 3)).astype(float)
+    queries = np.vstack([points[:20], rng.integers(-1, 6, (30, 3)).astype(float)])
+    dist, pos = KDTree(points, leaf_size=8).query(queries, k)
+    expected_dist, expected_pos = brute_force(points, queries, k)
+    found = min(k, n)
+    np.testing.assert_array_equal(dist[:, :found], expected_dist[:, :found])
+    np.testing.assert_array_equal(pos[:, :found], expected_pos[:, :found])
+    assert (pos[:, found:] == -1).all() and np.isinf(dist[:, found:]).all()
+
+
+@pytest.fixture(params=["builtin", "synthetic"])
+def catalog(request):
+    return build_catalog(None if request.param == "builtin" else generate_catalog(20_000, seed=3))
+
+
+@pytest.fixture(params=["installed", "numpy"])
+def tree_backend(request, monkeypatch):
+    if request.param == "numpy":
+        monkeypatch.setattr(neighbors, "cKDTree", None)
+
+
+def test_similarity_index_matches_brute_force(catalog, tree_backend):
+    index = SimilarityIndex(catalog)
+    positions = np.random.default_rng(0).choice(len(catalog), min(len(catalog), 200), replace=False)
+    distances, found = index.query(positions, k=5)
+    assert distances.shape == found.shape == (len(positions), 5)
+    for row, position in enumerate(positions):
+        features = index.features
+        expected = np.sqrt(((features - features[position]) ** 2).sum(axis=1))
+        expected[position] = np.inf
+        assert position not in found[row]
+        np.testing.assert_allclose(distances[row], np.sort(expected)[:5])
+        np.testing.assert_allclose(distances[row], expected[found[row]])
+
+
+def test_small_catalog_pads_missing_neighbours(tree_backend):
+    catalog = build_catalog(None).iloc[:3]
+    distances, found = SimilarityIndex(catalog).query([0, 1, 2], k=4)
+    assert (found[:, 2:] == -1).all() and np.isinf(distances[:, 2:]).all()
+    assert all(sorted(row[:2]) == sorted({0, 1, 2} - {position}) for position, row in enumerate(found))
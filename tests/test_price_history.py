@@ -0,0 +1,28 @@
+"""Appends keep every storable price and skip the rest instead of wrapping them."""
+import numpy as np
+import pytest
+
+from price_history import DAY, PriceHistory, laptop_ids
+
+
+def test_out_of_range_prices_are_skipped(tmp_path):
+    store = PriceHistory(tmp_path / "history")
+    ids = laptop_ids([f"Laptop {i}" for i in range(7)])
+    prices = np.array([61_990, 2**31 - 1, 2**31, 5e12, -500, np.inf, np.nan], dtype=object)
+    with pytest.warns(UserWarning, match="Skipped 5 price observations"):
+        written = store.append(ids, 1_700_000_000, prices)
+    assert written == len(store) == 2
+    np.testing.assert_array_equal(store.price_at(ids, 1_700_000_000), [61_990, 2**31 - 1] + [np.nan] * 5)
+
+
+def test_price_literals_and_numbers_append(tmp_path):
+    store = PriceHistory(tmp_path / "history")
+    ids = laptop_ids(["A", "B", "C"])
+    store.append(ids, 0, ["₹1.25 Lakh", "65,990", "54990"])
+    store.append(ids, DAY, np.array([120_000.4, 64_990.6, 50_000]))
+    assert len(store) == 6
+    np.testing.assert_array_equal(store.price_at(ids, 0), [125_000, 65_990, 54_990])
+    np.testing.assert_array_equal(store.price_at(ids, DAY), [120_000, 64_991, 50_000])
+    low, high = store.price_range(ids, 0, DAY)
+    np.testing.assert_array_equal(low, [120_000, 64_991, 50_000])
+    np.testing.assert_array_equal(high, [125_000, 65_990, 54_990])
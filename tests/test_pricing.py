@@ -0,0 +1,67 @@
+"""Price literals parse to whole rupees; anything that cannot be a price is reported."""
+import numpy as np
+import pandas as pd
+import pytest
+
+from pricing import parse_price, parse_prices
+
+VALID = [
+    ("65,990", 65_990),
+    ("₹65,990", 65_990),
+    ("Rs. 65,990/-", 65_990),
+    ("INR 1,23,456", 123_456),
+    ("54990", 54_990),
+    ("₹1.25 Lakh", 125_000),
+    ("1 lakh", 100_000),
+    ("2.5L", 250_000),
+    ("1.2 Lacs", 120_000),
+    ("₹2 Crore", 20_000_000),
+    ("1.5 cr", 15_000_000),
+    ("75K", 75_000),
+    ("12 thousand", 12_000),
+    ("₹.5 Lakh", 50_000),
+    ("999.5", 1_000),
+    ("0", 0),
+]
+
+INVALID = ["abc", "", "₹", "1 million", "12,34.5.6", "-500", "inf", "-inf", "nan", "1e400", "99999999999999 Crore"]
+
+
+@pytest.mark.parametrize("literal, rupees", VALID)
+def test_parse_price(literal, rupees):
+    assert parse_price(literal) == rupees
+
+
+@pytest.mark.parametrize("literal", INVALID)
+def test_parse_price_rejects(literal):
+    with pytest.raises(ValueError):
+        parse_price(literal)
+
+
+def test_parse_prices_reports_invalid_rows():
+    literals = [literal for literal, _ in VALID] + INVALID + [None]
+    parsed = parse_prices(pd.Series(literals, dtype=object))
+    assert parsed.values.dtype == "Int64"
+    assert parsed.values.iloc[:len(VALID)].tolist() == [rupees for _, rupees in VALID]
+    assert parsed.values.iloc[len(VALID):].isna().all()
+    # A missing price is not an invalid literal
+    assert parsed.invalid.tolist() == INVALID
+
+
+def test_parse_prices_range_follows_dtype():
+    parsed = parse_prices(pd.Series(["2,000,000,000", "3,000,000,000", "21 Crore"]), dtype="int32")
+    assert parsed.values.dtype == "Int32"
+    assert parsed.values.tolist() == [2_000_000_000, pd.NA, 210_000_000]
+    assert parsed.invalid.tolist() == ["3,000,000,000"]
+
+
+def test_parse_prices_numeric_input():
+    parsed = parse_prices(pd.Series([65990.4, -1.0, np.inf, np.nan, 1e30]))
+    assert parsed.values.tolist() == [65990, pd.NA, pd.NA, pd.NA, pd.NA]
+    assert parsed.invalid.tolist() == [-1.0, np.inf, 1e30]
+
+
+def test_sidebar_price_options():
+    # The sidebar's price choices go through parse_price (laptop_app.lakh_to_inr)
+    options = ["₹20,000", "₹75,000", "₹1 Lakh", "₹1.25 Lakh", "₹1.75 Lakh", "₹2 Lakh"]
+    assert [parse_price(o) for o in options] == [20_000, 75_000, 100_000, 125_000, 175_000, 200_000]
@@ -0,0 +1,141 @@
+"""The headless engine must filter exactly like the sidebar's pandas mask."""
+import json
+
+import numpy as np
+import pytest
+
+import query
+from catalog import build_catalog
+from filter_index import FilterIndex
+from query import GPU_TYPES, FilterSpec, read_specs, run_batch, select_positions
+from synthetic import generate_catalog
+
+
+@pytest.fixture(scope="module", params=["builtin", "synthetic"])
+def catalog(request):
+    return build_catalog(None if request.param == "builtin" else generate_catalog(5_000, seed=2))
+
+
+def sidebar_mask(df, spec):
+    """The sidebar's original boolean-mask filter (laptop_app.py before the FilterIndex)."""
+    mask = (
+        (df['Price (Rs)'] >= (spec.min_price if spec.min_price is not None else -np.inf)) &
+        (df['Price (Rs)'] <= (spec.max_price if spec.max_price is not None else np.inf)) &
+        (df['Spec Score'] >= (spec.min_score if spec.min_score is not None else -np.inf)) &
+        (df['Brand'].isin(spec.brands if spec.brands is not None else df['Brand'].unique())) &
+        (df['Utility'].isin(spec.utilities if spec.utilities is not None else df['Utility'].unique())) &
+        (df['RAM (GB)'] >= spec.min_ram) &
+        (df['Storage (GB)'] >= spec.min_storage) &
+        (df['CPU Brand'].isin(spec.cpu_brands if spec.cpu_brands is not None else df['CPU Brand'].unique())) &
+        (df['Screen (in)'] >= spec.screen_min) &
+        (df['Screen (in)'] < spec.screen_max + 0.001)
+    )
+    gpu_types = spec.gpu_types or ()
+    if 'Dedicated' in gpu_types and 'Integrated' not in gpu_types:
+        mask &= df['GPU Dedicated'] == 'Dedicated'
+    elif 'Integrated' in gpu_types and 'Dedicated' not in gpu_types:
+        mask &= df['GPU Dedicated'] == 'Integrated'
+    if 'Dedicated' in gpu_types and spec.min_vram > 0:
+        mask &= df['GPU VRAM (GB)'] >= spec.min_vram
+    return mask.to_numpy()
+
+
+def assert_matches_sidebar(catalog, index, spec):
+    expected = np.flatnonzero(sidebar_mask(catalog, spec))
+    np.testing.assert_array_equal(select_positions(index, spec), expected, err_msg=str(spec))
+
+
+@pytest.mark.parametrize("gpu_types", [GPU_TYPES, ("Dedicated",), ("Integrated",), ()])
+@pytest.mark.parametrize("min_vram", [0, 4, 8])
+def test_gpu_type_and_min_vram(catalog, gpu_types, min_vram):
+    index = FilterIndex(catalog)
+    assert_matches_sidebar(catalog, index, FilterSpec(gpu_types=gpu_types, min_vram=min_vram))
+    assert_matches_sidebar(catalog, index, FilterSpec(gpu_types=gpu_types, min_vram=min_vram, min_ram=16))
+
+
+def test_random_specs_match_sidebar(catalog):
+    index = FilterIndex(catalog)
+    rng = np.random.default_rng(1)
+    options = {field: sorted(catalog[column].unique()) for field, column in query.FACET_COLUMNS}
+    prices = catalog["Price (Rs)"].to_numpy()
+    screens = sorted(catalog["Screen (in)"].unique())
+    matched = 0
+    for _ in range(100):
+        chosen = {
+            field: tuple(rng.choice(values, rng.integers(0, len(values) + 1), replace=False).tolist())
+            for field, values in options.items() if rng.random() < 0.5
+        }
+        low, high = sorted(rng.choice(prices, 2).tolist())
+        screen_min, screen_max = sorted(rng.choice(screens, 2).tolist())
+        spec = FilterSpec(
+            min_price=low if rng.random() < 0.5 else None,
+            max_price=high if rng.random() < 0.5 else None,
+            min_score=int(rng.integers(40, 90)) if rng.random() < 0.3 else None,
+            min_ram=int(rng.choice([0, 8, 16, 32])),
+            min_storage=int(rng.choice([0, 256, 512, 1024])),
+            min_vram=int(rng.choice([0, 4, 6, 8])),
+            screen_min=float(screen_min) if rng.random() < 0.3 else 0.0,
+            screen_max=float(screen_max) if rng.random() < 0.3 else 100.0,
+            **chosen,
+        )
+        assert_matches_sidebar(catalog, index, spec)
+        matched += sidebar_mask(catalog, spec).any()
+        frame = query.query(catalog, spec, index)
+        assert frame.index.tolist() == catalog.index[sidebar_mask(catalog, spec)].tolist()
+    assert matched > 20  # the specs are not all empty
+
+
+def test_read_specs_reports_bad_lines_and_keeps_going():
+    lines = [
+        '{"id": "cheap", "max_price": "₹50,000"}',
+        "",
+        "not json",
+        "[1, 2]",
+        '{"id": "typo", "brandz": ["HP"]}',
+        '{"min_ram": "16"}',
+        '{"brands": ["HP"]}',
+    ]
+    specs = list(read_specs(lines))
+    assert [spec_id for spec_id, _ in specs] == ["cheap", 3, 4, "typo", 6, 7]
+    assert specs[0][1] == FilterSpec(max_price=50_000)
+    assert specs[-1][1] == FilterSpec(brands=("HP",))
+    for _, error in specs[1:-1]:
+        assert isinstance(error, ValueError)
+    assert "line 3" in str(specs[1][1]) and "brandz" in str(specs[3][1])
+
+
+def test_run_batch_answers_duplicate_specs_once(monkeypatch):
+    catalog = build_catalog(None)
+    calls = []
+    real = query.select_positions
+
+    def counting(index, spec, *args, **kwargs):
+        calls.append(spec)
+        return real(index, spec, *args, **kwargs)
+
+    monkeypatch.setattr(query, "select_positions", counting)
+    lines = [
+        '{"id": 1, "brands": ["HP", "Dell"], "min_ram": 16}',
+        '{"id": 2, "min_ram": 16, "brands": ["Dell", "HP"]}',
+        '{"id": 3, "min_ram": "sixteen"}',
+        '{"id": 4, "brands": ["Dell", "HP"], "min_ram": 16}',
+        '{"id": 5}',
+    ]
+    results = list(run_batch(catalog, read_specs(lines), limit=3))
+    assert [r["id"] for r in results] == [1, 2, 3, 4, 5]
+    assert len(calls) == 2
+    assert results[0] == {**results[1], "id": 1} == {**results[3], "id": 1}
+    assert "error" in results[2] and "count" not in results[2]
+    assert results[4]["count"] == len(catalog)
+    assert results[0]["count"] == int(sidebar_mask(catalog, FilterSpec(brands=("Dell", "HP"), min_ram=16)).sum())
+
+
+def test_cli_exits_nonzero_on_invalid_lines(tmp_path, capsys):
+    specs = tmp_path / "specs.jsonl"
+    specs.write_text('{"id": "ok", "brands": ["HP"]}\nnot json\n', encoding="utf-8")
+    output = tmp_path / "out.jsonl"
+    assert query.main([str(specs), "--output", str(output), "--limit", "0"]) == 1
+    results = [json.loads(line) for line in output.read_text(encoding="utf-8").splitlines()]
+    assert results[0]["id"] == "ok" and results[0]["matches"] == []
+    assert results[1]["id"] == 2 and "error" in results[1]
+    assert "1 invalid FilterSpec line" in capsys.readouterr().err
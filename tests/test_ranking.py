@@ -0,0 +1,50 @@
+"""top_k must return exactly what a full stable sort would."""
+import numpy as np
+import pytest
+
+from catalog import build_catalog
+from ranking import (
+    PICK_SCORE_COL, VALUE_OBJECTIVE, WEIGHTED_OBJECTIVE, column_bounds, objective_scores, top_k, top_picks,
+)
+
+
+def full_sort(scores, k):
+    """Best first, ties to the lower index."""
+    return np.argsort(-np.asarray(scores), kind="stable")[:max(k, 0)]
+
+
+@pytest.mark.parametrize("n", [0, 1, 2, 10, 1_000])
+@pytest.mark.parametrize("k", [-1, 0, 1, 3, 10, 999, 1_000, 5_000])
+def test_matches_full_sort(n, k):
+    rng = np.random.default_rng(n * 10_000 + k + 1)
+    # Few distinct values, so the k-th score is usually tied with rows outside the top k
+    for scores in [rng.integers(0, 5, n).astype(float), rng.random(n)]:
+        np.testing.assert_array_equal(top_k(scores, k), full_sort(scores, k))
+
+
+def test_ties_at_the_boundary_go_to_the_lower_index():
+    scores = np.array([1.0, 3.0, 2.0, 3.0, 2.0, 2.0, 0.0])
+    assert top_k(scores, 3).tolist() == [1, 3, 2]
+    assert top_k(scores, 4).tolist() == [1, 3, 2, 4]
+
+
+def test_unrated_rows_rank_last():
+    scores = np.array([-np.inf, 2.0, -np.inf, 1.0])
+    assert top_k(scores, 3).tolist() == [1, 3, 0]
+
+
+def test_empty_input():
+    assert top_k([], 5).dtype == np.int64
+    assert len(top_k(np.array([]), 5)) == 0
+
+
+@pytest.mark.parametrize("objective", [VALUE_OBJECTIVE, WEIGHTED_OBJECTIVE])
+def test_top_picks_follow_the_objective(objective):
+    catalog = build_catalog(None)
+    picks = top_picks(catalog, 10, objective, bounds=column_bounds(catalog))
+    scores = objective_scores(catalog, objective, bounds=column_bounds(catalog))
+    assert picks.index.tolist() == catalog.index[full_sort(scores, 10)].tolist()
+    assert picks[PICK_SCORE_COL].is_monotonic_decreasing
+    if objective == VALUE_OBJECTIVE:
+        value = catalog["Price (Rs)"] / catalog["Spec Score"]
+        assert picks.index[0] == value.idxmin()
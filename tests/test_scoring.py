@@ -0,0 +1,76 @@
+"""Custom spec scores, and the whole-point rounding the frontier compares them at."""
+import argparse
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from catalog import build_catalog
+from neighbors import feature_matrix
+from scoring import CUSTOM_SCORE_COL, DEFAULT_SCORE_WEIGHTS, SpecScorer, parse_weight
+from skyline import SKYLINE_DIMENSIONS, skyline
+
+
+@pytest.fixture(scope="module")
+def catalog():
+    return build_catalog(None)
+
+
+@pytest.fixture(scope="module")
+def scorer(catalog):
+    return SpecScorer(catalog)
+
+
+def test_scores_are_the_weighted_mean_of_scaled_features(catalog, scorer):
+    weights = {"CPU Tier": 2.0, "GPU VRAM (GB)": 1.5, "Storage (GB)": 0.5}
+    features = feature_matrix(catalog, list(DEFAULT_SCORE_WEIGHTS))
+    vector = np.array([weights.get(column, 0.0) for column in DEFAULT_SCORE_WEIGHTS])
+    expected = features @ vector * 100 / vector.sum()
+    scores = scorer.scores(weights)
+    np.testing.assert_allclose(scores, expected, rtol=1e-5, atol=1e-4)
+    assert scores.min() >= 0 and scores.max() <= 100 + 1e-3
+    positions = np.array([5, 0, 5, len(catalog) - 1])
+    np.testing.assert_array_equal(scorer.scores(weights, positions), scores[positions])
+
+
+def test_weight_vector():
+    scorer = SpecScorer(pd.DataFrame({column: [0.0, 1.0] for column in DEFAULT_SCORE_WEIGHTS}))
+    assert scorer.weight_vector({"RAM (GB)": 3.0}).sum() == pytest.approx(100)
+    assert not scorer.weight_vector({"RAM (GB)": 0.0}).any()
+    with pytest.raises(ValueError, match="Unknown score columns"):
+        scorer.weight_vector({"Weight (kg)": 1.0})
+    with pytest.raises(ValueError, match="negative"):
+        scorer.weight_vector({"RAM (GB)": -1.0})
+
+
+def test_parse_weight():
+    assert parse_weight("GPU VRAM (GB)=1.5") == ("GPU VRAM (GB)", 1.5)
+    for text in ["CPU Tier", "CPU Tier=high"]:
+        with pytest.raises(argparse.ArgumentTypeError):
+            parse_weight(text)
+
+
+def test_frontier_compares_custom_scores_in_whole_points():
+    frame = pd.DataFrame({"Price (Rs)": [50_000, 50_000, 60_000, 40_000], CUSTOM_SCORE_COL: [80.2, 79.9, 81.4, 70.0]})
+    directions = {**SKYLINE_DIMENSIONS, CUSTOM_SCORE_COL: True}
+    columns = ["Price (Rs)", CUSTOM_SCORE_COL]
+    # Exact scores: 79.9 loses to 80.2 at the same price. In whole points they tie and both stay
+    assert skyline(frame, columns, directions).tolist() == [0, 2, 3]
+    assert skyline(frame, columns, directions, resolution={CUSTOM_SCORE_COL: 1}).tolist() == [0, 1, 2, 3]
+
+
+def test_catalog_frontier_over_rounded_custom_scores(catalog, scorer):
+    frame = pd.DataFrame({
+        "Price (Rs)": catalog["Price (Rs)"].to_numpy(),
+        CUSTOM_SCORE_COL: scorer.scores({"CPU Tier": 2.0, "RAM (GB)": 1.0}),
+    })
+    directions = {**SKYLINE_DIMENSIONS, CUSTOM_SCORE_COL: True}
+    positions = skyline(frame, list(frame.columns), directions, resolution={CUSTOM_SCORE_COL: 1})
+    price = frame["Price (Rs)"].to_numpy(dtype=np.float64)
+    score = np.round(frame[CUSTOM_SCORE_COL].to_numpy(dtype=np.float64))
+    # Brute force: no row at most as expensive with at least the score, and better on one
+    dominated = (
+        (price[None, :] <= price[:, None]) & (score[None, :] >= score[:, None])
+        & ((price[None, :] < price[:, None]) | (score[None, :] > score[:, None]))
+    ).any(axis=1)
+    np.testing.assert_array_equal(positions, np.flatnonzero(~dominated))
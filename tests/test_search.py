@@ -0,0 +1,102 @@
+"""Text search: exact, prefix and typo-tolerant matches, and their ranking."""
+import numpy as np
+import pandas as pd
+import pytest
+
+from catalog import build_catalog
+from search import FUZZY_WEIGHT, PREFIX_SCORE, TextIndex, restrict, word_parts
+
+
+def frame(names, cpus=None, gpus=None):
+    return pd.DataFrame(
+        {"CPU Full Model": cpus or ["Intel Core i5 1235U"] * len(names), "GPU Type": gpus or [""] * len(names)},
+        index=pd.Index(names, name="Name"),
+    )
+
+
+@pytest.fixture(scope="module")
+def catalog():
+    return build_catalog(None)
+
+
+@pytest.fixture(scope="module")
+def index(catalog):
+    return TextIndex(catalog)
+
+
+def names(catalog, index, query):
+    positions, _ = index.search(query)
+    return set(catalog.index[positions])
+
+
+def test_exact_prefix_and_fuzzy_scores():
+    index = TextIndex(frame(["Nitro V 16", "Nitrogen X", "Vivobook Pro"], gpus=["NVIDIA RTX 4050", "", "NVIDIA"]))
+    positions, scores = index.search("nitro")
+    assert dict(zip(positions.tolist(), scores.tolist())) == {0: 1.0, 1: pytest.approx(PREFIX_SCORE)}
+    positions, scores = index.search("nvidai")
+    assert positions.tolist() == [0, 2]
+    assert (scores < FUZZY_WEIGHT).all() and (scores > 0).all()
+
+
+def test_typos_are_tolerated(catalog, index):
+    for typo, word in [("nvidai", "nvidia"), ("vivobok", "vivobook"), ("ideapda", "ideapad"), ("geforse", "geforce")]:
+        text = catalog.index.str.cat([catalog["CPU Full Model"].astype(str), catalog["GPU Type"].astype(str)], sep=" ")
+        has_word = set(catalog.index[text.str.lower().str.contains(word)])
+        assert has_word and has_word <= names(catalog, index, typo), typo
+
+
+def test_words_with_digits_do_not_match_fuzzily(catalog, index):
+    rtx_4060 = names(catalog, index, "rtx 4060")
+    assert rtx_4060 and rtx_4060.isdisjoint(names(catalog, index, "rtx 4050"))
+    assert catalog.loc[list(rtx_4060), "GPU Type"].astype(str).str.contains("4060").all()
+    # A short word is only ever an exact or prefix match
+    assert not names(catalog, index, "hpx")
+
+
+def test_letters_and_digits_split(catalog, index):
+    assert word_parts("rtx4060ti") == ["rtx", "4060", "ti"]
+    assert names(catalog, index, "RTX4060") == names(catalog, index, "RTX 4060")
+    assert names(catalog, index, "ryzen7") == names(catalog, index, "ryzen 7")
+    # A word the catalog has as a whole is not split
+    assert names(catalog, index, "i7") == names(catalog, index, "core i7")
+    # The index splits catalog words too
+    small = TextIndex(frame(["ROG Strix RTX4060 Edition", "TUF RTX 4050"]))
+    assert small.search("rtx 4060")[0].tolist() == [0]
+    assert small.search("rtx4050")[0].tolist() == [1]
+
+
+def test_every_query_word_must_match(catalog, index):
+    both = names(catalog, index, "victus rtx")
+    assert both == names(catalog, index, "victus") & names(catalog, index, "rtx")
+    assert not names(catalog, index, "victus macbook")
+
+
+def test_ranking_prefers_exact_and_more_words():
+    index = TextIndex(frame(
+        ["Zenbook 14 OLED", "Zenbook Pro 14", "Zenbooks 14", "Zenbok 14"],
+        gpus=["Intel Iris Xe", "NVIDIA RTX 4060", "Intel Iris Xe", "Intel Iris Xe"],
+    ))
+    positions, scores = index.search("zenbook 14")
+    ranked = positions[np.argsort(-scores, kind="stable")].tolist()
+    # Exact before prefix ("zenbooks"); the misspelt "zenbok" does not contain the query word
+    assert ranked[:2] == [0, 1] and ranked[2] == 2
+    positions, scores = index.search("zenbook rtx 4060")
+    assert positions.tolist() == [1]
+    assert scores[0] == pytest.approx(3.0)
+
+
+def test_positions_restrict_the_search(catalog, index):
+    everything, scores = index.search("intel")
+    subset = everything[::3]
+    positions, subset_scores = index.search("intel", subset)
+    np.testing.assert_array_equal(positions, subset)
+    np.testing.assert_array_equal(subset_scores, scores[::3])
+    found, found_scores = restrict(np.arange(len(catalog)), everything, scores)
+    np.testing.assert_array_equal(found, everything)
+    np.testing.assert_array_equal(found_scores, scores)
+
+
+def test_empty_query_matches_everything(catalog, index):
+    positions, scores = index.search("  ")
+    assert len(positions) == len(catalog) and not scores.any()
+    assert not len(index.search("zzzzqqq")[0])
@@ -0,0 +1,118 @@
+"""Request parsing, paging and the response cache of the query service."""
+import asyncio
+import json
+
+import pytest
+
+from catalog import build_catalog
+from query import FilterSpec, select_positions
+from service import MAX_BODY_BYTES, MAX_LIMIT, HTTPError, QueryService
+from table import DEFAULT_SORT
+
+
+@pytest.fixture(scope="module")
+def service():
+    return QueryService(build_catalog(None))
+
+
+def ask(service, **request):
+    return json.loads(service.answer(*service.parse_request(json.dumps(request).encode())))
+
+
+def test_parse_request_defaults(service):
+    spec, limit, offset, sort, fmt = service.parse_request(b"")
+    assert (spec, limit, offset, sort, fmt) == (FilterSpec(), 50, 0, DEFAULT_SORT, "json")
+
+
+@pytest.mark.parametrize("body", [
+    b"not json", b"[1, 2]",
+    {"limit": True}, {"limit": -1}, {"limit": MAX_LIMIT + 1}, {"limit": 2.5}, {"limit": "10"},
+    {"offset": False}, {"offset": -5}, {"offset": "0"},
+    {"sort": "cheapest"}, {"format": "xml"},
+    {"min_ram": "16"}, {"brands": "HP"}, {"min_price": True}, {"no_such_field": 1},
+])
+def test_parse_request_rejects(service, body):
+    if isinstance(body, dict):
+        body = json.dumps(body).encode()
+    with pytest.raises(HTTPError) as info:
+        service.parse_request(body)
+    assert info.value.status == 400
+
+
+def test_paging_walks_the_sorted_matches(service):
+    spec = {"brands": ["HP", "Lenovo", "ASUS"], "sort": "Price (low → high)"}
+    count = len(select_positions(service.state.index, FilterSpec.from_dict({"brands": spec["brands"]})))
+    everything = ask(service, **spec, limit=count)
+    assert everything["count"] == count == len(everything["matches"])
+    prices = [m["Price (Rs)"] for m in everything["matches"]]
+    assert prices == sorted(prices)
+
+    pages = [ask(service, **spec, limit=7, offset=offset) for offset in range(0, count, 7)]
+    assert all(page["count"] == count for page in pages)
+    assert [m for page in pages for m in page["matches"]] == everything["matches"]
+    assert ask(service, **spec, limit=7, offset=count)["matches"] == []
+
+
+def test_equivalent_requests_share_a_cache_entry(service):
+    hits, misses = service.hits, service.misses
+    first = service.answer(*service.parse_request(b'{"brands": ["HP", "Dell"], "min_ram": 16}'))
+    second = service.answer(*service.parse_request(b'{"min_ram": 16, "brands": ["Dell", "HP", "HP"]}'))
+    assert first is second
+    assert (service.hits - hits, service.misses - misses) == (1, 1)
+
+
+def test_arrow_format(service):
+    pa = pytest.importorskip("pyarrow")
+    body = service.answer(*service.parse_request(b'{"format": "arrow", "limit": 5}'))
+    table = pa.ipc.open_file(pa.py_buffer(body)).read_all()
+    names = [m["Name"] for m in ask(service, limit=5)["matches"]]
+    assert table.column("Name").to_pylist() == names
+
+
+def test_updates_publish_a_new_version():
+    service = QueryService(build_catalog(None))
+    before = ask(service, limit=0)["count"]
+    service.apply_updates([], ["IdeaPad Slim 3"])
+    assert service.state.snapshot.version == 1
+    assert ask(service, limit=0)["count"] == before - 1
+
+
+class Writer:
+    def __init__(self):
+        self.data = b""
+
+    def write(self, data):
+        self.data += data
+
+    async def drain(self):
+        pass
+
+    def close(self):
+        pass
+
+
+def exchange(service, raw):
+    async def run():
+        reader = asyncio.StreamReader()
+        reader.feed_data(raw)
+        reader.feed_eof()
+        writer = Writer()
+        await service.serve_connection(reader, writer)
+        return writer.data
+
+    return asyncio.run(run())
+
+
+@pytest.mark.parametrize("length, status", [("-1", b"400"), ("abc", b"400"), (str(MAX_BODY_BYTES + 1), b"413")])
+def test_bad_content_length(service, length, status):
+    response = exchange(service, f"POST /query HTTP/1.1\r\nContent-Length: {length}\r\n\r\n".encode())
+    assert response.split(b" ", 2)[1] == status
+
+
+def test_query_over_http(service):
+    body = b'{"limit": 3}'
+    response = exchange(service, b"POST /query HTTP/1.1\r\nConnection: close\r\nContent-Length: %d\r\n\r\n%s" % (
+        len(body), body))
+    head, _, payload = response.partition(b"\r\n\r\n")
+    assert head.startswith(b"HTTP/1.1 200 OK")
+    assert len(json.loads(payload)["matches"]) == 3
@@ -0,0 +1,102 @@
+"""Shared-memory catalogs: build once per host, prune old files, freeze snapshots, and session views."""
+import gc
+import multiprocessing
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from catalog import build_catalog
+from shared_catalog import CatalogView, SharedCatalogs
+
+
+@pytest.fixture(scope="module")
+def catalog():
+    return build_catalog(None)
+
+
+@pytest.fixture
+def shared_dir(tmp_path):
+    pytest.importorskip("pyarrow")
+    return tmp_path
+
+
+def files(directory, prefix):
+    return sorted(name for name in os.listdir(directory) if name.startswith(prefix))
+
+
+def test_built_once_and_mapped_by_every_process(shared_dir, catalog):
+    builds = []
+
+    def build():
+        builds.append(1)
+        return catalog
+
+    first = SharedCatalogs(str(shared_dir)).get_or_build(("sample", 1), build)
+    shared = SharedCatalogs(str(shared_dir))
+    second = shared.get_or_build(("sample", 1), build)
+    assert len(builds) == 1 and len(files(shared_dir, "catalog-")) == 1
+    pd.testing.assert_frame_equal(second, first)
+    pd.testing.assert_frame_equal(second, catalog, check_categorical=False)
+    assert shared.is_shared(second) and not shared.is_shared(catalog)
+    # Numeric columns are read-only views of the mapping
+    prices = second["Price (Rs)"].to_numpy()
+    assert not prices.flags.writeable
+    with pytest.raises(ValueError):
+        prices[0] = 1
+
+
+def test_old_base_files_are_pruned(shared_dir, catalog):
+    shared = SharedCatalogs(str(shared_dir), max_base_files=2)
+    small = catalog.iloc[:5]
+    for version in range(4):
+        before = set(files(shared_dir, "catalog-"))
+        shared.get_or_build(("sample", version), lambda: small)
+        # Oldest first, whatever the filesystem's timestamp resolution
+        for name in set(files(shared_dir, "catalog-")) - before:
+            os.utime(os.path.join(shared_dir, name), (version, version))
+    assert len(files(shared_dir, "catalog-")) == 2
+    # The newest two versions are still there, so they are not built again
+    for version in [2, 3]:
+        shared.get_or_build(("sample", version), pytest.fail)
+
+
+def test_freeze_maps_a_private_snapshot_and_removes_it(shared_dir, catalog):
+    shared = SharedCatalogs(str(shared_dir))
+    frozen = shared.freeze(catalog)
+    pd.testing.assert_frame_equal(frozen, catalog, check_categorical=False)
+    assert files(shared_dir, "snapshot-") == [f"snapshot-{os.getpid()}-1.arrow"]
+    # A frame that is already shared is not written again
+    assert shared.freeze(frozen) is frozen
+    assert len(files(shared_dir, "snapshot-")) == 1
+    del frozen
+    gc.collect()
+    assert files(shared_dir, "snapshot-") == []
+
+
+def test_snapshots_of_exited_processes_are_pruned(shared_dir):
+    process = multiprocessing.get_context("spawn").Process(target=int)
+    process.start()
+    process.join()
+    for pid in [process.pid, os.getpid()]:
+        (shared_dir / f"snapshot-{pid}-1.arrow").write_bytes(b"")
+    (shared_dir / "snapshot-notapid-1.arrow").write_bytes(b"")
+    SharedCatalogs(str(shared_dir))
+    assert files(shared_dir, "snapshot-") == [f"snapshot-{os.getpid()}-1.arrow", "snapshot-notapid-1.arrow"]
+
+
+def test_catalog_view(catalog):
+    view = CatalogView(catalog, [4, 0, 7, 2])
+    assert len(view) == 4 and not view.empty
+    assert view.index.tolist() == catalog.index[[4, 0, 7, 2]].tolist()
+    np.testing.assert_array_equal(view["Price (Rs)"], catalog["Price (Rs)"].to_numpy()[[4, 0, 7, 2]])
+    scored = view.assign(Extra=np.array([1.0, 2.0, 3.0, 4.0]))
+    assert list(scored.columns) == list(catalog.columns) + ["Extra"]
+    narrowed = scored.take(np.array([True, False, True, False]))
+    assert narrowed["Extra"].tolist() == [1.0, 3.0]
+    frame = narrowed.to_frame(["Price (Rs)", "Extra"])
+    assert list(frame.columns) == ["Price (Rs)", "Extra"]
+    assert frame.index.tolist() == catalog.index[[4, 7]].tolist()
+    pd.testing.assert_frame_equal(scored.iloc[[1]], catalog.iloc[[0]].assign(Extra=[2.0]))
+    assert CatalogView(catalog, []).empty
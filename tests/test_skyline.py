@@ -0,0 +1,73 @@
+"""The skyline must equal a brute-force dominance check on every code path."""
+import numpy as np
+import pandas as pd
+import pytest
+
+import skyline
+from catalog import build_catalog
+from skyline import SKYLINE_DIMENSIONS, oriented_points, skyline_mask
+
+
+def brute_force(points):
+    """Rows that no other row is <= on every dimension and < on one."""
+    at_most = (points[None, :, :] <= points[:, None, :]).all(axis=2)
+    below = (points[None, :, :] < points[:, None, :]).any(axis=2)
+    return ~(at_most & below).any(axis=1)
+
+
+def random_points(rng, n, d, values):
+    """Integer-valued points, so ties and exact duplicate rows are common."""
+    points = rng.integers(0, values, (n, d)).astype(float)
+    return np.vstack([points, points[: n // 10]])
+
+
+@pytest.mark.parametrize("d", [1, 2, 3, 5])
+@pytest.mark.parametrize("values", [2, 6, 1_000])
+def test_matches_brute_force(d, values):
+    rng = np.random.default_rng(d * values)
+    for n in [0, 1, 2, 50, 700]:
+        points = random_points(rng, n, d, values)
+        np.testing.assert_array_equal(skyline_mask(points), brute_force(points), err_msg=f"n={n}")
+
+
+@pytest.mark.parametrize("d", [2, 4])
+def test_without_grouping_reduction(monkeypatch, d):
+    monkeypatch.setattr(skyline, "MAX_REDUCTION_GROUPS", 0)
+    rng = np.random.default_rng(d)
+    points = random_points(rng, 600, d, 8)
+    np.testing.assert_array_equal(skyline_mask(points), brute_force(points))
+
+
+def test_sfs_across_many_blocks(monkeypatch):
+    monkeypatch.setattr(skyline, "SFS_BLOCK", 7)
+    rng = np.random.default_rng(3)
+    # Anti-correlated dimensions give a large skyline that spans many blocks
+    x = rng.random(400)
+    points = np.column_stack([x, 1 - x + rng.normal(0, 0.05, 400), rng.integers(0, 3, 400)]).round(2)
+    points = np.vstack([points, points[:40]])
+    expected = brute_force(points)
+    assert expected.sum() > 3 * 7
+    np.testing.assert_array_equal(skyline_mask(points), expected)
+
+
+def test_duplicates_are_all_kept():
+    points = np.array([[1.0, 5.0], [1.0, 5.0], [2.0, 2.0], [3.0, 3.0], [2.0, 2.0]])
+    assert skyline_mask(points).tolist() == [True, True, True, False, True]
+
+
+def test_catalog_frontier():
+    catalog = build_catalog(None)
+    dimensions = list(SKYLINE_DIMENSIONS)
+    points = oriented_points(catalog, dimensions)
+    positions = skyline.skyline(catalog, dimensions)
+    np.testing.assert_array_equal(positions, np.flatnonzero(brute_force(points)))
+    # Larger-is-better columns are negated so lower is always better
+    assert (points[:, 1] == -catalog["Spec Score"].to_numpy()).all()
+
+
+def test_resolution_merges_close_values():
+    frame = pd.DataFrame({"Price (Rs)": [50_000, 50_000, 60_000], "Score": [80.2, 79.9, 80.4]})
+    directions = {"Price (Rs)": False, "Score": True}
+    # 80.2 beats 79.9 at the same price; rounded to whole points they tie
+    assert skyline.skyline(frame, list(directions), directions).tolist() == [0, 2]
+    assert skyline.skyline(frame, list(directions), directions, resolution={"Score": 1}).tolist() == [0, 1]
@@ -0,0 +1,92 @@
+"""Update logs apply in order and partial upserts of one Name combine."""
+import json
+
+import pytest
+
+from catalog import build_catalog
+from snapshots import SnapshotStore
+
+NAME = "IdeaPad Slim 3"
+
+
+@pytest.fixture
+def store():
+    return SnapshotStore(build_catalog(None))
+
+
+def full_record(row, name, **changes):
+    """An upsert record with every field, copied from a catalog row."""
+    return {
+        "name": name, "brand": row["Brand"], "os": row["OS"], "utility": row["Utility"],
+        "cpu_full": row["CPU Full Model"], "ram_gb": int(row["RAM (GB)"]), "storage_gb": int(row["Storage (GB)"]),
+        "screen_size_in": float(row["Screen (in)"]), "spec_score": int(row["Spec Score"]),
+        "price_inr": int(row["Price (Rs)"]), "gpu_type": row["GPU Type"], "gpu_vram_gb": int(row["GPU VRAM (GB)"]),
+        **changes,
+    }
+
+
+def write_log(path, *operations, mode="w"):
+    with path.open(mode) as fh:
+        fh.write("".join(json.dumps(op) + "\n" for op in operations))
+    return path
+
+
+def test_upsert_then_delete_removes_the_row(store, tmp_path):
+    rows = len(store.current.catalog)
+    new = full_record(store.current.catalog.loc["Vivobook 14"], "Brand New 14")
+    log = write_log(
+        tmp_path / "updates.jsonl",
+        {"upsert": {"name": NAME, "price_inr": 1}}, {"delete": NAME},
+        {"upsert": new}, {"delete": "Brand New 14"},
+    )
+    catalog = store.apply_log(log).catalog
+    assert NAME not in catalog.index
+    assert "Brand New 14" not in catalog.index
+    assert len(catalog) == rows - 1
+    assert store.rejected_count == 0
+
+
+def test_delete_then_upsert_keeps_the_row(store, tmp_path):
+    rows = len(store.current.catalog)
+    old = store.current.catalog.loc[NAME]
+    log = write_log(tmp_path / "updates.jsonl", {"delete": NAME}, {"upsert": full_record(old, NAME, price_inr=2)})
+    catalog = store.apply_log(log).catalog
+    assert catalog.loc[NAME, "Price (Rs)"] == 2
+    assert len(catalog) == rows
+
+    # Once deleted, a partial upsert has no row left to fill from
+    write_log(log, {"delete": NAME}, {"upsert": {"name": NAME, "price_inr": 3}}, mode="a")
+    catalog = store.apply_log(log).catalog
+    assert NAME not in catalog.index
+    assert store.rejected_count == 1
+
+
+def test_partial_upserts_of_one_name_merge_in_order(store):
+    catalog = store.update(upserts=[
+        {"name": NAME, "price_inr": 1},
+        {"name": NAME, "spec_score": 99},
+        {"name": NAME, "ram_gb": 32, "price_inr": 2},
+    ]).catalog
+    row = catalog.loc[NAME]
+    assert (row["Price (Rs)"], row["Spec Score"], row["RAM (GB)"]) == (2, 99, 32)
+    assert (catalog.index == NAME).sum() == 1
+
+
+def test_partial_upserts_merge_in_log_order(store, tmp_path):
+    log = write_log(
+        tmp_path / "updates.jsonl",
+        {"upsert": {"name": NAME, "price_inr": 1}}, {"upsert": {"name": NAME, "spec_score": 99}},
+    )
+    row = store.apply_log(log).catalog.loc[NAME]
+    assert (row["Price (Rs)"], row["Spec Score"]) == (1, 99)
+
+
+def test_bad_upsert_is_rejected_and_the_rest_applies(store, tmp_path):
+    log = write_log(
+        tmp_path / "updates.jsonl",
+        {"upsert": {"name": NAME, "price_inr": "not a price"}}, {"upsert": {"name": "Vivobook 14", "price_inr": 5}},
+    )
+    catalog = store.apply_log(log).catalog
+    assert catalog.loc["Vivobook 14", "Price (Rs)"] == 5
+    assert catalog.loc[NAME, "Price (Rs)"] == 65990
+    assert store.rejected_count == 1
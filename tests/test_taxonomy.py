@@ -0,0 +1,75 @@
+"""The documented example strings of the CPU / GPU pattern tables."""
+import pandas as pd
+import pytest
+
+from taxonomy import parse_cpu, parse_gpu
+
+CPU_CASES = [
+    # string, (vendor, family, tier, generation, suffix, Intel CPU Model, AMD CPU Model)
+    ("Intel Core Ultra 5 125U", ("Intel", "Core Ultra", 5, "Series 1", "U", "Ultra 5", "N/A")),
+    ("Intel Core Ultra 7 Series 1 155H", ("Intel", "Core Ultra", 7, "Series 1", "H", "Ultra 7", "N/A")),
+    ("Intel Core Ultra 5 226V", ("Intel", "Core Ultra", 5, "Series 2", "V", "Ultra 5", "N/A")),
+    ("Intel Core i3 N305", ("Intel", "Core i", 3, "N-series", "N", "i3", "N/A")),
+    ("Intel Core i7 13620H", ("Intel", "Core i", 7, "13th Gen", "H", "i7", "N/A")),
+    ("Intel Core i7 1255U", ("Intel", "Core i", 7, "12th Gen", "U", "i7", "N/A")),
+    ("Intel Core i5 14450HX", ("Intel", "Core i", 5, "14th Gen", "HX", "i5", "N/A")),
+    ("Intel Core i7 8550U", ("Intel", "Core i", 7, "8th Gen", "U", "i7", "N/A")),
+    # G-suffix parts carry a digit in the suffix
+    ("Intel Core i5 1135G7", ("Intel", "Core i", 5, "11th Gen", "G7", "i5", "N/A")),
+    ("Core i7-1165G7", ("Intel", "Core i", 7, "11th Gen", "G7", "i7", "N/A")),
+    ("Intel Core i3 1005G1", ("Intel", "Core i", 3, "10th Gen", "G1", "i3", "N/A")),
+    ("Intel Core 5 210H", ("Intel", "Core", 5, "Series 2", "H", "Other", "N/A")),
+    ("Intel Core 7 150U", ("Intel", "Core", 7, "Series 1", "U", "Other", "N/A")),
+    ("Intel Celeron N4500", ("Intel", "Celeron", 1, "Other", "None", "Other", "N/A")),
+    ("AMD Ryzen AI 9 HX 370", ("AMD", "Ryzen AI", 9, "Ryzen AI 300", "HX", "N/A", "Ryzen 9")),
+    ("AMD Ryzen AI 7 350", ("AMD", "Ryzen AI", 7, "Ryzen AI 300", "None", "N/A", "Ryzen 7")),
+    ("AMD Ryzen 7 7435HS", ("AMD", "Ryzen", 7, "Ryzen 7000", "HS", "N/A", "Ryzen 7")),
+    ("AMD Ryzen 5 5600H", ("AMD", "Ryzen", 5, "Ryzen 5000", "H", "N/A", "Ryzen 5")),
+    ("AMD Ryzen 7 4800H", ("AMD", "Ryzen", 7, "Ryzen 4000", "H", "N/A", "Ryzen 7")),
+    ("Apple M2", ("Apple", "Apple M", 5, "M2", "None", "N/A", "N/A")),
+    ("Apple M3 Pro", ("Apple", "Apple M Pro", 7, "M3", "None", "N/A", "N/A")),
+    ("Apple M4 Max", ("Apple", "Apple M Max", 9, "M4", "None", "N/A", "N/A")),
+    ("Snapdragon X Elite", ("Qualcomm", "Snapdragon X Elite", 7, "X", "None", "N/A", "N/A")),
+    ("Snapdragon X Plus", ("Qualcomm", "Snapdragon X Plus", 5, "X", "None", "N/A", "N/A")),
+    ("Huawei Kirin X90", ("Huawei", "Kirin", 0, "Other", "None", "N/A", "N/A")),
+]
+
+GPU_CASES = [
+    # string, (vendor, series, model)
+    ("NVIDIA GeForce RTX 4060", ("NVIDIA", "RTX 40xx", "RTX 4060")),
+    ("GTX 1660 Ti", ("NVIDIA", "GTX 16xx", "GTX 1660 Ti")),
+    ("RTX 3050 A", ("NVIDIA", "RTX 30xx", "RTX 3050 A")),
+    ("RTX 3050A", ("NVIDIA", "RTX 30xx", "RTX 3050 A")),
+    ("MX 550", ("NVIDIA", "MX 5xx", "MX 550")),
+    ("NVIDIA RTX A1000", ("NVIDIA", "RTX Ada/A", "A1000")),
+    ("AMD Radeon RX 6500M", ("AMD", "Radeon RX", "6500M")),
+    ("AMD Radeon 780M", ("AMD", "Radeon", "780M")),
+    ("Intel Iris Xe", ("Intel", "Iris Xe", "None")),
+    ("Intel Iris X", ("Intel", "Iris Xe", "None")),
+    ("Intel UHD Graphics", ("Intel", "UHD", "None")),
+    ("Intel Arc Graphics", ("Intel", "Arc", "None")),
+    ("8 Core GPU", ("Apple", "Apple GPU", "None")),
+    ("10-Core GPU", ("Apple", "Apple GPU", "None")),
+    ("Qualcomm Adreno", ("Qualcomm", "Adreno", "None")),
+]
+
+
+@pytest.mark.parametrize("text, expected", CPU_CASES)
+def test_parse_cpu(text, expected):
+    row = parse_cpu(pd.Series([text])).iloc[0]
+    assert tuple(row) == expected
+
+
+@pytest.mark.parametrize("text, expected", GPU_CASES)
+def test_parse_gpu(text, expected):
+    row = parse_gpu(pd.Series([text])).iloc[0]
+    assert tuple(row) == expected
+
+
+def test_parse_is_per_row():
+    cpus = pd.Series(["Intel Core i5 1135G7", "AMD Ryzen 5 5600H", "Intel Core i5 1135G7", None], index=list("abcd"))
+    parsed = parse_cpu(cpus)
+    assert list(parsed.index) == list("abcd")
+    assert list(parsed["CPU Tier"]) == [5, 5, 5, 0]
+    assert list(parsed["CPU Vendor"][:3]) == ["Intel", "AMD", "Intel"]
+    assert parsed["CPU Vendor"].isna().tolist() == [False, False, False, True]
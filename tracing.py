@@ -0,0 +1,137 @@
+"""Per-stage wall time and memory tracing for app reruns.
+
+    tracer = Tracer(enabled=True)
+    with tracer.stage("value score", rows=len(frame)):
+        ...
+    tracer.to_jsonl()
+
+Memory is measured with tracemalloc (NumPy and Python allocations; Arrow's own
+pool is not visible to it). When a tracer is disabled, `stage` returns a shared
+no-op context manager, so instrumented code costs one attribute check per stage.
+
+tracemalloc is process-wide: it runs while at least one tracer in the process
+is enabled (enabled tracers are reference-counted, and a tracer that is
+garbage-collected while enabled, e.g. with an abandoned session, releases its
+count) and slows every allocation in the process meanwhile. Tracers enabled
+at the same time share its peak, so their peak_kb readings can overlap.
+"""
+import json
+import threading
+import time
+import tracemalloc
+import weakref
+from collections import deque
+from contextlib import nullcontext
+
+MAX_RECORDS = 5_000
+
+_NULL_STAGE = nullcontext()
+
+_tracemalloc_lock = threading.Lock()
+_tracemalloc_users = 0
+_tracemalloc_started = False  # whether tracers started it (then they also stop it)
+
+
+def _acquire_tracemalloc():
+    global _tracemalloc_users, _tracemalloc_started
+    with _tracemalloc_lock:
+        if _tracemalloc_users == 0 and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            _tracemalloc_started = True
+        _tracemalloc_users += 1
+
+
+def _release_tracemalloc():
+    global _tracemalloc_users, _tracemalloc_started
+    with _tracemalloc_lock:
+        _tracemalloc_users -= 1
+        if _tracemalloc_users == 0 and _tracemalloc_started:
+            tracemalloc.stop()
+            _tracemalloc_started = False
+
+
+class _Stage:
+    __slots__ = ("tracer", "record", "start", "base", "peak")
+
+    def __init__(self, tracer, record):
+        self.tracer = tracer
+        self.record = record
+
+    def __enter__(self):
+        stack = self.tracer._stack
+        if stack:
+            # reset_peak below would lose the enclosing stage's peak so far
+            stack[-1].peak = max(stack[-1].peak, tracemalloc.get_traced_memory()[1])
+        stack.append(self)
+        self.base = tracemalloc.get_traced_memory()[0]
+        self.peak = self.base
+        tracemalloc.reset_peak()
+        self.start = time.perf_counter()
+        return self.record
+
+    def __exit__(self, *exc_info):
+        seconds = time.perf_counter() - self.start
+        current, peak = tracemalloc.get_traced_memory()
+        self.peak = max(self.peak, peak)
+        stack = self.tracer._stack
+        stack.pop()
+        if stack:
+            stack[-1].peak = max(stack[-1].peak, self.peak)
+        self.record.update(
+            ms=round(seconds * 1000, 3),
+            allocated_kb=round((current - self.base) / 1024, 1) or 0.0,  # no "-0.0"
+            peak_kb=round((self.peak - self.base) / 1024, 1),
+        )
+        self.tracer.records.append(self.record)
+        return False
+
+
+class Tracer:
+    """Records one dict per traced stage: run number, stage name, ms, allocated and peak KiB.
+
+    `allocated_kb` is the memory still held when the stage ends and `peak_kb`
+    the most it held at once, both relative to the stage start. Extra keyword
+    arguments to `stage` (e.g. rows=..., cached=True) are stored on the record.
+    """
+
+    def __init__(self, enabled=False, max_records=MAX_RECORDS):
+        self.enabled = False
+        self.run = 0
+        self.records = deque(maxlen=max_records)
+        self._stack = []
+        self._release = None
+        self.set_enabled(enabled)
+
+    def set_enabled(self, enabled):
+        """Turns tracing on or off; tracemalloc runs while any tracer in the process is on."""
+        if enabled and not self.enabled:
+            _acquire_tracemalloc()
+            self._release = weakref.finalize(self, _release_tracemalloc)
+        elif not enabled and self.enabled:
+            self._release()  # a finalizer runs at most once
+            self._release = None
+        self.enabled = bool(enabled)
+
+    def start_run(self):
+        """Marks the start of a rerun; records of earlier runs are kept up to max_records."""
+        self.run += 1
+
+    def stage(self, name, **attrs):
+        if not self.enabled:
+            return _NULL_STAGE
+        return _Stage(self, {"run": self.run, "stage": name, **attrs})
+
+    def run_records(self, run=None):
+        """Records of one run (default: the latest), in completion order."""
+        run = self.run if run is None else run
+        return [record for record in self.records if record["run"] == run]
+
+    def clear(self):
+        self.records.clear()
+
+    def to_jsonl(self):
+        return "".join(json.dumps(record, ensure_ascii=False) + "\n" for record in self.records)
+
+
+# Shared disabled tracer for code paths called without one
+NULL_TRACER = Tracer()